@@ -0,0 +1,13 @@
+"""Advanced Python Web Browser.
+
+Start it with `python -m browser` (or the advanced_browser.py launcher).
+
+Subpackages:
+    core    settings, storage, staged startup, downloads and bookmarks data (no Qt)
+    search  the search page and its site directory
+    p2p     networking core, lobby relay and chat (the core and relay need no Qt)
+    themes  theme compiler and registry, stylesheet generation, theme UI
+    ui      the main window, tabs and the download, bookmark and settings windows
+
+Importing the package, or any of its Qt-free modules, never loads Qt.
+"""
@@ -0,0 +1,39 @@
+"""Entry point: python -m browser"""
+import time
+IMPORT_START = time.perf_counter()  # Launch time for the startup report
+import sys
+import traceback
+
+from browser.core.startup import StartupReport
+
+
+def main():
+    try:
+        from PyQt6.QtWidgets import QApplication
+        from browser.ui.window import Browser
+        startup_report = StartupReport(IMPORT_START)
+        startup_report.record('imports', IMPORT_START, time.perf_counter())
+        app = QApplication(sys.argv)
+        browser = Browser(startup_report)
+        sys.exit(app.exec())
+    except Exception as e:
+        error_message = f"Error: {str(e)}\n\n{traceback.format_exc()}"
+        print(error_message)
+        
+        # Try to show error dialog
+        try:
+            from PyQt6.QtWidgets import QMessageBox
+            error_dialog = QMessageBox()
+            error_dialog.setIcon(QMessageBox.Icon.Critical)
+            error_dialog.setWindowTitle("Browser Error")
+            error_dialog.setText("An error occurred while starting the browser:")
+            error_dialog.setDetailedText(error_message)
+            error_dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
+            error_dialog.exec()
+        except:
+            # If we can't show a dialog, at least keep the console open
+            input("Press Enter to exit...")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,2 @@
+"""Qt-free building blocks: settings, data files, startup tasks and the
+download and bookmark stores."""
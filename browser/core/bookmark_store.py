@@ -0,0 +1,306 @@
+"""Bookmarks stored in SQLite, organised in nested folders.
+
+Each add, edit or removal touches only its own rows, so bookmarking stays
+cheap however many bookmarks exist. Folders form a tree through parent_id;
+a folder_id of None means the top level. JSON import/export keeps
+bookmarks portable, and also reads the old flat {title: url} files.
+"""
+import json
+import os
+import sqlite3
+import time
+
+from browser.core.storage import BACKUP_COUNT, atomic_write, backup_database, data_path
+
+BOOKMARKS_DB = 'bookmarks.db'
+LEGACY_BOOKMARKS_FILE = 'bookmarks.json'
+
+BOOKMARK_COLUMNS = ('id', 'url', 'title', 'folder_id', 'tags', 'position', 'created', 'last_used')
+FOLDER_COLUMNS = ('id', 'parent_id', 'name', 'position')
+
+
+def _tags_text(tags):
+    if isinstance(tags, str):
+        tags = tags.replace(',', ' ').split()
+    return ' '.join(dict.fromkeys(tag.strip().lower() for tag in tags if tag.strip()))
+
+
+class BookmarkStore:
+    def __init__(self, path=None, backups=BACKUP_COUNT):
+        path = path or data_path(BOOKMARKS_DB)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        # WAL commits append to a log instead of rewriting pages, and a crash
+        # mid-write rolls back to the last complete transaction
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.execute('PRAGMA synchronous = NORMAL')
+        with self.conn:
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS folders
+                (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                 parent_id INTEGER REFERENCES folders (id) ON DELETE CASCADE,
+                 name TEXT NOT NULL,
+                 position INTEGER DEFAULT 0);
+                CREATE TABLE IF NOT EXISTS bookmarks
+                (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                 url TEXT NOT NULL,
+                 title TEXT,
+                 folder_id INTEGER REFERENCES folders (id) ON DELETE CASCADE,
+                 tags TEXT DEFAULT '',
+                 position INTEGER DEFAULT 0,
+                 created REAL,
+                 last_used REAL);
+                CREATE INDEX IF NOT EXISTS folders_parent ON folders (parent_id, position);
+                CREATE INDEX IF NOT EXISTS bookmarks_folder ON bookmarks (folder_id, position);
+                CREATE INDEX IF NOT EXISTS bookmarks_url ON bookmarks (url);
+            ''')
+        self.has_fts = self._create_search_index()
+        # One snapshot per start, keeping the last few
+        backup_database(self.conn, path, backups)
+
+    def _create_search_index(self):
+        """Full-text index over titles, URLs and tags, kept in sync by triggers"""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'bookmarks_search'").fetchone()
+        try:
+            with self.conn:
+                self.conn.executescript('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_search USING fts5
+                    (title, url, tags, content='bookmarks', content_rowid='id');
+                    CREATE TRIGGER IF NOT EXISTS bookmarks_search_insert AFTER INSERT ON bookmarks BEGIN
+                        INSERT INTO bookmarks_search (rowid, title, url, tags)
+                        VALUES (new.id, new.title, new.url, new.tags);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS bookmarks_search_delete AFTER DELETE ON bookmarks BEGIN
+                        INSERT INTO bookmarks_search (bookmarks_search, rowid, title, url, tags)
+                        VALUES ('delete', old.id, old.title, old.url, old.tags);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS bookmarks_search_update
+                    AFTER UPDATE OF title, url, tags ON bookmarks BEGIN
+                        INSERT INTO bookmarks_search (bookmarks_search, rowid, title, url, tags)
+                        VALUES ('delete', old.id, old.title, old.url, old.tags);
+                        INSERT INTO bookmarks_search (rowid, title, url, tags)
+                        VALUES (new.id, new.title, new.url, new.tags);
+                    END;
+                ''')
+                if not exists:
+                    # Index bookmarks saved before the search table existed
+                    self.conn.execute("INSERT INTO bookmarks_search (bookmarks_search) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"Bookmark search index unavailable, using LIKE: {e}")
+            return False
+
+    def _next_position(self, table, column, parent):
+        row = self.conn.execute(
+            f'SELECT MAX(position) FROM {table} WHERE {column} IS ?', (parent,)).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    # Bookmarks
+
+    def _insert(self, url, title, folder_id=None, tags=(), created=None, last_used=None):
+        cursor = self.conn.execute('''
+            INSERT INTO bookmarks (url, title, folder_id, tags, position, created, last_used)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (url, title, folder_id, _tags_text(tags),
+              self._next_position('bookmarks', 'folder_id', folder_id),
+              time.time() if created is None else created, last_used))
+        return cursor.lastrowid
+
+    def add(self, url, title, folder_id=None, tags=()):
+        """Insert one bookmark; returns its id"""
+        with self.conn:
+            return self._insert(url, title, folder_id, tags)
+
+    def get(self, bookmark_id):
+        row = self.conn.execute(
+            f'SELECT {", ".join(BOOKMARK_COLUMNS)} FROM bookmarks WHERE id = ?',
+            (bookmark_id,)).fetchone()
+        return dict(zip(BOOKMARK_COLUMNS, row)) if row else None
+
+    def update(self, bookmark_id, **fields):
+        fields = {key: value for key, value in fields.items()
+                  if key in ('url', 'title', 'folder_id', 'tags', 'position')}
+        if 'tags' in fields:
+            fields['tags'] = _tags_text(fields['tags'])
+        if not fields:
+            return
+        assignments = ', '.join(f"{key} = ?" for key in fields)
+        with self.conn:
+            self.conn.execute(f'UPDATE bookmarks SET {assignments} WHERE id = ?',
+                              (*fields.values(), bookmark_id))
+
+    def move(self, bookmark_id, folder_id):
+        """Append a bookmark to another folder"""
+        self.update(bookmark_id, folder_id=folder_id,
+                    position=self._next_position('bookmarks', 'folder_id', folder_id))
+
+    def remove(self, bookmark_id):
+        with self.conn:
+            self.conn.execute('DELETE FROM bookmarks WHERE id = ?', (bookmark_id,))
+
+    def touch(self, bookmark_id):
+        """Note that a bookmark was just opened"""
+        with self.conn:
+            self.conn.execute('UPDATE bookmarks SET last_used = ? WHERE id = ?',
+                              (time.time(), bookmark_id))
+
+    def bookmarks_in(self, folder_id=None):
+        cursor = self.conn.execute(
+            f'SELECT {", ".join(BOOKMARK_COLUMNS)} FROM bookmarks '
+            f'WHERE folder_id IS ? ORDER BY position, id', (folder_id,))
+        return [dict(zip(BOOKMARK_COLUMNS, row)) for row in cursor.fetchall()]
+
+    def find_url(self, url):
+        cursor = self.conn.execute(
+            f'SELECT {", ".join(BOOKMARK_COLUMNS)} FROM bookmarks WHERE url = ?', (url,))
+        return [dict(zip(BOOKMARK_COLUMNS, row)) for row in cursor.fetchall()]
+
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM bookmarks').fetchone()[0]
+
+    def search(self, text, limit=500):
+        """Bookmarks whose title, URL or tags match every word of text, most recently used first"""
+        words = text.split()
+        if not words:
+            return []
+        if self.has_fts:
+            terms = ' '.join('"{}"*'.format(word.replace('"', '""')) for word in words)
+            where = 'id IN (SELECT rowid FROM bookmarks_search WHERE bookmarks_search MATCH ?)'
+            params = (terms,)
+        else:
+            where = ' AND '.join('(title LIKE ? OR url LIKE ? OR tags LIKE ?)' for _ in words)
+            params = tuple(f"%{word}%" for word in words for _ in range(3))
+        cursor = self.conn.execute(
+            f'SELECT {", ".join(BOOKMARK_COLUMNS)} FROM bookmarks WHERE {where} '
+            f'ORDER BY last_used IS NULL, last_used DESC, created DESC LIMIT ?', (*params, limit))
+        return [dict(zip(BOOKMARK_COLUMNS, row)) for row in cursor.fetchall()]
+
+    # Folders
+
+    def _insert_folder(self, name, parent_id=None):
+        cursor = self.conn.execute(
+            'INSERT INTO folders (parent_id, name, position) VALUES (?, ?, ?)',
+            (parent_id, name, self._next_position('folders', 'parent_id', parent_id)))
+        return cursor.lastrowid
+
+    def add_folder(self, name, parent_id=None):
+        with self.conn:
+            return self._insert_folder(name, parent_id)
+
+    def rename_folder(self, folder_id, name):
+        with self.conn:
+            self.conn.execute('UPDATE folders SET name = ? WHERE id = ?', (name, folder_id))
+
+    def move_folder(self, folder_id, parent_id):
+        # Refuse to move a folder inside itself
+        ancestor = parent_id
+        while ancestor is not None:
+            if ancestor == folder_id:
+                raise ValueError("Cannot move a folder into itself")
+            ancestor = self.folder(ancestor)['parent_id']
+        with self.conn:
+            self.conn.execute('UPDATE folders SET parent_id = ?, position = ? WHERE id = ?',
+                              (parent_id, self._next_position('folders', 'parent_id', parent_id),
+                               folder_id))
+
+    def remove_folder(self, folder_id):
+        """Delete a folder with everything inside it"""
+        with self.conn:
+            self.conn.execute('DELETE FROM folders WHERE id = ?', (folder_id,))
+
+    def folder(self, folder_id):
+        row = self.conn.execute(
+            f'SELECT {", ".join(FOLDER_COLUMNS)} FROM folders WHERE id = ?', (folder_id,)).fetchone()
+        return dict(zip(FOLDER_COLUMNS, row)) if row else None
+
+    def folders_in(self, parent_id=None):
+        cursor = self.conn.execute(
+            f'SELECT {", ".join(FOLDER_COLUMNS)} FROM folders '
+            f'WHERE parent_id IS ? ORDER BY position, id', (parent_id,))
+        return [dict(zip(FOLDER_COLUMNS, row)) for row in cursor.fetchall()]
+
+    def has_children(self, folder_id):
+        return bool(self.conn.execute('''
+            SELECT EXISTS (SELECT 1 FROM folders WHERE parent_id = ?)
+                OR EXISTS (SELECT 1 FROM bookmarks WHERE folder_id = ?)
+        ''', (folder_id, folder_id)).fetchone()[0])
+
+    # Import / export
+
+    def _export_folder(self, folder_id):
+        return {
+            'folders': [dict(name=folder['name'], **self._export_folder(folder['id']))
+                        for folder in self.folders_in(folder_id)],
+            'bookmarks': [{key: bookmark[key] for key in ('url', 'title', 'tags', 'created', 'last_used')}
+                          for bookmark in self.bookmarks_in(folder_id)],
+        }
+
+    def export_json(self, path):
+        atomic_write(path, json.dumps(self._export_folder(None), indent=2))
+
+    @staticmethod
+    def _valid_bookmark(entry):
+        tags = entry.get('tags', ())
+        if not isinstance(tags, str):
+            if not isinstance(tags, (list, tuple)) or not all(isinstance(tag, str) for tag in tags):
+                return False
+        for key in ('created', 'last_used'):
+            value = entry.get(key)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                return False
+        return isinstance(entry.get('url') or '', str) and isinstance(entry.get('title') or '', str)
+
+    @classmethod
+    def _check_import(cls, data):
+        """Raise ValueError unless data has the shape _import_folder expects"""
+        bookmarks, folders = (data.get('bookmarks', []), data.get('folders', [])) \
+            if isinstance(data, dict) else (None, None)
+        for entries in (bookmarks, folders):
+            if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+                raise ValueError("Unrecognised bookmarks file")
+        if not all(cls._valid_bookmark(entry) for entry in bookmarks):
+            raise ValueError("Unrecognised bookmarks file")
+        for entry in folders:
+            if not isinstance(entry.get('name', 'Folder'), str):
+                raise ValueError("Unrecognised bookmarks file")
+            cls._check_import(entry)
+
+    def _import_folder(self, data, folder_id):
+        count = 0
+        for entry in data.get('bookmarks', []):
+            if entry.get('url'):
+                self._insert(entry['url'], entry.get('title') or entry['url'], folder_id,
+                             entry.get('tags', ()), entry.get('created'), entry.get('last_used'))
+                count += 1
+        for entry in data.get('folders', []):
+            count += self._import_folder(
+                entry, self._insert_folder(entry.get('name', 'Folder'), folder_id))
+        return count
+
+    def import_json(self, path, folder_id=None):
+        """Add bookmarks from an export, or an old {title: url} file; returns how many"""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and not ({'folders', 'bookmarks'} & data.keys()):
+            data = {'bookmarks': [{'title': title, 'url': url} for title, url in data.items()]}
+        # Checked up front so a bad file leaves nothing half imported
+        self._check_import(data)
+        # One transaction for the whole file
+        with self.conn:
+            return self._import_folder(data, folder_id)
+
+    def migrate_legacy(self, path=LEGACY_BOOKMARKS_FILE):
+        """Import the old bookmarks.json once, then set it aside"""
+        if not os.path.exists(path):
+            return 0
+        try:
+            count = self.import_json(path)
+            os.replace(path, path + '.imported')
+            return count
+        except (OSError, ValueError) as e:
+            print(f"Error importing {path}: {e}")
+            return 0
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,124 @@
+"""Persistent record of every download, stored in SQLite.
+
+Lookups stay indexed: recent-first paging walks an index on the start time,
+checksum lookups use an index on sha256, and text search goes through an
+FTS5 table over file names and URLs (falling back to LIKE when the SQLite
+build has no FTS5).
+"""
+import sqlite3
+import time
+
+from browser.core.storage import data_path
+
+HISTORY_DB = 'downloads.db'
+
+COLUMNS = ('id', 'url', 'path', 'filename', 'size', 'mime', 'started', 'finished',
+           'status', 'sha256')
+
+
+class DownloadHistory:
+    def __init__(self, path=None):
+        self.conn = sqlite3.connect(path or data_path(HISTORY_DB))
+        with self.conn:
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS downloads
+                (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                 url TEXT,
+                 path TEXT,
+                 filename TEXT,
+                 size INTEGER,
+                 mime TEXT,
+                 started REAL,
+                 finished REAL,
+                 status TEXT,
+                 sha256 TEXT);
+                CREATE INDEX IF NOT EXISTS downloads_started ON downloads (started DESC);
+                CREATE INDEX IF NOT EXISTS downloads_sha256 ON downloads (sha256);
+                CREATE INDEX IF NOT EXISTS downloads_url ON downloads (url);
+            ''')
+        self.has_fts = self._create_search_index()
+
+    def _create_search_index(self):
+        """Full-text index kept in sync with the downloads table by triggers"""
+        try:
+            with self.conn:
+                self.conn.executescript('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS downloads_search USING fts5
+                    (filename, url, content='downloads', content_rowid='id');
+                    CREATE TRIGGER IF NOT EXISTS downloads_search_insert AFTER INSERT ON downloads BEGIN
+                        INSERT INTO downloads_search (rowid, filename, url)
+                        VALUES (new.id, new.filename, new.url);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS downloads_search_delete AFTER DELETE ON downloads BEGIN
+                        INSERT INTO downloads_search (downloads_search, rowid, filename, url)
+                        VALUES ('delete', old.id, old.filename, old.url);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS downloads_search_update
+                    AFTER UPDATE OF filename, url ON downloads BEGIN
+                        INSERT INTO downloads_search (downloads_search, rowid, filename, url)
+                        VALUES ('delete', old.id, old.filename, old.url);
+                        INSERT INTO downloads_search (rowid, filename, url)
+                        VALUES (new.id, new.filename, new.url);
+                    END;
+                ''')
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"Download search index unavailable, using LIKE: {e}")
+            return False
+
+    def record_start(self, url, path, filename, mime=None):
+        """Add a download as it starts; returns its row id"""
+        with self.conn:
+            cursor = self.conn.execute('''
+                INSERT INTO downloads (url, path, filename, mime, started, status)
+                VALUES (?, ?, ?, ?, ?, 'Downloading')
+            ''', (url, path, filename, mime, time.time()))
+        return cursor.lastrowid
+
+    def update(self, row_id, **fields):
+        fields = {key: value for key, value in fields.items() if key in COLUMNS[1:]}
+        if not fields:
+            return
+        assignments = ', '.join(f"{key} = ?" for key in fields)
+        with self.conn:
+            self.conn.execute(f'UPDATE downloads SET {assignments} WHERE id = ?',
+                              (*fields.values(), row_id))
+
+    def record_finish(self, row_id, status, **fields):
+        self.update(row_id, status=status, finished=time.time(), **fields)
+
+    def _where(self, text):
+        text = text.strip()
+        if not text:
+            return '', ()
+        if self.has_fts:
+            # Every word must prefix-match a word of the file name or URL
+            terms = ' '.join('"{}"*'.format(word.replace('"', '""')) for word in text.split())
+            return 'WHERE id IN (SELECT rowid FROM downloads_search WHERE downloads_search MATCH ?)', (terms,)
+        pattern = f"%{text}%"
+        return 'WHERE filename LIKE ? OR url LIKE ?', (pattern, pattern)
+
+    def search(self, text='', limit=100, offset=0):
+        """One page of matching downloads as dicts, newest first"""
+        where, params = self._where(text)
+        cursor = self.conn.execute(
+            f'SELECT {", ".join(COLUMNS)} FROM downloads {where} '
+            f'ORDER BY started DESC LIMIT ? OFFSET ?', (*params, limit, offset))
+        return [dict(zip(COLUMNS, row)) for row in cursor.fetchall()]
+
+    def count(self, text=''):
+        where, params = self._where(text)
+        return self.conn.execute(f'SELECT COUNT(*) FROM downloads {where}', params).fetchone()[0]
+
+    def find_by_hash(self, sha256):
+        cursor = self.conn.execute(
+            f'SELECT {", ".join(COLUMNS)} FROM downloads WHERE sha256 = ? ORDER BY started DESC',
+            (sha256.lower(),))
+        return [dict(zip(COLUMNS, row)) for row in cursor.fetchall()]
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute('DELETE FROM downloads')
+
+    def close(self):
+        self.conn.close()
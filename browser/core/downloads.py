@@ -0,0 +1,144 @@
+"""Qt-free download bookkeeping: jobs, transfer statistics and queue persistence."""
+import time
+
+from browser.core.storage import data_path, read_json, write_json
+
+QUEUE_FILE = 'downloads_queue.json'
+
+# Download priorities, higher runs first
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+PRIORITY_NAMES = {PRIORITY_LOW: 'Low', PRIORITY_NORMAL: 'Normal', PRIORITY_HIGH: 'High'}
+
+
+class TransferStats:
+    """Exponentially smoothed throughput and ETA for one transfer"""
+
+    def __init__(self, smoothing=0.3):
+        self.smoothing = smoothing
+        self.received = 0
+        self.total = 0
+        self.speed = 0.0  # Bytes per second
+        self._last_time = None
+        self._last_received = 0
+
+    def update(self, received, total, now=None):
+        now = time.monotonic() if now is None else now
+        if self._last_time is not None and now > self._last_time:
+            sample = (received - self._last_received) / (now - self._last_time)
+            self.speed = self.smoothing * max(sample, 0.0) + (1 - self.smoothing) * self.speed
+        self._last_time = now
+        self._last_received = received
+        self.received = received
+        self.total = total
+
+    def reset_clock(self):
+        """Forget the last sample, e.g. after a pause, so idle time isn't averaged in"""
+        self._last_time = None
+        self.speed = 0.0
+
+    @property
+    def fraction(self):
+        return self.received / self.total if self.total > 0 else None
+
+    @property
+    def eta(self):
+        """Seconds remaining, or None when unknown"""
+        if self.total <= 0 or self.speed <= 0:
+            return None
+        return max(self.total - self.received, 0) / self.speed
+
+
+class DownloadJob:
+    """A download tracked by the scheduler; request is the engine's download object"""
+    QUEUED = 'Queued'
+    RUNNING = 'Downloading'
+    PROCESSING = 'Processing'  # Downloaded, being hashed/extracted/moved
+    PAUSED = 'Paused'
+    COMPLETED = 'Completed'
+    CANCELLED = 'Cancelled'
+    FAILED = 'Failed'
+
+    ACTIVE_STATES = (QUEUED, RUNNING, PAUSED)
+
+    def __init__(self, job_id, request, url, filename, directory, priority=PRIORITY_NORMAL):
+        self.id = job_id
+        self.request = request
+        self.url = url
+        self.filename = filename
+        self.directory = directory
+        self.priority = priority
+        self.state = self.QUEUED
+        self.stats = TransferStats()
+        self.restored = False  # Re-requested from the saved queue
+        self.expected_hash = None  # SHA-256 the finished file must match
+        self.sha256 = None
+        self.verified = None  # True/False once checked against expected_hash
+        self.history_id = None  # Row in the download history
+
+    @property
+    def is_active(self):
+        return self.state in self.ACTIVE_STATES
+
+    def to_record(self):
+        return {
+            'url': self.url,
+            'filename': self.filename,
+            'directory': self.directory,
+            'priority': self.priority,
+            'paused': self.state == self.PAUSED,
+            'expected_hash': self.expected_hash,
+            'history_id': self.history_id,
+        }
+
+
+def aggregate_stats(jobs):
+    """Combined (speed, eta) over running jobs"""
+    running = [job for job in jobs if job.state == DownloadJob.RUNNING]
+    speed = sum(job.stats.speed for job in running)
+    remaining = sum(max(job.stats.total - job.stats.received, 0)
+                    for job in running if job.stats.total > 0)
+    eta = remaining / speed if speed > 0 else None
+    return speed, eta
+
+
+def describe_job(job):
+    """One-line status of a job, rounded so it only changes when the user would notice"""
+    stats = job.stats
+    text = f"{job.state}: {job.filename} [{PRIORITY_NAMES.get(job.priority, job.priority)}]"
+    if stats.fraction is not None:
+        text += f" - {int(stats.fraction * 100)}%"
+    if job.state == DownloadJob.RUNNING:
+        text += f" - {format_size(stats.speed)}/s - ETA {format_eta(stats.eta)}"
+    if job.verified is not None:
+        text += " - checksum OK" if job.verified else " - CHECKSUM MISMATCH"
+    elif job.sha256:
+        text += f" - sha256 {job.sha256[:12]}"
+    return text
+
+
+def format_size(num_bytes):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(num_bytes) < 1024 or unit == 'GB':
+            return f"{num_bytes:.0f} {unit}" if unit == 'B' else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+def load_queue(path=None):
+    """Records of downloads that were still pending when the browser closed"""
+    records = read_json(path or data_path(QUEUE_FILE), [])
+    return records if isinstance(records, list) else []
+
+
+def save_queue(records, path=None):
+    write_json(path or data_path(QUEUE_FILE), records)
@@ -0,0 +1,174 @@
+"""Post-download processing: checksums, verification, extraction and sorting.
+
+Everything here runs on a small worker pool so that hashing or unpacking a
+multi-GB file never blocks the GUI thread. Results are handed to a callback
+on the worker thread; Qt callers forward them through a signal.
+"""
+import hashlib
+import os
+import shutil
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+CHUNK_SIZE = 1024 * 1024  # Bytes read per hashing step
+
+CATEGORY_EXTENSIONS = {
+    'Documents': ('.pdf', '.doc', '.docx', '.odt', '.txt', '.rtf', '.md', '.xls', '.xlsx',
+                  '.ods', '.csv', '.ppt', '.pptx', '.odp', '.epub'),
+    'Images': ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp', '.ico', '.tiff'),
+    'Video': ('.mp4', '.mkv', '.avi', '.mov', '.webm', '.wmv', '.flv'),
+    'Music': ('.mp3', '.flac', '.wav', '.ogg', '.m4a', '.aac', '.opus'),
+    'Archives': ('.zip', '.tar', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar'),
+    'Programs': ('.exe', '.msi', '.deb', '.rpm', '.appimage', '.dmg', '.pkg', '.apk'),
+}
+OTHER_CATEGORY = 'Other'
+
+
+def sha256_file(path, chunk_size=CHUNK_SIZE):
+    """Hex SHA-256 of a file, read in fixed-size chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def expected_hash_from_url(url):
+    """Checksum published in a '#sha256=<hex>' URL fragment, if any"""
+    for part in urlsplit(url).fragment.split('&'):
+        name, _, value = part.partition('=')
+        if name.lower() == 'sha256' and len(value) == 64:
+            return value.lower()
+    return None
+
+
+def category_for(path):
+    name = os.path.basename(path).lower()
+    for category, extensions in CATEGORY_EXTENSIONS.items():
+        if name.endswith(extensions):
+            return category
+    return OTHER_CATEGORY
+
+
+def unique_path(path):
+    """path, or 'name (2).ext' style variants of it until one is free"""
+    if not os.path.exists(path):
+        return path
+    root, ext = os.path.splitext(path)
+    counter = 2
+    while os.path.exists(f"{root} ({counter}){ext}"):
+        counter += 1
+    return f"{root} ({counter}){ext}"
+
+
+def move_to_category(path, base_dir=None):
+    """Move a file into a category folder beside it (or under base_dir)"""
+    base_dir = base_dir or os.path.dirname(path)
+    target_dir = os.path.join(base_dir, category_for(path))
+    os.makedirs(target_dir, exist_ok=True)
+    target = unique_path(os.path.join(target_dir, os.path.basename(path)))
+    shutil.move(path, target)
+    return target
+
+
+def is_archive(path):
+    try:
+        return zipfile.is_zipfile(path) or tarfile.is_tarfile(path)
+    except OSError:
+        return False
+
+
+def _archive_stem(path):
+    name = os.path.basename(path)
+    for ext in ('.tar.gz', '.tar.bz2', '.tar.xz', '.tgz', '.zip', '.tar'):
+        if name.lower().endswith(ext):
+            return name[:-len(ext)]
+    return os.path.splitext(name)[0]
+
+
+def _inside(directory, member):
+    target = os.path.realpath(os.path.join(directory, member))
+    return os.path.commonpath([os.path.realpath(directory), target]) == os.path.realpath(directory)
+
+
+def extract_archive(path):
+    """Unpack a zip or tar archive into a new folder next to it"""
+    target = unique_path(os.path.join(os.path.dirname(path), _archive_stem(path)))
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            # Refuse members that would land outside the target folder
+            for member in archive.namelist():
+                if not _inside(target, member):
+                    raise ValueError(f"Unsafe path in archive: {member}")
+            archive.extractall(target)
+    else:
+        with tarfile.open(path) as archive:
+            for member in archive.getmembers():
+                if not _inside(target, member.name) or member.issym() or member.islnk():
+                    raise ValueError(f"Unsafe entry in archive: {member.name}")
+            archive.extractall(target)
+    return target
+
+
+class PostProcessResult:
+    def __init__(self, path):
+        self.path = path  # Final location of the downloaded file
+        self.sha256 = None
+        self.verified = None  # True/False when an expected hash was given
+        self.extracted_to = None
+        self.error = None
+
+
+class PostProcessor:
+    """Bounded worker pool running the pipeline for completed downloads"""
+
+    def __init__(self, max_workers=2, extract_archives=False, sort_into_folders=False):
+        self.extract_archives = extract_archives
+        self.sort_into_folders = sort_into_folders
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix='postprocess')
+
+    def submit(self, path, expected_hash=None, callback=None):
+        """Queue a file; callback(result) runs on the worker thread when done"""
+        future = self.executor.submit(self.process, path, expected_hash)
+        if callback:
+            future.add_done_callback(lambda f: callback(self._result(f, path)))
+        return future
+
+    @staticmethod
+    def _result(future, path):
+        """The future's result, or a failed result if it was cancelled or raised"""
+        try:
+            return future.result()
+        except Exception as e:
+            result = PostProcessResult(path)
+            result.error = str(e) or type(e).__name__
+            return result
+
+    def process(self, path, expected_hash=None):
+        result = PostProcessResult(path)
+        try:
+            result.sha256 = sha256_file(path)
+            if expected_hash:
+                result.verified = result.sha256 == expected_hash.strip().lower()
+                if not result.verified:
+                    # Leave a file that failed verification where it is, untouched
+                    return result
+
+            if self.sort_into_folders:
+                result.path = move_to_category(result.path)
+            if self.extract_archives and is_archive(result.path):
+                result.extracted_to = extract_archive(result.path)
+        except Exception as e:
+            # Any failure has to end up on the result, or the job never finishes
+            print(f"Error post-processing {path}: {e}")
+            result.error = str(e) or type(e).__name__
+        return result
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
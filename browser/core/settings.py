@@ -0,0 +1,49 @@
+"""Persisted browser settings, stored as JSON in the data directory."""
+import copy
+
+from browser.core.storage import BACKUP_COUNT, data_path, read_json, write_json
+
+SETTINGS_FILE = 'settings.json'
+
+DEFAULT_SETTINGS = {
+    'p2p': {
+        'port': 55555,
+        'reuse_port': False,
+        'listeners': 1,
+    },
+    'tabs': {
+        'enabled': True,  # Memory saver for background tabs
+        'freeze_after': 300,  # Seconds idle before a tab is frozen
+        'discard_after': 1800,  # Seconds idle before a tab is discarded
+        'max_live_tabs': 10,  # Background tabs kept loaded before discarding the oldest
+    },
+    'downloads': {
+        'max_concurrent': 3,  # Downloads transferring at once; the rest wait in the queue
+        'postprocess_workers': 2,  # Threads hashing/extracting finished downloads
+        'extract_archives': False,  # Unpack zip/tar downloads next to the archive
+        'sort_into_folders': False,  # Move finished downloads into category folders
+    },
+    'session': {
+        'restore_on_startup': True,  # Reopen the tabs of the last session
+    },
+}
+
+
+def _merge(defaults, values):
+    """Overlay saved values on the defaults, keeping unknown keys"""
+    merged = copy.deepcopy(defaults)
+    for key, value in values.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_settings(path=None):
+    values = read_json(path or data_path(SETTINGS_FILE), {})
+    return _merge(DEFAULT_SETTINGS, values if isinstance(values, dict) else {})
+
+
+def save_settings(settings, path=None):
+    write_json(path or data_path(SETTINGS_FILE), settings, BACKUP_COUNT)
@@ -0,0 +1,91 @@
+"""Staged startup: what has to happen before the first frame, and what can wait.
+
+The window is built with only what its first frame needs. Everything else is
+queued as named tasks with a priority and run one per event-loop turn after
+the window has painted, so input and repaints are never held up for long. A
+task can also be run early when the user needs it before its turn comes.
+
+StartupReport records when each step ran and how long it took, measured from
+launch, so time-to-first-paint can be watched as the code changes.
+"""
+import heapq
+import time
+import traceback
+from contextlib import contextmanager
+
+
+class StartupReport:
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.steps = []  # [(name, seconds since start, duration in seconds)]
+
+    def record(self, name, started, finished=None):
+        finished = started if finished is None else finished
+        self.steps.append((name, started - self.start, finished - started))
+
+    def mark(self, name):
+        """Record a moment, such as the first paint"""
+        self.record(name, time.perf_counter())
+
+    @contextmanager
+    def measure(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started, time.perf_counter())
+
+    def elapsed(self, name):
+        """Seconds from launch to the end of a step, or None if it hasn't happened"""
+        for step, at, duration in self.steps:
+            if step == name:
+                return at + duration
+        return None
+
+    def format(self):
+        lines = ["Startup timings (ms since launch):"]
+        for name, at, duration in self.steps:
+            line = f"  {name:<20}{at * 1000:9.1f}"
+            if duration:
+                line += f"  ({duration * 1000:.1f} ms)"
+            lines.append(line)
+        return '\n'.join(lines)
+
+
+class StartupTasks:
+    """Named initialization tasks run in priority order (lowest first), each at most once"""
+
+    def __init__(self, report=None):
+        self.report = report
+        self.queue = []  # heap of (priority, order added, name)
+        self.pending = {}  # {name: function}
+
+    def add(self, name, function, priority=0):
+        self.pending[name] = function
+        heapq.heappush(self.queue, (priority, len(self.queue), name))
+
+    def run(self, name):
+        """Run a task now unless it already ran; False if there was nothing to run"""
+        function = self.pending.pop(name, None)
+        if function is None:
+            return False
+        started = time.perf_counter()
+        try:
+            function()
+        except Exception as e:
+            # One failed subsystem shouldn't stop the rest from starting
+            print(f"Error during startup task {name}: {e}\n{traceback.format_exc()}")
+        if self.report is not None:
+            self.report.record(name, started, time.perf_counter())
+        return True
+
+    def run_next(self):
+        """Run the most urgent waiting task; returns whether any are left"""
+        while self.queue:
+            _, _, name = heapq.heappop(self.queue)
+            if self.run(name):
+                break
+        return bool(self.pending)
+
+    def done(self, name):
+        return name not in self.pending
@@ -0,0 +1,129 @@
+"""Where the browser keeps its files, and how it writes them safely.
+
+Files live in a per-user data directory rather than the working directory.
+Writes go to a temporary file that is fsynced and then renamed over the
+target, so a crash leaves either the old or the new contents, never a
+truncated file. Important files also keep a few rolling backups that
+reads fall back to if the main copy is unreadable.
+"""
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+APP_NAME = 'WebBrowserPython'
+DATA_DIR_ENV = 'WEBBROWSER_DATA_DIR'  # Overrides the data directory, e.g. for portable installs
+BACKUP_COUNT = 3
+
+
+def data_dir():
+    if os.environ.get(DATA_DIR_ENV):
+        path = os.environ[DATA_DIR_ENV]
+    elif sys.platform == 'win32':
+        path = os.path.join(os.environ.get('APPDATA') or os.path.expanduser('~'), APP_NAME)
+    elif sys.platform == 'darwin':
+        path = os.path.join(os.path.expanduser('~/Library/Application Support'), APP_NAME)
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+        path = os.path.join(base, APP_NAME.lower())
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def data_path(name):
+    """Path of a data file, moving it over from the working directory if it was left there"""
+    path = os.path.join(data_dir(), name)
+    if not os.path.exists(path) and os.path.isfile(name) and \
+            os.path.abspath(name) != os.path.abspath(path):
+        try:
+            shutil.move(name, path)
+            print(f"Moved {name} to {path}")
+        except OSError as e:
+            print(f"Error moving {name} to {path}: {e}")
+            return name
+    return path
+
+
+def backup_paths(path, count=BACKUP_COUNT):
+    return [f"{path}.{number}" for number in range(1, count + 1)]
+
+
+def rotate_backups(path, count=BACKUP_COUNT):
+    """Shift path.1 -> path.2 ... and copy the current file to path.1"""
+    if count <= 0 or not os.path.exists(path):
+        return
+    backups = backup_paths(path, count)
+    for older, newer in zip(reversed(backups), reversed(backups[:-1])):
+        if os.path.exists(newer):
+            os.replace(newer, older)
+    shutil.copy2(path, backups[0])
+
+
+def _fsync_directory(directory):
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, data, backups=0):
+    """Replace path with data (str or bytes) so readers never see a partial file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data.encode('utf-8') if isinstance(data, str) else data)
+            f.flush()
+            os.fsync(f.fileno())
+        rotate_backups(path, backups)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def write_json(path, obj, backups=0):
+    atomic_write(path, json.dumps(obj, indent=2), backups)
+
+
+def read_json(path, default=None):
+    """Load JSON from path, falling back to its backups if it is missing or corrupt"""
+    for candidate in [path] + backup_paths(path):
+        try:
+            with open(candidate, 'r') as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as e:
+            print(f"Error reading {candidate}: {e}")
+            continue
+        if candidate != path:
+            print(f"Recovered {path} from {candidate}")
+        return value
+    return default
+
+
+def backup_database(conn, path, count=BACKUP_COUNT):
+    """Snapshot an open SQLite database into path.1, keeping count rolling copies"""
+    if count <= 0:
+        return
+    backups = backup_paths(path, count)
+    for older, newer in zip(reversed(backups), reversed(backups[:-1])):
+        if os.path.exists(newer):
+            os.replace(newer, older)
+    try:
+        target = sqlite3.connect(backups[0])
+        with target:
+            conn.backup(target)
+        target.close()
+    except sqlite3.Error as e:
+        print(f"Error backing up {path}: {e}")
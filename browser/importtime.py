@@ -0,0 +1,84 @@
+"""Startup import benchmark built on python -X importtime.
+
+    python -m browser.importtime                 # cost of importing the main window
+    python -m browser.importtime -m browser.themes.registry -n 10 --runs 9
+
+Every run imports the module in a fresh interpreter, so the numbers are for a
+cold start (apart from the OS file cache). The report gives the median total
+and the modules with the largest cumulative import time, which is where lazy
+imports pay off.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(output):
+    """[(name, depth, self us, cumulative us)] from -X importtime output"""
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # The header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, self_us, cumulative_us))
+    return entries
+
+
+def measure(module, python=sys.executable):
+    """Import entries for one cold import of module"""
+    result = subprocess.run([python, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, cwd=ROOT)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"importing {module} failed")
+    return parse_importtime(result.stderr)
+
+
+def summarize(runs):
+    """Median total and per-module (self, cumulative) times over several runs"""
+    totals = [sum(cumulative for _, depth, _, cumulative in entries if depth == 0) for entries in runs]
+    modules = {}
+    for entries in runs:
+        for name, _, self_us, cumulative_us in entries:
+            modules.setdefault(name, []).append((self_us, cumulative_us))
+    medians = {name: (statistics.median(t[0] for t in times), statistics.median(t[1] for t in times))
+               for name, times in modules.items()}
+    return statistics.median(totals), medians
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import cost of a module")
+    parser.add_argument('-m', '--module', default='browser.ui.window', help="module to import")
+    parser.add_argument('-n', '--top', type=int, default=25, help="modules to list")
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters to measure")
+    args = parser.parse_args(argv)
+
+    try:
+        runs = [measure(args.module) for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"Error importing {args.module}: {e}")
+        return 1
+    total, medians = summarize(runs)
+    print(f"import {args.module}: {total / 1000:.1f} ms total "
+          f"(median of {args.runs} runs, {len(medians)} modules)")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    ranked = sorted(medians.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in ranked[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
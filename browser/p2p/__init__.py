@@ -0,0 +1,2 @@
+"""Peer-to-peer chat: the networking core, presence tracking and lobby relay
+(no Qt), plus the Qt adapter (qt) and chat dialogs (chat)."""
@@ -0,0 +1,619 @@
+"""Lobby chat dialogs: choosing a hosting type and lobby, and the chat window.
+
+Each function takes the browser window that owns the dialogs and its P2P
+managers. The module, and with it the P2P stack, is loaded the first time
+the chat is opened.
+"""
+import traceback
+import socket
+import threading
+from datetime import datetime
+from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QDialog,
+                             QLabel, QMessageBox, QScrollArea, QSizePolicy)
+from PyQt6.QtGui import QIcon
+from browser.themes.stylesheet import tint_for
+from browser.p2p.core import RelayClient, EndpointConfig, RELAY_PORT
+from browser.p2p.qt import P2PNetworkManager, NetworkEventBridge
+
+MAX_CHAT_MESSAGES = 500  # Message widgets kept per chat window
+
+def show_hosting_options(window):
+    try:
+        # Create a basic dialog window
+        dialog = QDialog(window)
+        dialog.setWindowTitle("Hosting Options")
+        dialog.setGeometry(300, 300, 400, 200)
+        
+        layout = QVBoxLayout()
+        
+        # Title
+        title_label = QLabel("Choose Hosting Type")
+        title_label.setObjectName("dialogTitle")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
+        
+        # Hosting options
+        options_layout = QHBoxLayout()
+        
+        # Server hosted option
+        server_btn = QPushButton("Server Hosted")
+        server_btn.setIcon(QIcon('svg/server.svg'))
+        server_btn.setMinimumHeight(60)
+        server_btn.setObjectName("hostingButton")
+        server_btn.setProperty("hosting", "server")
+        server_btn.clicked.connect(lambda: [show_lobby_selection(window, "server"), dialog.accept()])
+        options_layout.addWidget(server_btn)
+        
+        # Local hosted option
+        local_btn = QPushButton("Local Hosted")
+        local_btn.setIcon(QIcon('svg/cloud.svg'))
+        local_btn.setMinimumHeight(60)
+        local_btn.setObjectName("hostingButton")
+        local_btn.setProperty("hosting", "cloud")
+        local_btn.clicked.connect(lambda: [show_lobby_selection(window, "local"), dialog.accept()])
+        options_layout.addWidget(local_btn)
+        
+        layout.addLayout(options_layout)
+        
+        dialog.setLayout(layout)
+        dialog.exec()
+    except Exception as e:
+        error_message = f"Error showing hosting options: {str(e)}\n\n{traceback.format_exc()}"
+        print(error_message)
+        
+        # Show error dialog
+        error_dialog = QMessageBox(window)
+        error_dialog.setIcon(QMessageBox.Icon.Critical)
+        error_dialog.setWindowTitle("Error")
+        error_dialog.setText("An error occurred while showing hosting options:")
+        error_dialog.setDetailedText(error_message)
+        error_dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
+        error_dialog.exec()
+
+def show_lobby_selection(window, hosting_type):
+    try:
+        # First show a lobby selection dialog
+        lobby_dialog = QDialog(window)
+        lobby_dialog.setWindowTitle("Choose a Lobby")
+        lobby_dialog.setGeometry(300, 300, 400, 300)
+        lobby_dialog.setProperty("role", "chat")
+        
+        lobby_layout = QVBoxLayout()
+        
+        # Title
+        title_label = QLabel("Choose a Lobby Chat")
+        title_label.setObjectName("dialogTitle")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lobby_layout.addWidget(title_label)
+        
+        # Lobby options; the tint picks the button color from stylesheet.TINTS
+        lobbies = [
+            {"name": "General Chat", "tint": 0, "icon": "svg/send.svg"},
+            {"name": "Tech Support", "tint": 1, "icon": "svg/send.svg"},
+            {"name": "Gaming", "tint": 2, "icon": "svg/send.svg"},
+            {"name": "Music", "tint": 3, "icon": "svg/send.svg"}
+        ]
+        
+        for lobby in lobbies:
+            lobby_btn = QPushButton(f"  {lobby['name']}")
+            lobby_btn.setIcon(QIcon(lobby['icon']))
+            lobby_btn.setMinimumHeight(50)
+            lobby_btn.setObjectName("lobbyButton")
+            lobby_btn.setProperty("tint", lobby['tint'])
+            lobby_btn.clicked.connect(lambda checked, l=lobby['name'], h=hosting_type: 
+                                     [show_chat_window(window, l, h), lobby_dialog.accept()])
+            lobby_layout.addWidget(lobby_btn)
+        
+        lobby_dialog.setLayout(lobby_layout)
+        lobby_dialog.exec()
+    except Exception as e:
+        error_message = f"Error showing lobby selection: {str(e)}\n\n{traceback.format_exc()}"
+        print(error_message)
+        
+        # Show error dialog
+        error_dialog = QMessageBox(window)
+        error_dialog.setIcon(QMessageBox.Icon.Critical)
+        error_dialog.setWindowTitle("Error")
+        error_dialog.setText("An error occurred while showing lobby selection:")
+        error_dialog.setDetailedText(error_message)
+        error_dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
+        error_dialog.exec()
+
+def show_chat_window(window, lobby_name, hosting_type):
+    # Create a Telegram-like dialog
+    dialog = QDialog(window)
+    dialog.setWindowTitle(f"P2P Chat - {lobby_name}")
+    dialog.setGeometry(300, 300, 800, 600)
+    dialog.setProperty("role", "chat")
+    
+    # Initialize P2P network manager if startup hasn't yet
+    window.require('p2p')
+    
+    # Server hosted lobbies go through one relay connection per lobby,
+    # local hosted ones use direct peer connections
+    if hosting_type == "server":
+        if not hasattr(window, 'relay_managers'):
+            window.relay_managers = {}
+        if lobby_name not in window.relay_managers:
+            window.relay_managers[lobby_name] = P2PNetworkManager(
+                window, core=RelayClient(window.p2p_manager.username, lobby_name))
+        network = window.relay_managers[lobby_name]
+        mode_name = "Relay Mode"
+    else:
+        network = window.p2p_manager
+        mode_name = "P2P Mode"
+    
+    layout = QVBoxLayout()
+    
+    # Connection status bar
+    connection_bar = QWidget()
+    connection_layout = QHBoxLayout()
+    connection_layout.setContentsMargins(5, 5, 5, 5)
+    
+    # Status indicator
+    status_indicator = QLabel("●")
+    status_indicator.setObjectName("chatStatusDot")
+    connection_layout.addWidget(status_indicator)
+    
+    # Status text
+    status_text = QLabel(f"{mode_name} - {network.username}")
+    status_text.setObjectName("chatStatusText")
+    connection_layout.addWidget(status_text)
+    
+    # User count
+    user_count = QLabel("1 user online")
+    user_count.setObjectName("chatUserCount")
+    user_count.setAlignment(Qt.AlignmentFlag.AlignRight)
+    connection_layout.addWidget(user_count)
+    
+    connection_bar.setLayout(connection_layout)
+    connection_bar.setObjectName("chatConnectionBar")
+    layout.addWidget(connection_bar)
+    
+    # P2P connection panel
+    p2p_panel = QWidget()
+    p2p_layout = QHBoxLayout()
+    
+    # IP input
+    ip_input = QLineEdit()
+    if hosting_type == "server":
+        ip_input.setPlaceholderText(f"Enter relay server address (host or host:port, default port {RELAY_PORT})...")
+    else:
+        ip_input.setPlaceholderText(f"Enter peer address (ip or ip:port, default port {EndpointConfig.DEFAULT_PORT})...")
+    ip_input.setObjectName("chatField")
+    p2p_layout.addWidget(ip_input)
+    
+    # Connect button
+    connect_btn = QPushButton("Connect")
+    connect_btn.setObjectName("chatButton")
+    p2p_layout.addWidget(connect_btn)
+    
+    # Username input
+    username_input = QLineEdit()
+    username_input.setPlaceholderText("Change username...")
+    username_input.setText(network.username)
+    username_input.setObjectName("chatField")
+    username_input.setProperty("compact", True)
+    p2p_layout.addWidget(username_input)
+    
+    # Set username button
+    set_username_btn = QPushButton("Set")
+    set_username_btn.setObjectName("chatButton")
+    set_username_btn.setProperty("compact", True)
+    p2p_layout.addWidget(set_username_btn)
+    
+    p2p_panel.setLayout(p2p_layout)
+    layout.addWidget(p2p_panel)
+    
+    # Telegram-like chat interface
+    chat_area = QScrollArea()
+    chat_area.setWidgetResizable(True)
+    chat_area.setObjectName("chatArea")
+    
+    chat_widget = QWidget()
+    chat_layout = QVBoxLayout()
+    chat_layout.setSpacing(15)
+    
+    # System welcome message
+    system_msg = QLabel(f"Welcome to the P2P {lobby_name} chat room! Connect directly with other users to discuss {hosting_type} hosting.")
+    system_msg.setObjectName("chatBanner")
+    system_msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    chat_layout.addWidget(system_msg)
+    
+    # IP address info message
+    if hosting_type == "server":
+        ip_info_msg = QLabel("Connect once to a lobby relay server (run lobby_relay.py) to join everyone in this lobby")
+    else:
+        try:
+            local_ip = socket.gethostbyname(socket.gethostname())
+        except:
+            local_ip = "127.0.0.1"
+        
+        ip_info_msg = QLabel(f"Your IP address: {local_ip} - Share this with others so they can connect to you")
+    ip_info_msg.setObjectName("chatBanner")
+    ip_info_msg.setProperty("tone", "info")
+    ip_info_msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    chat_layout.addWidget(ip_info_msg)
+    
+    # Main chat interface with user list
+    chat_container = QWidget()
+    chat_container_layout = QHBoxLayout()
+    
+    # Chat messages area
+    messages_container = QWidget()
+    messages_layout = QVBoxLayout()
+    messages_layout.setContentsMargins(0, 0, 0, 0)
+    messages_layout.setSpacing(15)
+    
+    # User list (right sidebar)
+    users_list = QWidget()
+    users_list.setFixedWidth(150)
+    users_list.setObjectName("chatUsers")
+    users_layout = QVBoxLayout()
+    
+    # Online users header
+    online_label = QLabel("Online Users")
+    online_label.setObjectName("chatUsersHeader")
+    users_layout.addWidget(online_label)
+    
+    # Add current user (You)
+    your_item = QWidget()
+    your_item_layout = QHBoxLayout()
+    your_item_layout.setContentsMargins(0, 5, 0, 5)
+    
+    # User status indicator
+    your_status = QLabel("●")
+    your_status.setObjectName("presenceDot")
+    your_item_layout.addWidget(your_status)
+    
+    # Username
+    your_label = QLabel(network.username + " (You)")
+    your_label.setObjectName("chatSelf")
+    your_item_layout.addWidget(your_label)
+    
+    your_item_layout.addStretch()
+    your_item.setLayout(your_item_layout)
+    users_layout.addWidget(your_item)
+    
+    # Scroll to the bottom once per batch of new messages
+    scroll_timer = QTimer(dialog)
+    scroll_timer.setSingleShot(True)
+    scroll_timer.setInterval(0)
+    scroll_timer.timeout.connect(lambda: chat_area.verticalScrollBar().setValue(
+        chat_area.verticalScrollBar().maximum()))
+    
+    # Function to add a message widget, dropping the oldest past the limit
+    def insert_message_widget(widget):
+        messages_layout.insertWidget(messages_layout.count() - 1, widget)
+        while messages_layout.count() - 1 > MAX_CHAT_MESSAGES:
+            messages_layout.takeAt(0).widget().deleteLater()
+        scroll_timer.start()
+    
+    # Function to add system message
+    def add_system_message(text):
+        system_container = QWidget()
+        system_layout = QHBoxLayout()
+        
+        system_text = QLabel(text)
+        system_text.setObjectName("chatSystemText")
+        system_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        system_layout.addWidget(system_text)
+        
+        system_container.setLayout(system_layout)
+        insert_message_widget(system_container)
+    
+    # Function to add peer message
+    def add_peer_message(peer_username, message_text, timestamp):
+        # Create peer message
+        msg_container = QWidget()
+        msg_layout = QHBoxLayout()
+        msg_layout.setContentsMargins(5, 0, 5, 0)
+        
+        # User avatar
+        avatar = QPushButton(peer_username[0])
+        avatar.setFixedSize(40, 40)
+        avatar.setObjectName("chatAvatar")
+        
+        # Consistent color for the user, shared by avatar and name
+        tint = tint_for(peer_username)
+        avatar.setProperty("tint", tint)
+        msg_layout.addWidget(avatar)
+        
+        # Message content
+        content = QWidget()
+        content_layout = QVBoxLayout()
+        
+        # Username
+        username_label = QLabel(peer_username)
+        username_label.setObjectName("chatUserName")
+        username_label.setProperty("tint", tint)
+        content_layout.addWidget(username_label)
+        
+        # Message text
+        text_label = QLabel(message_text)
+        text_label.setWordWrap(True)
+        content_layout.addWidget(text_label)
+        
+        # Timestamp
+        timestamp_label = QLabel(timestamp)
+        timestamp_label.setObjectName("chatTime")
+        content_layout.addWidget(timestamp_label)
+        
+        content.setLayout(content_layout)
+        msg_layout.addWidget(content)
+        msg_layout.addStretch()
+        
+        msg_container.setLayout(msg_layout)
+        insert_message_widget(msg_container)
+    
+    # Function to update username in UI
+    def update_username_ui():
+        your_label.setText(network.username + " (You)")
+        status_text.setText(f"{mode_name} - {network.username}")
+    
+    # Function to set username
+    def set_username():
+        new_username = username_input.text().strip()
+        if new_username:
+            network.set_username(new_username)
+            update_username_ui()
+            add_system_message("You changed your username to " + new_username)
+    
+    # Connect set username button
+    set_username_btn.clicked.connect(set_username)
+    
+    # Dictionary to keep track of peer widgets
+    peer_widgets = {}
+    
+    # Function to add peer to UI
+    def add_peer_to_ui(username):
+        if username in peer_widgets:
+            return
+        
+        # Check if the layout is still valid
+        try:
+            # Create peer item widget
+            peer_item = QWidget()
+            peer_item_layout = QHBoxLayout()
+            peer_item_layout.setContentsMargins(0, 5, 0, 5)
+            
+            # User status indicator
+            peer_status = QLabel("●")
+            peer_status.setObjectName("presenceDot")
+            peer_item_layout.addWidget(peer_status)
+            
+            # Username
+            peer_label = QLabel(username)
+            peer_item_layout.addWidget(peer_label)
+            
+            peer_item_layout.addStretch()
+            peer_item.setLayout(peer_item_layout)
+            
+            # Keep the trailing stretch below the user entries
+            users_layout.insertWidget(users_layout.count() - 1, peer_item)
+            peer_widgets[username] = peer_item
+        except RuntimeError:
+            print(f"Failed to add peer {username} to UI: layout has been deleted")
+        except Exception as e:
+            print(f"Error adding peer {username} to UI: {str(e)}")
+    
+    # Function to remove peer from UI
+    def remove_peer_from_ui(username):
+        if username in peer_widgets:
+            try:
+                peer_widgets[username].setParent(None)
+                del peer_widgets[username]
+            except RuntimeError:
+                print(f"Failed to remove peer {username} from UI: widget has been deleted")
+            except Exception as e:
+                print(f"Error removing peer {username} from UI: {str(e)}")
+    
+    # Connect to peer function
+    def connect_to_peer():
+        ip = ip_input.text().strip()
+        if ip:
+            add_system_message(f"Connecting to {ip}...")
+            
+            # Addresses may carry an explicit port
+            host, port = ip, None
+            if ':' in ip:
+                host, _, port_text = ip.rpartition(':')
+                port = int(port_text) if port_text.isdigit() else None
+            
+            # Try to connect in a separate thread to avoid UI freezing
+            def connect_thread():
+                success = network.connect_to_peer(host, port)
+                if success:
+                    # Update UI from main thread
+                    target = "relay" if hosting_type == "server" else "peer"
+                    bridge.post_system_message(f"Connected to {target} at {ip}")
+                else:
+                    bridge.post_system_message(f"Failed to connect to {ip}")
+            
+            threading.Thread(target=connect_thread).start()
+            ip_input.clear()
+    
+    # Connect button
+    connect_btn.clicked.connect(connect_to_peer)
+    
+    # The user list follows heartbeat-driven presence, applied one batch at a time
+    def apply_presence(joined, left):
+        try:
+            users_list.setUpdatesEnabled(False)
+            for username in left:
+                remove_peer_from_ui(username)
+            for username in joined:
+                add_peer_to_ui(username)
+            user_count.setText(f"{len(peer_widgets) + 1} users online")
+            users_list.setUpdatesEnabled(True)
+        except RuntimeError:
+            print("Failed to apply presence changes: user list has been deleted")
+    
+    # Apply every network event that arrived during a frame in one pass
+    def apply_network_batch(events):
+        joined, left = [], []
+        messages_container.setUpdatesEnabled(False)
+        
+        # Only the newest messages survive trimming, so skip building the rest
+        message_count = sum(1 for event, _ in events if event == 'message_received')
+        skip = max(0, message_count - MAX_CHAT_MESSAGES)
+        
+        for event, args in events:
+            if event == 'message_received':
+                if skip:
+                    skip -= 1
+                    continue
+                add_peer_message(*args)
+            elif event == 'peer_connected':
+                add_system_message(f"{args[0]} has joined the chat")
+            elif event == 'peer_disconnected':
+                add_system_message(f"{args[0]} has left the chat")
+            elif event == 'presence_changed':
+                joined.extend(args[0])
+                left.extend(args[1])
+            elif event == 'system_message':
+                add_system_message(args[0])
+        
+        messages_container.setUpdatesEnabled(True)
+        if joined or left:
+            apply_presence(joined, left)
+    
+    bridge = NetworkEventBridge(network, dialog)
+    bridge.batch_ready.connect(apply_network_batch)
+    
+    # Start listening for connections
+    if not network.start_listening():
+        QMessageBox.warning(window, "Network Error", 
+                          "Could not start P2P networking. Chat will be in offline mode.")
+    elif hosting_type != "server":
+        add_system_message(f"Listening for peers on port {network.port}")
+    
+    users_layout.addStretch()
+    users_list.setLayout(users_layout)
+    
+    # Peers already known to a reused network manager
+    apply_presence(list(network.peers), [])
+    
+    # Add spacer to push content to the top
+    spacer = QWidget()
+    spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    messages_layout.addWidget(spacer)
+    
+    messages_container.setLayout(messages_layout)
+    
+    # Add messages and users to the panel
+    chat_container_layout.addWidget(messages_container)
+    chat_container_layout.addWidget(users_list)
+    chat_container.setLayout(chat_container_layout)
+    
+    chat_layout.addWidget(chat_container)
+    
+    chat_widget.setLayout(chat_layout)
+    chat_area.setWidget(chat_widget)
+    layout.addWidget(chat_area)
+    
+    # Message input area
+    input_container = QWidget()
+    input_layout = QHBoxLayout()
+    
+    # Add attachment button
+    attach_btn = QPushButton()
+    attach_btn.setIcon(QIcon('svg/paperclip.svg'))
+    attach_btn.setIconSize(QSize(20, 20))
+    attach_btn.setFixedSize(40, 40)
+    attach_btn.setObjectName("chatRoundButton")
+    input_layout.addWidget(attach_btn)
+    
+    message_input = QLineEdit()
+    message_input.setPlaceholderText("Type a message...")
+    message_input.setObjectName("chatMessageInput")
+    message_input.setMinimumHeight(40)
+    input_layout.addWidget(message_input)
+    
+    # Add emoji button
+    emoji_btn = QPushButton()
+    emoji_btn.setIcon(QIcon('svg/smile.svg'))
+    emoji_btn.setIconSize(QSize(20, 20))
+    emoji_btn.setFixedSize(40, 40)
+    emoji_btn.setObjectName("chatRoundButton")
+    input_layout.addWidget(emoji_btn)
+    
+    send_msg_btn = QPushButton()
+    send_msg_btn.setIcon(QIcon('svg/send.svg'))
+    send_msg_btn.setIconSize(QSize(20, 20))
+    send_msg_btn.setFixedSize(40, 40)
+    send_msg_btn.setObjectName("chatSendButton")
+    
+    # Function to add user message to chat
+    def add_user_message():
+        text = message_input.text().strip()
+        if not text:
+            return
+            
+        # Create user message
+        msg_container = QWidget()
+        msg_layout = QHBoxLayout()
+        msg_layout.setContentsMargins(5, 0, 5, 0)
+        
+        # User avatar
+        avatar = QPushButton(network.username[0])
+        avatar.setFixedSize(40, 40)
+        avatar.setObjectName("chatAvatar")
+        msg_layout.addWidget(avatar)
+        
+        # Message content
+        content = QWidget()
+        content_layout = QVBoxLayout()
+        
+        # Username
+        username = QLabel(network.username + " (You)")
+        username.setObjectName("chatUserName")
+        content_layout.addWidget(username)
+        
+        # Message text
+        text_label = QLabel(text)
+        text_label.setWordWrap(True)
+        content_layout.addWidget(text_label)
+        
+        # Timestamp
+        current_time = datetime.now().strftime("%H:%M")
+        timestamp = QLabel(current_time)
+        timestamp.setObjectName("chatTime")
+        content_layout.addWidget(timestamp)
+        
+        content.setLayout(content_layout)
+        msg_layout.addWidget(content)
+        msg_layout.addStretch()
+        
+        msg_container.setLayout(msg_layout)
+        insert_message_widget(msg_container)
+        
+        # Broadcast message to all peers
+        network.broadcast_message(text)
+        
+        # Clear input
+        message_input.clear()
+        
+        # Update status
+        status_text.setText(f"{mode_name} - {network.username}")
+    
+    # Connect send button and Enter key
+    send_msg_btn.clicked.connect(add_user_message)
+    message_input.returnPressed.connect(add_user_message)
+    
+    input_layout.addWidget(send_msg_btn)
+    
+    input_container.setLayout(input_layout)
+    layout.addWidget(input_container)
+    
+    # Clean up when dialog closes
+    def on_dialog_closed():
+        # We don't stop the P2P manager as it might be used in other chat windows,
+        # but this window no longer wants its events
+        bridge.close()
+        
+    dialog.finished.connect(on_dialog_closed)
+    
+    dialog.setLayout(layout)
+    dialog.exec()
@@ -0,0 +1,678 @@
+"""Qt-free P2P networking core.
+
+The browser wraps this in a thin QObject adapter (P2PNetworkManager in
+browser/p2p/qt.py); headless tools, relays and benchmarks can use it
+directly through plain callbacks or the ``events()`` async iterator.
+"""
+import asyncio
+import json
+import socket
+import threading
+import uuid
+from datetime import datetime
+
+from browser.p2p.presence import PresenceTracker, HeartbeatLoop
+
+RELAY_PORT = 55600  # Default port of the lobby relay (browser.p2p.relay)
+MAX_FRAME_SIZE = 64 * 1024
+
+
+def encode_frame(frame):
+    """Encode a relay protocol frame as one line of compact JSON"""
+    return (json.dumps(frame, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def decode_frame(line):
+    """Decode a relay protocol frame, returning None if it is malformed"""
+    try:
+        frame = json.loads(line)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return frame if isinstance(frame, dict) else None
+
+
+class EventEmitter:
+    """Callback and async-iterator event dispatch shared by network cores"""
+    EVENTS = ('message_received', 'peer_connected', 'peer_disconnected', 'presence_changed')
+
+    def __init__(self):
+        self._callbacks = {event: [] for event in self.EVENTS}
+        self._subscribers = []  # [(loop, asyncio.Queue)]
+        self._lock = threading.Lock()
+
+    def on(self, event, callback):
+        """Register a callback for an event, called from the network thread"""
+        if event not in self._callbacks:
+            raise ValueError(f"Unknown event: {event}")
+        with self._lock:
+            self._callbacks[event].append(callback)
+
+    def off(self, event, callback):
+        """Unregister a callback previously added with on()"""
+        with self._lock:
+            if callback in self._callbacks.get(event, []):
+                self._callbacks[event].remove(callback)
+
+    async def events(self):
+        """Async iterator yielding (event, args) tuples as they happen"""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        subscriber = (loop, queue)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    def _emit(self, event, *args):
+        """Dispatch an event to callbacks and async subscribers"""
+        with self._lock:
+            callbacks = list(self._callbacks[event])
+            subscribers = list(self._subscribers)
+
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error in {event} callback: {e}")
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (event, args))
+            except RuntimeError:
+                # Event loop already closed
+                pass
+
+
+class NetworkCore(EventEmitter):
+    """Peer bookkeeping and heartbeat-driven presence shared by network cores.
+
+    Subclasses override _send_heartbeats() and _peer_timed_out() to ping
+    their peers and react to missed deadlines. Presence changes are batched
+    by the heartbeat loop and emitted as one presence_changed(joined, left)
+    event per tick. While the loop isn't
+    running (no heartbeat socket, or not connected) they are emitted as soon
+    as a peer connects or disconnects.
+    """
+
+    def __init__(self, username=None):
+        super().__init__()
+        self.peers = {}
+        self.username = username or f"User_{uuid.uuid4().hex[:8]}"  # Generate random username
+        self.presence = PresenceTracker()
+        self.heartbeat = HeartbeatLoop(
+            self.presence, self._send_heartbeats, self._peer_timed_out,
+            lambda joined, left: self._emit('presence_changed', joined, left))
+
+    def _add_peer(self, username, address, track=True):
+        """Record a peer and announce it if it is new"""
+        is_new = username not in self.peers
+        self.peers[username] = address
+        if track:
+            self.presence.track(username)
+        if is_new:
+            self.presence.mark_joined(username)
+            self._emit('peer_connected', username)
+            if not self.heartbeat.running:
+                self._flush_presence()
+
+    def _remove_peer(self, username, flush=True):
+        """Forget a peer and announce its departure"""
+        if self.peers.pop(username, None) is None:
+            return
+        self.presence.forget(username)
+        self.presence.mark_left(username)
+        self._emit('peer_disconnected', username)
+        if flush and not self.heartbeat.running:
+            self._flush_presence()
+
+    def _flush_presence(self):
+        """Emit the presence changes batched so far, outside the heartbeat loop"""
+        joined, left = self.presence.drain()
+        if joined or left:
+            self._emit('presence_changed', joined, left)
+
+    def _send_heartbeats(self):
+        """Ping whatever the core tracks; by default nothing is sent"""
+
+    def _peer_timed_out(self, key):
+        """A tracked key missed its deadline; by default the peer is dropped"""
+        self._remove_peer(key)
+
+
+class EndpointConfig:
+    """Where a P2P core listens and which port it advertises to peers.
+
+    The preferred port and the following ``port_range - 1`` ports are tried
+    in order; if all are taken the OS picks a free ephemeral port. With
+    ``reuse_port`` the port is bound with SO_REUSEPORT by ``listeners``
+    sockets, letting the kernel spread incoming connections across them
+    (and across other processes bound the same way).
+    """
+    DEFAULT_PORT = 55555
+
+    def __init__(self, port=DEFAULT_PORT, port_range=10, bind_host='0.0.0.0',
+                 reuse_port=False, listeners=1):
+        self.port = port
+        self.port_range = port_range
+        self.bind_host = bind_host
+        self.reuse_port = reuse_port and hasattr(socket, 'SO_REUSEPORT')
+        self.listeners = max(1, listeners) if self.reuse_port else 1
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(port=int(data.get('port', cls.DEFAULT_PORT)),
+                   port_range=int(data.get('port_range', 10)),
+                   bind_host=data.get('bind_host', '0.0.0.0'),
+                   reuse_port=bool(data.get('reuse_port', False)),
+                   listeners=int(data.get('listeners', 1)))
+
+    def to_dict(self):
+        return {
+            'port': self.port,
+            'port_range': self.port_range,
+            'bind_host': self.bind_host,
+            'reuse_port': self.reuse_port,
+            'listeners': self.listeners,
+        }
+
+    def candidate_ports(self):
+        """Ports to try in order, ending with 0 for an ephemeral port"""
+        if self.port:
+            yield from range(self.port, min(self.port + self.port_range, 65536))
+        yield 0
+
+    def _socket(self, kind):
+        sock = socket.socket(socket.AF_INET, kind)
+        if kind == socket.SOCK_STREAM:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        return sock
+
+    def bind(self):
+        """Bind the TCP listeners and the UDP heartbeat socket on one port.
+
+        Returns (listening_sockets, heartbeat_socket, port). The heartbeat
+        socket is None when the UDP side of the port is unavailable.
+        """
+        sockets = []
+        try:
+            tcp = self._socket(socket.SOCK_STREAM)
+            sockets.append(tcp)
+            for candidate in self.candidate_ports():
+                try:
+                    # A failed bind leaves the socket reusable for the next port
+                    tcp.bind((self.bind_host, candidate))
+                    break
+                except OSError as e:
+                    print(f"Could not bind to port {candidate}: {e}")
+            else:
+                raise OSError("no free port")
+            port = tcp.getsockname()[1]
+
+            for _ in range(self.listeners - 1):
+                extra = self._socket(socket.SOCK_STREAM)
+                sockets.append(extra)
+                extra.bind((self.bind_host, port))
+            for sock in sockets:
+                sock.listen(128)
+        except OSError:
+            for sock in sockets:
+                sock.close()
+            raise
+
+        heartbeat_socket = self._socket(socket.SOCK_DGRAM)
+        try:
+            heartbeat_socket.bind((self.bind_host, port))
+        except OSError as e:
+            print(f"Heartbeats disabled, could not bind UDP port {port}: {e}")
+            heartbeat_socket.close()
+            heartbeat_socket = None
+        return sockets, heartbeat_socket, port
+
+
+class P2PNetworkCore(NetworkCore):
+    # Control messages share the "username:payload" wire format; the prefix
+    # keeps them apart from chat text
+    CONTROL_PREFIX = '\x01'
+
+    def __init__(self, username=None, config=None):
+        super().__init__(username)
+        self.peers = {}  # {username: (ip, advertised port)}
+        self.config = config or EndpointConfig()
+        self.heartbeat_socket = None
+        self.listening_sockets = []
+        self.is_listening = False
+        self.listener_threads = []
+        self.port = self.config.port  # Actual port once listening
+
+    def start_listening(self):
+        """Start listening for incoming connections"""
+        if self.is_listening:
+            return True
+
+        try:
+            self.listening_sockets, self.heartbeat_socket, self.port = self.config.bind()
+        except OSError as e:
+            print(f"Error starting P2P listener: {e}")
+            return False
+        self.is_listening = True
+
+        # One accept thread per listening socket
+        self.listener_threads = []
+        for listening_socket in self.listening_sockets:
+            listener_thread = threading.Thread(
+                target=self._listen_for_connections, args=(listening_socket,))
+            listener_thread.daemon = True
+            listener_thread.start()
+            self.listener_threads.append(listener_thread)
+
+        if self.heartbeat_socket:
+            heartbeat_thread = threading.Thread(target=self._listen_for_heartbeats)
+            heartbeat_thread.daemon = True
+            heartbeat_thread.start()
+            self.heartbeat.start()
+
+        print(f"P2P listening on port {self.port}")
+        return True
+
+    def stop_listening(self):
+        """Stop listening for connections"""
+        self.is_listening = False
+        self.heartbeat.stop()
+        for sock in self.listening_sockets + [self.heartbeat_socket]:
+            if sock:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+        self.listening_sockets = []
+        self.heartbeat_socket = None
+
+    def _listen_for_heartbeats(self):
+        """Thread function answering PING datagrams and recording PONGs"""
+        heartbeat_socket = self.heartbeat_socket
+        while self.is_listening:
+            try:
+                data, address = heartbeat_socket.recvfrom(512)
+            except OSError:
+                # Socket closed
+                break
+
+            kind, _, username = data.decode('utf-8', 'replace').partition(':')
+            if username in self.peers:
+                # Peers get a deadline once they have answered a ping; older
+                # clients without heartbeats stay until a send to them fails
+                if kind == 'PONG':
+                    self.presence.track(username)
+                else:
+                    self.presence.seen(username)
+            if kind == 'PING':
+                try:
+                    heartbeat_socket.sendto(f"PONG:{self.username}".encode('utf-8'), address)
+                except OSError:
+                    pass
+
+    def _send_heartbeats(self):
+        """Send one PING datagram to every known peer"""
+        if not self.heartbeat_socket:
+            return
+        ping = f"PING:{self.username}".encode('utf-8')
+        for ip, port in list(self.peers.values()):
+            try:
+                self.heartbeat_socket.sendto(ping, (ip, port))
+            except OSError:
+                pass
+
+    def _peer_timed_out(self, username):
+        print(f"Peer {username} stopped answering heartbeats")
+        super()._peer_timed_out(username)
+
+    def _listen_for_connections(self, listening_socket):
+        """Thread function to listen for incoming connections"""
+        while self.is_listening:
+            try:
+                client_socket, address = listening_socket.accept()
+                client_handler = threading.Thread(
+                    target=self._handle_client_connection,
+                    args=(client_socket, address)
+                )
+                client_handler.daemon = True
+                client_handler.start()
+            except Exception as e:
+                if self.is_listening:
+                    print(f"Error accepting connection: {e}")
+                # Socket closed or error occurred
+                break
+
+    def _control(self, command):
+        """Build a control payload advertising our listening port"""
+        return f"{self.CONTROL_PREFIX}{command} {self.port}"
+
+    def _parse_control(self, message):
+        """Return (command, advertised port) for control payloads, else None"""
+        if not message.startswith(self.CONTROL_PREFIX):
+            return None
+        command, _, port = message[1:].partition(' ')
+        return command, int(port) if port.isdigit() else None
+
+    def _handle_client_connection(self, client_socket, address):
+        """Handle incoming client connection"""
+        try:
+            # Receive initial message with username
+            data = client_socket.recv(1024).decode('utf-8')
+            if data:
+                parts = data.split(':', 1)
+                if len(parts) == 2:
+                    username, message = parts
+                    control = self._parse_control(message)
+
+                    if control and control[0] == 'HELLO':
+                        # Handshake: remember the port the peer listens on
+                        self._add_peer(username, (address[0], control[1] or self.config.DEFAULT_PORT),
+                                       track=False)
+                    elif username not in self.peers:
+                        # Peer we never shook hands with; assume the default port
+                        self._add_peer(username, (address[0], self.config.DEFAULT_PORT), track=False)
+                    else:
+                        self.presence.seen(username)
+
+                    # Process message
+                    if message and not control:
+                        timestamp = datetime.now().strftime("%H:%M")
+                        self._emit('message_received', username, message, timestamp)
+
+                    # Send acknowledgment
+                    client_socket.send(f"{self.username}:{self._control('ACK')}".encode('utf-8'))
+        except Exception as e:
+            print(f"Error handling client: {e}")
+        finally:
+            client_socket.close()
+
+    def connect_to_peer(self, ip_address, port=None):
+        """Connect to a peer at the given IP address"""
+        if port is None:
+            port = self.config.DEFAULT_PORT
+
+        peer_socket = None
+        try:
+            # Create socket and connect
+            peer_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            peer_socket.settimeout(5)  # 5 second timeout
+            peer_socket.connect((ip_address, port))
+
+            # Send initial message with our username and listening port
+            peer_socket.send(f"{self.username}:{self._control('HELLO')}".encode('utf-8'))
+
+            # Wait for response
+            response = peer_socket.recv(1024).decode('utf-8')
+            parts = response.split(':', 1)
+            if len(parts) == 2:
+                peer_username, reply = parts
+                control = self._parse_control(reply)
+
+                # Add peer to list under the port it advertises
+                self._add_peer(peer_username, (ip_address, (control and control[1]) or port), track=False)
+
+                return True
+            return False
+        except Exception as e:
+            print(f"Error connecting to peer: {e}")
+            return False
+        finally:
+            if peer_socket:
+                peer_socket.close()
+
+    def send_message_to_peer(self, username, message):
+        """Send a message to a specific peer"""
+        if username not in self.peers:
+            return False
+
+        ip, port = self.peers[username]
+        peer_socket = None
+        try:
+            # Create socket and connect
+            peer_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            peer_socket.settimeout(5)  # 5 second timeout
+            peer_socket.connect((ip, port))
+
+            # Send message
+            peer_socket.send(f"{self.username}:{message}".encode('utf-8'))
+
+            # Wait for acknowledgment
+            peer_socket.recv(1024)
+            return True
+        except Exception as e:
+            print(f"Error sending message to peer: {e}")
+            # Remove peer if we can't connect
+            self._remove_peer(username)
+            return False
+        finally:
+            if peer_socket:
+                peer_socket.close()
+
+    def broadcast_message(self, message):
+        """Send a message to all connected peers"""
+        for username in list(self.peers.keys()):
+            self.send_message_to_peer(username, message)
+
+    def set_username(self, username):
+        """Set the user's username"""
+        self.username = username
+
+
+class RelayClient(NetworkCore):
+    """Client for the lobby relay (browser.p2p.relay), with the same surface as P2PNetworkCore.
+
+    Instead of a mesh of direct connections, the client keeps a single
+    connection to the relay, which fans lobby traffic out to every member.
+    """
+
+    def __init__(self, username=None, lobby='General Chat'):
+        super().__init__(username)
+        self.peers = {}  # {username: (relay_host, relay_port)}
+        self.lobby = lobby
+        self.port = RELAY_PORT
+        self.relay_address = None
+        self.relay_socket = None
+        self.reader_thread = None
+        self.is_listening = False
+        self._send_lock = threading.Lock()
+
+    def start_listening(self):
+        """Nothing to listen on; the relay accepts connections for us"""
+        return True
+
+    def stop_listening(self):
+        """Leave the lobby and close the relay connection"""
+        self.is_listening = False
+        self.heartbeat.stop()
+        if self.relay_socket:
+            self._send({'type': 'leave'})
+            # Cleared first so the reader thread leaves the cleanup to us
+            relay_socket, self.relay_socket = self.relay_socket, None
+            try:
+                relay_socket.close()
+            except OSError:
+                pass
+            self._drop_peers()
+
+    def _drop_peers(self):
+        """Announce that everyone in the old lobby has left"""
+        self.presence.forget(self.relay_address)
+        for username in list(self.peers):
+            self._remove_peer(username, flush=False)
+        self._flush_presence()
+
+    def connect_to_peer(self, ip_address, port=None):
+        """Connect to the relay at the given address and join the lobby"""
+        if port is None:
+            port = RELAY_PORT
+        self.stop_listening()
+
+        relay_socket = reader = None
+        joined = False
+        try:
+            relay_socket = socket.create_connection((ip_address, port), timeout=5)
+            relay_socket.sendall(encode_frame(
+                {'type': 'join', 'lobby': self.lobby, 'username': self.username}))
+
+            # Wait for the welcome frame before handing off to the reader thread
+            reader = relay_socket.makefile('rb')
+            welcome = decode_frame(reader.readline(MAX_FRAME_SIZE))
+            if not welcome or welcome.get('type') != 'welcome':
+                reason = welcome.get('reason') if welcome else 'no response'
+                print(f"Relay refused to join {self.lobby}: {reason}")
+                return False
+            relay_socket.settimeout(None)
+            joined = True
+        except Exception as e:
+            print(f"Error connecting to relay: {e}")
+            return False
+        finally:
+            if not joined:
+                # Don't leak a descriptor on every failed attempt
+                for stream in (reader, relay_socket):
+                    if stream:
+                        stream.close()
+
+        self.relay_socket = relay_socket
+        self.relay_address = (ip_address, port)
+        self.port = port
+        self.is_listening = True
+        self.username = welcome.get('username', self.username)
+
+        # Only the relay connection itself needs a liveness deadline; the
+        # relay reports members that go quiet as having left
+        self.presence.track(self.relay_address)
+        self.heartbeat.start()
+        for member in welcome.get('members', []):
+            if member != self.username:
+                self._add_peer(member, self.relay_address, track=False)
+        for entry in welcome.get('history', []):
+            self._emit('message_received', entry['username'], entry['text'], entry['timestamp'])
+
+        self.reader_thread = threading.Thread(
+            target=self._read_frames, args=(relay_socket, reader))
+        self.reader_thread.daemon = True
+        self.reader_thread.start()
+        return True
+
+    def _read_frames(self, relay_socket, reader):
+        """Thread function dispatching frames pushed by the relay"""
+        try:
+            for line in iter(lambda: reader.readline(MAX_FRAME_SIZE), b''):
+                self.presence.seen(self.relay_address)
+                frame = decode_frame(line)
+                if frame:
+                    self._handle_frame(frame)
+        except Exception as e:
+            if self.is_listening:
+                print(f"Relay connection lost: {e}")
+        finally:
+            if self.relay_socket is relay_socket:
+                self.is_listening = False
+                self.relay_socket = None
+                self.heartbeat.stop()
+                self._drop_peers()
+
+    def _handle_frame(self, frame):
+        """Translate a relay frame into core events"""
+        frame_type = frame.get('type')
+        if frame_type == 'message':
+            self._emit('message_received', frame['username'], frame['text'], frame['timestamp'])
+        elif frame_type == 'joined':
+            username = frame['username']
+            if username != self.username:
+                self._add_peer(username, self.relay_address, track=False)
+        elif frame_type == 'left':
+            self._remove_peer(frame['username'])
+        elif frame_type == 'renamed':
+            old, new = frame['old'], frame['username']
+            if old == self.username:
+                self.username = new
+            elif old in self.peers:
+                self._remove_peer(old)
+                self._add_peer(new, self.relay_address, track=False)
+        elif frame_type == 'error':
+            print(f"Relay error: {frame.get('reason')}")
+
+    def _send_heartbeats(self):
+        self._send({'type': 'ping'})
+
+    def _peer_timed_out(self, key):
+        """The relay stopped answering; drop the connection"""
+        print(f"Relay at {key[0]}:{key[1]} stopped answering heartbeats")
+        relay_socket = self.relay_socket
+        if relay_socket:
+            try:
+                relay_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _send(self, frame):
+        """Write one frame to the relay connection"""
+        if not self.relay_socket:
+            return False
+        try:
+            with self._send_lock:
+                self.relay_socket.sendall(encode_frame(frame))
+            return True
+        except OSError as e:
+            print(f"Error sending to relay: {e}")
+            return False
+
+    def send_message_to_peer(self, username, message):
+        """Send a direct message to one lobby member via the relay"""
+        if username not in self.peers:
+            return False
+        return self._send({'type': 'message', 'text': message, 'to': username})
+
+    def broadcast_message(self, message):
+        """Send a message to the whole lobby"""
+        return self._send({'type': 'message', 'text': message})
+
+    def set_username(self, username):
+        """Set the user's username, renaming it on the relay if connected"""
+        if not self._send({'type': 'rename', 'username': username}):
+            self.username = username
+
+
+def main():
+    """Run a headless P2P node that logs chat traffic to stdout"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Headless P2P chat node")
+    parser.add_argument('--port', type=int, default=EndpointConfig.DEFAULT_PORT,
+                        help="preferred port, 0 for an ephemeral one")
+    parser.add_argument('--username', default=None)
+    parser.add_argument('--reuse-port', action='store_true',
+                        help="bind with SO_REUSEPORT so several processes can share the port")
+    parser.add_argument('--listeners', type=int, default=1,
+                        help="accepting sockets to open when --reuse-port is set")
+    args = parser.parse_args()
+
+    config = EndpointConfig(port=args.port, reuse_port=args.reuse_port, listeners=args.listeners)
+    core = P2PNetworkCore(username=args.username, config=config)
+
+    async def run():
+        if not core.start_listening():
+            return 1
+        try:
+            async for event, event_args in core.events():
+                print(f"[{event}] " + " | ".join(str(arg) for arg in event_args))
+        finally:
+            core.stop_listening()
+
+    try:
+        return asyncio.run(run())
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
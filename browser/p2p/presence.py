@@ -0,0 +1,158 @@
+"""Peer liveness tracking for the chat network cores.
+
+A single hashed timer wheel holds every peer's deadline, so rescheduling on
+each heartbeat and expiring on each tick are constant time no matter how
+many peers are tracked, and one HeartbeatLoop thread serves a whole core
+instead of one timer per peer.
+"""
+import math
+import threading
+import time
+
+PING_INTERVAL = 2.0  # Seconds between heartbeats
+PEER_TIMEOUT = 6.0  # Seconds without traffic before a peer is considered gone
+TICK_INTERVAL = 0.5
+
+
+class TimerWheel:
+    def __init__(self, tick_interval=TICK_INTERVAL, slots=64):
+        self.tick_interval = tick_interval
+        self.slots = [{} for _ in range(slots)]  # [{key: remaining rounds}]
+        self.positions = {}  # {key: slot index}
+        self.current = 0
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    def schedule(self, key, delay):
+        """(Re)schedule key to expire after delay seconds"""
+        self.cancel(key)
+        ticks = max(1, math.ceil(delay / self.tick_interval))
+        slot = (self.current + ticks) % len(self.slots)
+        self.slots[slot][key] = (ticks - 1) // len(self.slots)
+        self.positions[key] = slot
+
+    def cancel(self, key):
+        slot = self.positions.pop(key, None)
+        if slot is not None:
+            del self.slots[slot][key]
+
+    def tick(self):
+        """Advance one tick and return the keys that expired"""
+        self.current = (self.current + 1) % len(self.slots)
+        bucket = self.slots[self.current]
+        expired = []
+        for key, rounds in list(bucket.items()):
+            if rounds:
+                bucket[key] = rounds - 1
+            else:
+                del bucket[key]
+                del self.positions[key]
+                expired.append(key)
+        return expired
+
+
+class PresenceTracker:
+    """Peer deadlines plus a batch of presence changes since the last drain"""
+
+    def __init__(self, timeout=PEER_TIMEOUT, tick_interval=TICK_INTERVAL):
+        self.timeout = timeout
+        self.tick_interval = tick_interval
+        self.wheel = TimerWheel(tick_interval)
+        self._joined = {}  # Ordered sets of usernames
+        self._left = {}
+        self._lock = threading.Lock()
+
+    def track(self, key):
+        """Start (or restart) the liveness deadline for key"""
+        with self._lock:
+            self.wheel.schedule(key, self.timeout)
+
+    def seen(self, key):
+        """Push back the deadline of a tracked key after hearing from it"""
+        with self._lock:
+            if key in self.wheel:
+                self.wheel.schedule(key, self.timeout)
+
+    def forget(self, key):
+        with self._lock:
+            self.wheel.cancel(key)
+
+    def tick(self):
+        with self._lock:
+            return self.wheel.tick()
+
+    def mark_joined(self, username):
+        with self._lock:
+            # A peer that left and came back within one batch never changed
+            if username in self._left:
+                del self._left[username]
+            else:
+                self._joined[username] = None
+
+    def mark_left(self, username):
+        with self._lock:
+            if username in self._joined:
+                del self._joined[username]
+            else:
+                self._left[username] = None
+
+    def drain(self):
+        """Return and reset the (joined, left) usernames batched so far"""
+        with self._lock:
+            joined, left = list(self._joined), list(self._left)
+            self._joined.clear()
+            self._left.clear()
+        return joined, left
+
+
+class HeartbeatLoop:
+    """One thread that pings peers, expires deadlines and flushes presence"""
+
+    def __init__(self, tracker, send_pings, on_timeout, on_presence, ping_interval=PING_INTERVAL):
+        self.tracker = tracker
+        self.send_pings = send_pings
+        self.on_timeout = on_timeout
+        self.on_presence = on_presence
+        self.ping_interval = ping_interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    def start(self):
+        if self.running:
+            return
+        if self._thread and self._thread is not threading.current_thread():
+            # A stopped loop wakes within one tick; let it finish before restarting
+            self._thread.join()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        next_ping = 0
+        while not self._stop.wait(self.tracker.tick_interval):
+            try:
+                now = time.monotonic()
+                if now >= next_ping:
+                    self.send_pings()
+                    next_ping = now + self.ping_interval
+
+                for key in self.tracker.tick():
+                    self.on_timeout(key)
+
+                joined, left = self.tracker.drain()
+                if joined or left:
+                    self.on_presence(joined, left)
+            except Exception as e:
+                print(f"Error in heartbeat loop: {e}")
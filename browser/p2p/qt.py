@@ -0,0 +1,118 @@
+"""Qt side of the P2P stack: signals for network events, delivered to the GUI
+thread in batches.
+"""
+from collections import deque
+from PyQt6.QtCore import QTimer, pyqtSignal, QObject
+from browser.p2p.core import P2PNetworkCore
+
+class P2PNetworkManager(QObject):
+    """Qt adapter re-emitting P2PNetworkCore events as signals"""
+    message_received = pyqtSignal(str, str, str)  # username, message, timestamp
+    peer_connected = pyqtSignal(str)  # username
+    peer_disconnected = pyqtSignal(str)  # username
+    presence_changed = pyqtSignal(list, list)  # joined usernames, left usernames
+    
+    def __init__(self, parent=None, core=None):
+        super().__init__(parent)
+        self.core = core or P2PNetworkCore()
+        self.core.on('message_received', self.message_received.emit)
+        self.core.on('peer_connected', self.peer_connected.emit)
+        self.core.on('peer_disconnected', self.peer_disconnected.emit)
+        self.core.on('presence_changed', self.presence_changed.emit)
+    
+    @property
+    def username(self):
+        return self.core.username
+    
+    @property
+    def peers(self):
+        return self.core.peers
+    
+    @property
+    def port(self):
+        return self.core.port
+    
+    @property
+    def is_listening(self):
+        return self.core.is_listening
+    
+    def start_listening(self):
+        """Start listening for incoming connections"""
+        return self.core.start_listening()
+    
+    def stop_listening(self):
+        """Stop listening for connections"""
+        self.core.stop_listening()
+    
+    def connect_to_peer(self, ip_address, port=None):
+        """Connect to a peer at the given IP address"""
+        return self.core.connect_to_peer(ip_address, port)
+    
+    def send_message_to_peer(self, username, message):
+        """Send a message to a specific peer"""
+        return self.core.send_message_to_peer(username, message)
+    
+    def broadcast_message(self, message):
+        """Send a message to all connected peers"""
+        self.core.broadcast_message(message)
+    
+    def set_username(self, username):
+        """Set the user's username"""
+        self.core.set_username(username)
+
+class NetworkEventBridge(QObject):
+    """Coalesces network events into at most one GUI update per frame.
+
+    Network threads append to a deque (atomic, no locks taken) and wake the
+    GUI thread only when the queue goes from idle to pending; the GUI thread
+    then drains everything that arrived during the frame in one batch.
+    """
+    batch_ready = pyqtSignal(list)  # [(event, args)]
+    _wake = pyqtSignal()
+    
+    FRAME_INTERVAL_MS = 16
+    
+    def __init__(self, network, parent=None):
+        super().__init__(parent)
+        self.core = network.core
+        self.queue = deque()
+        self._scheduled = False
+        
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setInterval(self.FRAME_INTERVAL_MS)
+        self.frame_timer.timeout.connect(self._drain)
+        # Emitted from network threads, so delivered queued on the GUI thread
+        self._wake.connect(self.frame_timer.start)
+        
+        self._handlers = {event: (lambda *args, event=event: self.push(event, args))
+                          for event in self.core.EVENTS}
+        for event, handler in self._handlers.items():
+            self.core.on(event, handler)
+    
+    def push(self, event, args=()):
+        """Queue an event from any thread"""
+        self.queue.append((event, args))
+        if not self._scheduled:
+            self._scheduled = True
+            self._wake.emit()
+    
+    def post_system_message(self, text):
+        """Queue a chat system message from any thread"""
+        self.push('system_message', (text,))
+    
+    def _drain(self):
+        # Clear the flag first so events pushed while draining wake us again
+        self._scheduled = False
+        events = []
+        while self.queue:
+            events.append(self.queue.popleft())
+        if events:
+            self.batch_ready.emit(events)
+    
+    def close(self):
+        """Stop receiving events from the network core"""
+        for event, handler in self._handlers.items():
+            self.core.off(event, handler)
+        self.frame_timer.stop()
+        self.queue.clear()
@@ -0,0 +1,226 @@
+"""Headless lobby relay for the browser's "Server Hosted" chat mode.
+
+Clients open a single TCP connection, join a lobby and exchange
+newline-delimited JSON frames (see browser.p2p.core.encode_frame). The relay
+keeps lobby membership and a short message history, and fans each message out
+to the lobby's members, so a lobby of N users costs N connections instead of
+an N-to-N mesh.
+
+Run with ``python -m browser.p2p.relay --host 0.0.0.0 --port 55600`` (or the
+lobby_relay.py launcher in the repository root).
+"""
+import argparse
+import asyncio
+from collections import deque
+from datetime import datetime
+
+from browser.p2p.core import RELAY_PORT, MAX_FRAME_SIZE, encode_frame, decode_frame
+from browser.p2p.presence import TimerWheel, PEER_TIMEOUT, TICK_INTERVAL
+
+HISTORY_SIZE = 100  # Messages replayed to members when they join
+WRITE_BUFFER_LIMIT = 1024 * 1024  # Disconnect clients that stop reading
+
+
+class Lobby:
+    def __init__(self, name, history_size=HISTORY_SIZE):
+        self.name = name
+        self.members = {}  # {username: ClientSession}
+        self.history = deque(maxlen=history_size)
+
+    def broadcast(self, frame, exclude=None):
+        """Send a frame to every member, encoding it only once"""
+        data = encode_frame(frame)
+        for session in list(self.members.values()):
+            if session is not exclude:
+                session.send_raw(data)
+
+
+class ClientSession:
+    def __init__(self, writer):
+        self.writer = writer
+        self.username = None
+        self.lobby = None
+        self.peer = writer.get_extra_info('peername')
+
+    def send(self, frame):
+        self.send_raw(encode_frame(frame))
+
+    def send_raw(self, data):
+        """Queue bytes for the client without waiting for it to drain"""
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+            print(f"Dropping slow client {self.username} at {self.peer}")
+            self.writer.close()
+            return
+        self.writer.write(data)
+
+
+class LobbyRelay:
+    def __init__(self, history_size=HISTORY_SIZE):
+        self.history_size = history_size
+        self.lobbies = {}  # {name: Lobby}
+        self.idle_deadlines = TimerWheel(TICK_INTERVAL)  # {ClientSession: deadline}
+
+    async def handle_client(self, reader, writer):
+        """Serve one client connection until it disconnects"""
+        session = ClientSession(writer)
+        # Silent clients time out too, not only ones that went quiet after joining
+        self.idle_deadlines.schedule(session, PEER_TIMEOUT)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    session.send({'type': 'error', 'reason': 'frame too large'})
+                    break
+                if not line:
+                    break
+
+                # Any frame, pings included, proves the client is alive
+                self.idle_deadlines.schedule(session, PEER_TIMEOUT)
+                frame = decode_frame(line)
+                if frame is None:
+                    session.send({'type': 'error', 'reason': 'malformed frame'})
+                    continue
+                if not self.dispatch(session, frame):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.idle_deadlines.cancel(session)
+            self.leave(session)
+            writer.close()
+
+    def dispatch(self, session, frame):
+        """Handle one frame; returns False when the session should end"""
+        frame_type = frame.get('type')
+        if frame_type == 'ping':
+            session.send({'type': 'pong'})
+        elif frame_type == 'join':
+            self.join(session, str(frame.get('lobby', '')), str(frame.get('username', '')))
+        elif session.lobby is None:
+            session.send({'type': 'error', 'reason': 'join a lobby first'})
+        elif frame_type == 'message':
+            self.relay_message(session, str(frame.get('text', '')), frame.get('to'))
+        elif frame_type == 'rename':
+            self.rename(session, str(frame.get('username', '')))
+        elif frame_type == 'leave':
+            return False
+        else:
+            session.send({'type': 'error', 'reason': f'unknown frame type {frame_type!r}'})
+        return True
+
+    def _unique_username(self, lobby, username):
+        """Suffix a username until it is free within the lobby"""
+        candidate = username
+        suffix = 2
+        while candidate in lobby.members:
+            candidate = f"{username}_{suffix}"
+            suffix += 1
+        return candidate
+
+    def join(self, session, lobby_name, username):
+        if not lobby_name or not username:
+            session.send({'type': 'error', 'reason': 'lobby and username are required'})
+            return
+        self.leave(session)
+
+        lobby = self.lobbies.get(lobby_name)
+        if lobby is None:
+            lobby = self.lobbies[lobby_name] = Lobby(lobby_name, self.history_size)
+
+        session.username = self._unique_username(lobby, username)
+        session.lobby = lobby
+        session.send({
+            'type': 'welcome',
+            'lobby': lobby_name,
+            'username': session.username,
+            'members': list(lobby.members),
+            'history': list(lobby.history),
+        })
+        lobby.members[session.username] = session
+        lobby.broadcast({'type': 'joined', 'username': session.username}, exclude=session)
+
+    def leave(self, session):
+        lobby = session.lobby
+        if lobby is None:
+            return
+        session.lobby = None
+        if lobby.members.get(session.username) is session:
+            del lobby.members[session.username]
+            lobby.broadcast({'type': 'left', 'username': session.username})
+        if not lobby.members:
+            # Keep memory bounded by lobbies that actually have members
+            del self.lobbies[lobby.name]
+
+    def relay_message(self, session, text, to=None):
+        if not text:
+            return
+        entry = {
+            'type': 'message',
+            'username': session.username,
+            'text': text,
+            'timestamp': datetime.now().strftime("%H:%M"),
+        }
+        if to is not None:
+            target = session.lobby.members.get(to)
+            if target is None:
+                session.send({'type': 'error', 'reason': f'no such member {to!r}'})
+            else:
+                target.send(entry)
+            return
+        session.lobby.history.append(entry)
+        session.lobby.broadcast(entry, exclude=session)
+
+    def rename(self, session, username):
+        lobby = session.lobby
+        if not username or username == session.username:
+            return
+        old = session.username
+        new = self._unique_username(lobby, username)
+        del lobby.members[old]
+        lobby.members[new] = session
+        session.username = new
+        lobby.broadcast({'type': 'renamed', 'old': old, 'username': new})
+
+    async def reap_idle_clients(self):
+        """Disconnect clients whose heartbeats stopped, one wheel tick at a time"""
+        while True:
+            await asyncio.sleep(TICK_INTERVAL)
+            for session in self.idle_deadlines.tick():
+                print(f"Client {session.username} at {session.peer} timed out")
+                session.writer.close()
+
+    async def serve(self, host='0.0.0.0', port=RELAY_PORT):
+        """Accept clients forever"""
+        reaper = asyncio.create_task(self.reap_idle_clients())
+        server = await asyncio.start_server(
+            self.handle_client, host, port, limit=MAX_FRAME_SIZE, reuse_address=True)
+        addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Lobby relay listening on {addresses}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            reaper.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lobby relay for Server Hosted chat")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=RELAY_PORT)
+    parser.add_argument('--history', type=int, default=HISTORY_SIZE,
+                        help="messages replayed to members when they join")
+    args = parser.parse_args()
+
+    relay = LobbyRelay(history_size=args.history)
+    try:
+        asyncio.run(relay.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
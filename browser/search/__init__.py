@@ -0,0 +1 @@
+"""The search page (tab) and its site directory (sites, no Qt)."""
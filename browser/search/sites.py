@@ -0,0 +1,77 @@
+"""The site directory shown on the search page, and matching against it.
+
+Kept free of Qt so searches can be run and measured without a GUI.
+"""
+
+WEBSITES = [
+    {
+        'url': 'https://www.python.org',
+        'title': 'Python Programming Language',
+        'description': 'The official home of the Python Programming Language'
+    },
+    {
+        'url': 'https://www.wikipedia.org',
+        'title': 'Wikipedia - The Free Encyclopedia',
+        'description': 'The free encyclopedia that anyone can edit'
+    },
+    {
+        'url': 'https://www.github.com',
+        'title': 'GitHub: Where the world builds software',
+        'description': 'GitHub is where over 100 million developers shape the future of software'
+    },
+    {
+        'url': 'https://www.stackoverflow.com',
+        'title': 'Stack Overflow - Where Developers Learn & Share',
+        'description': 'Stack Overflow is the largest, most trusted online community for developers'
+    },
+    {
+        'url': 'https://www.reddit.com',
+        'title': 'Reddit - Dive into anything',
+        'description': 'Reddit is home to thousands of communities, endless conversation, and authentic human connection'
+    },
+    {
+        'url': 'https://www.youtube.com',
+        'title': 'YouTube',
+        'description': 'Enjoy the videos and music you love, upload original content, and share it all with friends, family, and the world'
+    },
+    {
+        'url': 'https://www.geekparadize.fr',
+        'title': 'GeekParadize - Le paradis des Geeks',
+        'description': 'Toute l\'actualité Geek, High-Tech, et Gaming'
+    },
+    {
+        'url': 'https://www.amazon.com',
+        'title': 'Amazon.com: Online Shopping',
+        'description': 'Online shopping from the earth\'s biggest selection'
+    },
+    {
+        'url': 'https://www.netflix.com',
+        'title': 'Netflix - Watch TV Shows & Movies',
+        'description': 'Watch Netflix movies & TV shows online or stream right to your smart TV'
+    },
+    {
+        'url': 'https://www.spotify.com',
+        'title': 'Spotify - Music for Everyone',
+        'description': 'Spotify is a digital music service that gives you access to millions of songs'
+    },
+]
+
+# Which directory sites count as server or cloud hosted, matched against the URL
+HOSTING_KEYWORDS = {
+    'server': ('github', 'python', 'stackoverflow'),
+    'cloud': ('youtube', 'netflix', 'spotify', 'amazon'),
+}
+
+
+def search_sites(websites, query):
+    """Sites whose title, URL or description contains query (already lower-case)"""
+    return [site for site in websites
+            if query in site['title'].lower() or
+            query in site['url'].lower() or
+            query in site['description'].lower()]
+
+
+def sites_for_hosting(websites, hosting_type):
+    """Sites of a hosting type ('server' or 'cloud')"""
+    keywords = HOSTING_KEYWORDS.get(hosting_type, ())
+    return [site for site in websites if any(keyword in site['url'].lower() for keyword in keywords)]
@@ -0,0 +1,483 @@
+"""The search page: the site directory as tiles, and search results as cards."""
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
+                             QLabel, QScrollArea, QFrame)
+from PyQt6.QtGui import QIcon, QFont, QPalette
+from browser.themes.stylesheet import tint_for, with_alpha
+from browser.search.sites import WEBSITES, search_sites, sites_for_hosting
+
+class SearchTab(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.browser = parent
+        self.setup_ui()
+        
+        # List of websites to search
+        self.websites = list(WEBSITES)
+        
+        # Show all websites initially
+        self.show_all_websites()
+    
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        # Search header
+        header_widget = QWidget()
+        header_layout = QVBoxLayout()
+        header_layout.setContentsMargins(0, 0, 0, 30)
+        
+        # Logo
+        logo_label = QLabel('Visual Engine')
+        logo_font = QFont()
+        logo_font.setPointSize(40)
+        logo_font.setBold(True)
+        logo_label.setFont(logo_font)
+        logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        logo_label.setObjectName("searchLogo")
+        header_layout.addWidget(logo_label)
+        
+        # Search box container
+        search_container = QWidget()
+        search_layout = QHBoxLayout()
+        search_layout.setContentsMargins(0, 0, 0, 0)
+
+        
+        # Search box
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText('Search the web...')
+        self.search_box.setMinimumHeight(60)
+        self.search_box.setFixedWidth(1200)  # Set fixed width for the search box
+        self.search_box.setObjectName("searchBox")
+        self.search_box.returnPressed.connect(self.perform_search)
+        search_layout.addWidget(self.search_box)
+        
+        # Send button for search
+        send_btn = QPushButton()
+        send_btn.setIcon(QIcon('svg/send.svg'))
+        send_btn.setIconSize(QSize(24, 24))
+        send_btn.setFixedSize(40, 40)
+        send_btn.setObjectName("iconButton")
+        send_btn.clicked.connect(self.perform_search)  # Connect to perform_search
+        search_layout.addWidget(send_btn)
+        
+        search_container.setLayout(search_layout)
+        header_layout.addWidget(search_container)
+        
+        header_widget.setLayout(header_layout)
+        layout.addWidget(header_widget)
+        
+        # Results area
+        scroll = QScrollArea()
+        scroll.setObjectName("resultsArea")
+        
+        self.results_widget = QWidget()
+        self.results_layout = QVBoxLayout()
+        self.results_layout.setContentsMargins(20, 20, 20, 20)
+        self.results_layout.setSpacing(15)
+        self.results_widget.setLayout(self.results_layout)
+        
+        scroll.setWidget(self.results_widget)
+        scroll.setWidgetResizable(True)
+        layout.addWidget(scroll)
+        
+        # Set initial focus to search box
+        self.search_box.setFocus()
+    
+    def show_all_websites(self):
+        # Clear previous results
+        for i in reversed(range(self.results_layout.count())): 
+            self.results_layout.itemAt(i).widget().setParent(None)
+        
+        # Create a grid for popular websites
+        grid_widget = QWidget()
+        grid_layout = QHBoxLayout()
+        grid_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        grid_layout.setSpacing(30)
+        
+        # Add the first 8 websites as icons in a grid
+        sites_per_row = 4
+        row_count = (min(len(self.websites), 8) + sites_per_row - 1) // sites_per_row
+        
+        for row in range(row_count):
+            row_widget = QWidget()
+            row_layout = QHBoxLayout()
+            row_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            row_layout.setSpacing(40)
+            
+            for col in range(sites_per_row):
+                idx = row * sites_per_row + col
+                if idx >= min(len(self.websites), 8):
+                    break
+                    
+                site = self.websites[idx]
+                site_widget = QWidget()
+                site_layout = QVBoxLayout()
+                site_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                
+                # Site icon/button
+                site_btn = QPushButton()
+                site_btn.setFixedSize(100, 100)
+                site_btn.setObjectName("siteTile")
+                # The tile color comes from the site, not the theme
+                site_btn.setProperty("tint", tint_for(site['url']))
+                site_btn.setText(site['title'][0].upper())
+                site_btn.clicked.connect(lambda checked, url=site['url']: self.open_url(url))
+                
+                # Site name
+                site_name = QLabel(site['title'].split(' ')[0])
+                site_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                site_name.setObjectName("siteName")
+                
+                site_layout.addWidget(site_btn)
+                site_layout.addWidget(site_name)
+                site_widget.setLayout(site_layout)
+                
+                row_layout.addWidget(site_widget)
+            
+            row_widget.setLayout(row_layout)
+            self.results_layout.addWidget(row_widget)
+        
+        # Add a separator
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
+        separator.setObjectName("sectionSeparator")
+        self.results_layout.addWidget(separator)
+        
+        # Add all websites in a more compact list format
+        all_sites_label = QLabel("All Sites")
+        all_sites_font = QFont()
+        all_sites_font.setPointSize(18)
+        all_sites_font.setBold(True)
+        all_sites_label.setFont(all_sites_font)
+        all_sites_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        all_sites_label.setObjectName("sectionTitle")
+        self.results_layout.addWidget(all_sites_label)
+        
+        # Create a grid for all websites
+        sites_grid = QWidget()
+        sites_grid_layout = QVBoxLayout()
+        
+        # Display all websites in a two-column grid
+        for i in range(0, len(self.websites), 2):
+            row_widget = QWidget()
+            row_layout = QHBoxLayout()
+            
+            # First column
+            self.add_compact_result(row_layout, self.websites[i])
+            
+            # Second column (if available)
+            if i + 1 < len(self.websites):
+                self.add_compact_result(row_layout, self.websites[i + 1])
+            
+            row_widget.setLayout(row_layout)
+            sites_grid_layout.addWidget(row_widget)
+        
+        sites_grid.setLayout(sites_grid_layout)
+        self.results_layout.addWidget(sites_grid)
+    
+    def add_compact_result(self, layout, site):
+        # Create result container
+        result_widget = QFrame()
+        result_widget.setFrameStyle(QFrame.Shape.StyledPanel)
+        result_widget.setObjectName("resultCard")
+        result_widget.setProperty("compact", True)
+        
+        result_layout = QVBoxLayout()
+        
+        # Title (clickable)
+        title_label = QLabel(f'<a href="{site["url"]}" style="text-decoration: none;">{site["title"]}</a>')
+        title_label.setTextFormat(Qt.TextFormat.RichText)
+        title_label.setOpenExternalLinks(False)  # Handle clicks ourselves
+        title_label.linkActivated.connect(self.open_url)
+        title_font = QFont()
+        title_font.setPointSize(14)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        result_layout.addWidget(title_label)
+        
+        # URL
+        url_label = QLabel(site["url"])
+        url_label.setTextFormat(Qt.TextFormat.PlainText)
+        url_label.setObjectName("resultUrl")
+        result_layout.addWidget(url_label)
+        
+        # Description
+        desc_label = QLabel(site["description"])
+        desc_label.setWordWrap(True)
+        desc_label.setObjectName("resultDescription")
+        result_layout.addWidget(desc_label)
+        
+        result_widget.setLayout(result_layout)
+        layout.addWidget(result_widget)
+    
+    def add_result(self, title, url, description):
+        # Create result container
+        result_widget = QFrame()
+        result_widget.setFrameStyle(QFrame.Shape.NoFrame)
+        result_layout = QVBoxLayout()
+        
+        # Title (clickable)
+        title_label = QLabel(f'<a href="{url}" style="text-decoration: none;">{title}</a>')
+        title_label.setTextFormat(Qt.TextFormat.RichText)
+        title_label.setOpenExternalLinks(False)  # Handle clicks ourselves
+        title_label.linkActivated.connect(self.open_url)
+        title_font = QFont()
+        title_font.setPointSize(18)
+        title_label.setFont(title_font)
+        result_layout.addWidget(title_label)
+        
+        # URL
+        url_label = QLabel(url)
+        url_label.setTextFormat(Qt.TextFormat.PlainText)
+        url_label.setObjectName("resultUrl")
+        result_layout.addWidget(url_label)
+        
+        # Description
+        desc_label = QLabel(description)
+        desc_label.setWordWrap(True)
+        result_layout.addWidget(desc_label)
+        
+        result_widget.setLayout(result_layout)
+        self.results_layout.addWidget(result_widget)
+        
+        # Add separator
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
+        self.results_layout.addWidget(separator)
+    
+    def open_url(self, url):
+        # Open URL in the browser
+        if self.browser:
+            self.browser.navigate_to_url_external(url)
+    
+    def perform_search(self):
+        # Clear previous results
+        for i in reversed(range(self.results_layout.count())): 
+            self.results_layout.itemAt(i).widget().setParent(None)
+        
+        query = self.search_box.text().strip().lower()
+        if not query:
+            self.show_all_websites()
+            return
+        
+        # Add search header
+        search_header = QLabel(f'Search results for "{query}"')
+        search_header.setObjectName("resultsHeader")
+        self.results_layout.addWidget(search_header)
+        
+        # Search through websites
+        results = search_sites(self.websites, query)
+        
+        if not results:
+            no_results = QLabel('No results found')
+            no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            no_results.setObjectName("emptyResults")
+            self.results_layout.addWidget(no_results)
+            
+            # Add suggestions
+            suggestions = QLabel('Try searching for:')
+            suggestions.setObjectName("suggestionsLabel")
+            self.results_layout.addWidget(suggestions)
+            
+            # Add some suggested searches
+            suggested_terms = ["python", "programming", "web", "technology", "news"]
+            suggestions_layout = QHBoxLayout()
+            
+            for term in suggested_terms:
+                suggestion_btn = QPushButton(term)
+                suggestion_btn.setObjectName("suggestionButton")
+                suggestion_btn.clicked.connect(lambda checked, t=term: self.search_for_term(t))
+                suggestions_layout.addWidget(suggestion_btn)
+            
+            suggestions_container = QWidget()
+            suggestions_container.setLayout(suggestions_layout)
+            self.results_layout.addWidget(suggestions_container)
+            
+            return
+        
+        # Display results count
+        results_count = QLabel(f"Found {len(results)} results")
+        results_count.setObjectName("resultsCount")
+        self.results_layout.addWidget(results_count)
+        
+        # Create a grid for search results
+        results_grid = QWidget()
+        results_grid_layout = QVBoxLayout()
+        results_grid_layout.setSpacing(15)
+        
+        # Matches are marked in a translucent shade of the theme's highlight color
+        highlight = QApplication.palette().color(QPalette.ColorRole.Highlight).name()
+        mark = f'<span style="background-color: {with_alpha(highlight, 0.2)};">{query}</span>'
+        
+        # Display results in a grid
+        for site in results:
+            result_widget = QFrame()
+            result_widget.setFrameStyle(QFrame.Shape.StyledPanel)
+            result_widget.setObjectName("resultCard")
+            
+            result_layout = QVBoxLayout()
+            
+            # Title with highlighted query
+            title = site['title']
+            highlighted_title = title.replace(query, mark) if query in title.lower() else title
+            
+            title_label = QLabel(f'<a href="{site["url"]}" style="text-decoration: none;">{highlighted_title}</a>')
+            title_label.setTextFormat(Qt.TextFormat.RichText)
+            title_label.setOpenExternalLinks(False)  # Handle clicks ourselves
+            title_label.linkActivated.connect(self.open_url)
+            title_font = QFont()
+            title_font.setPointSize(16)
+            title_font.setBold(True)
+            title_label.setFont(title_font)
+            result_layout.addWidget(title_label)
+            
+            # URL with highlighted query
+            url = site['url']
+            highlighted_url = url.replace(query, mark) if query in url.lower() else url
+            
+            url_label = QLabel(highlighted_url)
+            url_label.setTextFormat(Qt.TextFormat.RichText)
+            url_label.setObjectName("resultUrl")
+            result_layout.addWidget(url_label)
+            
+            # Description with highlighted query
+            description = site['description']
+            highlighted_desc = description.replace(query, mark) if query in description.lower() else description
+            
+            desc_label = QLabel(highlighted_desc)
+            desc_label.setWordWrap(True)
+            desc_label.setTextFormat(Qt.TextFormat.RichText)
+            desc_label.setObjectName("resultDescription")
+            result_layout.addWidget(desc_label)
+            
+            # Visit button
+            visit_btn = QPushButton("Visit Site")
+            visit_btn.setObjectName("visitButton")
+            visit_btn.clicked.connect(lambda checked, url=site['url']: self.open_url(url))
+            
+            button_container = QWidget()
+            button_layout = QHBoxLayout()
+            button_layout.setContentsMargins(0, 0, 0, 0)
+            button_layout.addWidget(visit_btn)
+            button_layout.addStretch()
+            button_container.setLayout(button_layout)
+            
+            result_layout.addWidget(button_container)
+            
+            result_widget.setLayout(result_layout)
+            results_grid_layout.addWidget(result_widget)
+        
+        results_grid.setLayout(results_grid_layout)
+        self.results_layout.addWidget(results_grid)
+    
+    def search_for_term(self, term):
+        self.search_box.setText(term)
+        self.perform_search()
+
+    def filter_by_hosting(self, hosting_type):
+        # Clear previous results
+        for i in reversed(range(self.results_layout.count())): 
+            self.results_layout.itemAt(i).widget().setParent(None)
+        
+        # Add header
+        header = QLabel(f"{hosting_type.capitalize()} Hosted Services")
+        header.setObjectName("pageHeader")
+        header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.results_layout.addWidget(header)
+        
+        # Filter websites based on hosting type
+        filtered_sites = sites_for_hosting(self.websites, hosting_type)
+        
+        if not filtered_sites:
+            no_results = QLabel(f'No {hosting_type}-hosted services found')
+            no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            no_results.setObjectName("emptyResults")
+            self.results_layout.addWidget(no_results)
+            return
+        
+        # Display results count
+        results_count = QLabel(f"Found {len(filtered_sites)} {hosting_type}-hosted services")
+        results_count.setObjectName("resultsCount")
+        self.results_layout.addWidget(results_count)
+        
+        # Display results in a grid
+        results_grid = QWidget()
+        results_grid_layout = QVBoxLayout()
+        results_grid_layout.setSpacing(15)
+        
+        for site in filtered_sites:
+            result_widget = QFrame()
+            result_widget.setFrameStyle(QFrame.Shape.StyledPanel)
+            result_widget.setObjectName("resultCard")
+            
+            result_layout = QVBoxLayout()
+            
+            # Add hosting badge
+            badge_icon = "svg/server.svg" if hosting_type == "server" else "svg/cloud.svg"
+            
+            badge_container = QWidget()
+            badge_layout = QHBoxLayout()
+            badge_layout.setContentsMargins(0, 0, 0, 0)
+            badge_layout.setSpacing(5)
+            
+            icon_label = QLabel()
+            icon = QIcon(badge_icon)
+            pixmap = icon.pixmap(QSize(16, 16))
+            icon_label.setPixmap(pixmap)
+            badge_layout.addWidget(icon_label)
+            
+            text_label = QLabel(f'{hosting_type.capitalize()}')
+            badge_layout.addWidget(text_label)
+            
+            badge_container.setLayout(badge_layout)
+            badge_container.setObjectName("hostingBadge")
+            badge_container.setProperty("hosting", hosting_type)
+            
+            result_layout.addWidget(badge_container)
+            
+            # Title
+            title_label = QLabel(f'<a href="{site["url"]}" style="text-decoration: none;">{site["title"]}</a>')
+            title_label.setTextFormat(Qt.TextFormat.RichText)
+            title_label.setOpenExternalLinks(False)
+            title_label.linkActivated.connect(self.open_url)
+            title_font = QFont()
+            title_font.setPointSize(16)
+            title_font.setBold(True)
+            title_label.setFont(title_font)
+            result_layout.addWidget(title_label)
+            
+            # URL
+            url_label = QLabel(site["url"])
+            url_label.setTextFormat(Qt.TextFormat.PlainText)
+            url_label.setObjectName("resultUrl")
+            result_layout.addWidget(url_label)
+            
+            # Description
+            desc_label = QLabel(site["description"])
+            desc_label.setWordWrap(True)
+            desc_label.setObjectName("resultDescription")
+            result_layout.addWidget(desc_label)
+            
+            # Visit button
+            visit_btn = QPushButton("Visit Site")
+            visit_btn.setObjectName("visitButton")
+            visit_btn.setProperty("hosting", hosting_type)
+            visit_btn.clicked.connect(lambda checked, url=site['url']: self.open_url(url))
+            
+            button_container = QWidget()
+            button_layout = QHBoxLayout()
+            button_layout.setContentsMargins(0, 0, 0, 0)
+            button_layout.addWidget(visit_btn)
+            button_layout.addStretch()
+            button_container.setLayout(button_layout)
+            
+            result_layout.addWidget(button_container)
+            
+            result_widget.setLayout(result_layout)
+            results_grid_layout.addWidget(result_widget)
+        
+        results_grid.setLayout(results_grid_layout)
+        self.results_layout.addWidget(results_grid)
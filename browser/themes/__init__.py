@@ -0,0 +1,2 @@
+"""Themes: the compiled theme registry and stylesheet generation (no Qt), plus
+applying themes (manager) and the preview dialog (preview)."""
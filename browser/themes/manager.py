@@ -0,0 +1,113 @@
+"""Applying themes to the application: palette, generated stylesheet and the
+swatch pixmaps shown by the theme preview.
+"""
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPalette, QColor, QPixmap, QPainter
+from browser.themes.registry import DEFAULT_THEMES, ThemeRegistry
+from browser.themes.stylesheet import BASE_COLORS, StyleEngine, parse_rgba
+
+def theme_color(value, default=BASE_COLORS['foreground']):
+    """QColor for a theme color, including the rgb() and hsl() values QColor can't parse"""
+    rgba = parse_rgba(value) or parse_rgba(default)
+    return QColor(rgba[0], rgba[1], rgba[2], round(rgba[3] * 255))
+
+class ThemeManager:
+    SWATCH_SIZE = QSize(120, 64)
+    SWATCH_LIMIT = 512  # Rendered swatches kept for the preview grid
+    
+    def __init__(self):
+        # The themes directory is scanned by load(), after the first frame;
+        # until then only the built-in themes can be applied
+        self.registry = None
+        self.style_engine = StyleEngine()
+        self.current_theme = None
+        self.current_colors = None
+        self.swatches = OrderedDict()  # {theme name: QPixmap}, least recently used first
+    
+    def load(self):
+        """Read the theme index; only names are read, colors are parsed when first used"""
+        if self.registry is None:
+            self.registry = ThemeRegistry()
+        return self.registry
+    
+    def theme_names(self):
+        return self.load().names()
+    
+    def theme_letters(self):
+        return self.load().letters()
+    
+    def get_theme(self, theme_name):
+        return self.load().get(theme_name)
+    
+    def save_cache(self):
+        if self.registry is not None:
+            self.registry.save()
+    
+    def swatch(self, theme_name):
+        """Pixmap of a theme's colors, rendered once and then reused"""
+        pixmap = self.swatches.get(theme_name)
+        if pixmap is not None:
+            self.swatches.move_to_end(theme_name)
+            return pixmap
+        theme = self.get_theme(theme_name)
+        if not theme:
+            return None
+        
+        width, height = self.SWATCH_SIZE.width(), self.SWATCH_SIZE.height()
+        pixmap = QPixmap(self.SWATCH_SIZE)
+        pixmap.fill(theme_color(theme['background']))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        # A title line, two lines of text and an accent button
+        painter.setBrush(theme_color(theme['foreground']))
+        painter.drawRoundedRect(10, 10, width - 40, 8, 4, 4)
+        painter.setBrush(theme_color(theme['sub']))
+        painter.drawRoundedRect(10, 26, width - 20, 6, 3, 3)
+        painter.drawRoundedRect(10, 38, width - 50, 6, 3, 3)
+        painter.setBrush(theme_color(theme['accent']))
+        painter.drawRoundedRect(width - 34, height - 18, 24, 10, 5, 5)
+        painter.end()
+        
+        self.swatches[theme_name] = pixmap
+        if len(self.swatches) > self.SWATCH_LIMIT:
+            self.swatches.popitem(last=False)
+        return pixmap
+    
+    def apply_theme(self, theme_name):
+        """Set the theme once on the application; widgets inherit it"""
+        if self.registry is not None:
+            theme = self.registry.get(theme_name)
+        else:
+            theme = DEFAULT_THEMES.get(theme_name)
+        if not theme or (theme_name == self.current_theme and theme == self.current_colors):
+            return
+        
+        palette = QPalette()
+        
+        # Set main colors
+        palette.setColor(QPalette.ColorRole.Window, theme_color(theme['background']))
+        palette.setColor(QPalette.ColorRole.WindowText, theme_color(theme['foreground']))
+        palette.setColor(QPalette.ColorRole.Base, theme_color(theme['background']))
+        palette.setColor(QPalette.ColorRole.AlternateBase, theme_color(theme['sub']))
+        palette.setColor(QPalette.ColorRole.Text, theme_color(theme['foreground']))
+        
+        # Set button colors
+        palette.setColor(QPalette.ColorRole.Button, theme_color(theme['background']))
+        palette.setColor(QPalette.ColorRole.ButtonText, theme_color(theme['foreground']))
+        
+        # Set highlight colors
+        palette.setColor(QPalette.ColorRole.Highlight, theme_color(theme['accent']))
+        palette.setColor(QPalette.ColorRole.HighlightedText, theme_color(theme['background']))
+        
+        # Set link colors
+        palette.setColor(QPalette.ColorRole.Link, theme_color(theme['accent']))
+        palette.setColor(QPalette.ColorRole.LinkVisited, theme_color(theme['sub']))
+        
+        app = QApplication.instance()
+        app.setPalette(palette)
+        self.style_engine.apply(app, theme)
+        self.current_theme = theme_name
+        self.current_colors = dict(theme)
@@ -0,0 +1,246 @@
+"""Theme preview dialog: a filtered grid of theme swatches with a live preview."""
+from PyQt6.QtCore import (Qt, QSize, QTimer, QAbstractListModel, QModelIndex, QSortFilterProxyModel,
+                          QRect)
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                             QLineEdit, QDialog, QLabel, QComboBox, QListView, QStyle,
+                             QStyledItemDelegate)
+from PyQt6.QtGui import QPalette, QColor, QFont, QPainter
+from browser.themes.registry import theme_category
+from browser.themes.stylesheet import mix
+from browser.themes.manager import theme_color, ThemeManager
+
+class ThemeListModel(QAbstractListModel):
+    """Theme names for the preview grid; colors are only looked up for rows being painted"""
+    CategoryRole = Qt.ItemDataRole.UserRole
+    
+    def __init__(self, names, parent=None):
+        super().__init__(parent)
+        self.names = names
+        self.keys = [name.lower() for name in names]
+        self.categories = [theme_category(name) for name in names]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self.names[index.row()]
+        if role == self.CategoryRole:
+            return self.categories[index.row()]
+        return None
+    
+    def row_of(self, name):
+        try:
+            return self.names.index(name)
+        except ValueError:
+            return -1
+
+class ThemeFilterProxyModel(QSortFilterProxyModel):
+    """Filters themes by name and category without touching the rows' widgets"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.text = ''
+        self.category = ''
+    
+    def set_filter(self, text, category):
+        self.text = text.strip().lower()
+        self.category = category
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if self.category and model.categories[source_row] != self.category:
+            return False
+        return self.text in model.keys[source_row]
+
+class ThemeSwatchDelegate(QStyledItemDelegate):
+    """Paints a grid cell from the theme's cached swatch and its name"""
+    CELL_SIZE = QSize(140, 96)
+    
+    def __init__(self, theme_manager, parent=None):
+        super().__init__(parent)
+        self.theme_manager = theme_manager
+    
+    def sizeHint(self, option, index):
+        return self.CELL_SIZE
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        rect = option.rect
+        name = index.data()
+        pixmap = self.theme_manager.swatch(name)
+        swatch_height = ThemeManager.SWATCH_SIZE.height()
+        if pixmap is not None:
+            painter.drawPixmap(rect.x() + (rect.width() - pixmap.width()) // 2, rect.y() + 6, pixmap)
+        
+        text_rect = QRect(rect.x() + 4, rect.y() + swatch_height + 10, rect.width() - 8,
+                          rect.height() - swatch_height - 12)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        painter.setPen(option.palette.color(
+            QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+                         option.fontMetrics.elidedText(name, Qt.TextElideMode.ElideRight, text_rect.width()))
+        painter.restore()
+
+class ThemePreviewPane(QWidget):
+    """A mock browser window painted in one theme's colors.
+    
+    It paints the colors itself rather than taking a palette, so hovering
+    over themes never re-polishes anything outside this widget.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.theme_name = None
+        self.theme = None
+        self.setMinimumSize(280, 200)
+    
+    def set_theme(self, theme_name, theme):
+        if theme_name == self.theme_name:
+            return
+        self.theme_name = theme_name
+        self.theme = theme
+        self.update()
+    
+    def paintEvent(self, event):
+        if not self.theme:
+            return
+        background = self.theme['background']
+        foreground = self.theme['foreground']
+        accent = self.theme['accent']
+        width = self.width()
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), theme_color(background))
+        
+        # Toolbar with the URL bar
+        painter.fillRect(0, 0, width, 40, theme_color(mix(background, foreground, 0.08)))
+        painter.setPen(theme_color(self.theme.get('border') or mix(background, foreground, 0.15)))
+        painter.setBrush(theme_color(background))
+        painter.drawRoundedRect(12, 8, width - 24, 24, 5, 5)
+        
+        # Page content
+        font = QFont(self.font())
+        font.setBold(True)
+        font.setPointSize(font.pointSize() + 4)
+        painter.setFont(font)
+        painter.setPen(theme_color(foreground))
+        painter.drawText(16, 76, self.theme_name)
+        painter.setFont(self.font())
+        painter.setPen(theme_color(self.theme['sub']))
+        painter.drawText(16, 100, "The quick brown fox jumps over the lazy dog")
+        painter.setPen(theme_color(accent))
+        painter.drawText(16, 124, "A link in this theme")
+        
+        # Accent button
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(theme_color(accent))
+        button = QRect(16, 140, 90, 30)
+        painter.drawRoundedRect(button, 4, 4)
+        painter.setPen(QColor('white'))
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, "Visit")
+        painter.end()
+
+def show_theme_preview(window):
+    dialog = QDialog(window)
+    dialog.setWindowTitle("Theme Preview")
+    dialog.setGeometry(200, 200, 900, 700)
+    
+    layout = QVBoxLayout()
+    
+    # Search and filter section
+    filter_widget = QWidget()
+    filter_layout = QHBoxLayout()
+    
+    # Search box
+    search_label = QLabel("Search:")
+    filter_layout.addWidget(search_label)
+    
+    search_box = QLineEdit()
+    search_box.setPlaceholderText("Search themes...")
+    filter_layout.addWidget(search_box)
+    
+    # Category filter
+    category_label = QLabel("Category:")
+    filter_layout.addWidget(category_label)
+    
+    model = ThemeListModel(window.theme_manager.theme_names(), dialog)
+    category_combo = QComboBox()
+    category_combo.addItem("All")
+    category_combo.addItems(sorted(set(filter(None, model.categories))))
+    filter_layout.addWidget(category_combo)
+    
+    filter_widget.setLayout(filter_layout)
+    layout.addWidget(filter_widget)
+    
+    # Only the visible cells are painted, each from a cached swatch
+    proxy = ThemeFilterProxyModel(dialog)
+    proxy.setSourceModel(model)
+    view = QListView()
+    view.setViewMode(QListView.ViewMode.IconMode)
+    view.setResizeMode(QListView.ResizeMode.Adjust)
+    view.setMovement(QListView.Movement.Static)
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.LayoutMode.Batched)
+    view.setGridSize(ThemeSwatchDelegate.CELL_SIZE + QSize(10, 10))
+    view.setMouseTracking(True)
+    view.setItemDelegate(ThemeSwatchDelegate(window.theme_manager, view))
+    view.setModel(proxy)
+    
+    # Preview and apply on the right
+    preview = ThemePreviewPane()
+    apply_button = QPushButton("Apply")
+    side_layout = QVBoxLayout()
+    side_layout.addWidget(preview)
+    side_layout.addStretch()
+    side_layout.addWidget(apply_button)
+    
+    content_layout = QHBoxLayout()
+    content_layout.addWidget(view, 1)
+    content_layout.addLayout(side_layout)
+    layout.addLayout(content_layout)
+    
+    def show_preview(index):
+        if index.isValid():
+            theme_name = index.data()
+            preview.set_theme(theme_name, window.theme_manager.get_theme(theme_name))
+    
+    def apply_current():
+        index = view.currentIndex()
+        if index.isValid():
+            window.theme_manager.apply_theme(index.data())
+            dialog.accept()
+    
+    # Hovering previews a theme; leaving the cells goes back to the selected one
+    view.entered.connect(show_preview)
+    view.viewportEntered.connect(lambda: show_preview(view.currentIndex()))
+    view.selectionModel().currentChanged.connect(lambda current, previous: show_preview(current))
+    view.doubleClicked.connect(lambda index: apply_current())
+    apply_button.clicked.connect(apply_current)
+    
+    # Filtering runs once typing pauses
+    filter_timer = QTimer(dialog)
+    filter_timer.setSingleShot(True)
+    filter_timer.setInterval(150)
+    filter_timer.timeout.connect(lambda: proxy.set_filter(
+        search_box.text(),
+        '' if category_combo.currentText() == "All" else category_combo.currentText()))
+    search_box.textChanged.connect(filter_timer.start)
+    category_combo.currentTextChanged.connect(filter_timer.start)
+    
+    # Start on the theme in use
+    row = model.row_of(window.theme_manager.current_theme)
+    if row >= 0:
+        current = proxy.mapFromSource(model.index(row))
+        view.setCurrentIndex(current)
+        view.scrollTo(current)
+    
+    dialog.setLayout(layout)
+    dialog.exec()
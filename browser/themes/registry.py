@@ -0,0 +1,447 @@
+"""Theme colours and the compiled cache of the themes/ directory.
+
+Parsing every theme file on each start gets slow with large theme packs, so
+the themes/ directory is summarised in one JSON index in the data directory,
+keyed by each file's modification time and size. A start only lists theme
+names; a theme's file is parsed (with cssutils, resolving var() chains) the
+first time it is previewed or applied. The compiled palette is appended to a
+palettes file next to the index, which records only where to find it, so it
+isn't parsed again until the file changes and only recently used palettes
+are kept in memory.
+"""
+import copy
+import json
+import os
+import re
+from collections import OrderedDict
+
+from browser.core.storage import data_path, read_json, write_json
+from browser.themes.stylesheet import BASE_COLORS, normalize_color
+
+THEMES_DIR = 'themes'
+THEME_LIST_FILE = '_list.json'
+THEME_CACHE_FILE = 'theme_cache.json'
+THEME_PALETTES_FILE = 'theme_palettes.jsonl'
+CACHE_VERSION = 5  # Bumped whenever the compiled palette or index changes shape
+STALE_PALETTE_SLACK = 64  # Superseded palette lines tolerated before compacting
+PARSED_THEME_LIMIT = 32  # Parsed themes kept in memory by ThemeRegistry
+
+DEFAULT_THEMES = {
+    'Light': {
+        'background': '#FFFFFF',
+        'foreground': '#000000',
+        'accent': '#0078D7',
+        'sub': '#808080'
+    },
+    'Dark': {
+        'background': '#2D2D2D',
+        'foreground': '#FFFFFF',
+        'accent': '#0078D7',
+        'sub': '#A0A0A0'
+    },
+    'Sepia': {
+        'background': '#F4ECD8',
+        'foreground': '#5B4636',
+        'accent': '#8B4513',
+        'sub': '#9B7B6B'
+    },
+    'Blue': {
+        'background': '#E8F0FE',
+        'foreground': '#202124',
+        'accent': '#1A73E8',
+        'sub': '#5F6368'
+    },
+    'Green': {
+        'background': '#E6F4EA',
+        'foreground': '#202124',
+        'accent': '#0F9D58',
+        'sub': '#5F6368'
+    },
+    'Purple': {
+        'background': '#F3E5F5',
+        'foreground': '#202124',
+        'accent': '#9C27B0',
+        'sub': '#5F6368'
+    },
+    'Red': {
+        'background': '#FCE4EC',
+        'foreground': '#202124',
+        'accent': '#DB4437',
+        'sub': '#5F6368'
+    }
+}
+
+
+def theme_name_for(filename):
+    """Display name of a theme file, e.g. 'serika_dark.css' -> 'Serika Dark'"""
+    return os.path.splitext(filename)[0].replace('_', ' ').title()
+
+
+def theme_category(name):
+    """Category of a theme for filtering, from the first word of a multi-word name"""
+    parts = re.split(r'[ _]', name, 1)
+    return parts[0].capitalize() if len(parts) > 1 else ''
+
+
+def parse_theme_list(text):
+    """Themes described in a _list.json file, as {name: colors}"""
+    themes = {}
+    themes_data = json.loads(text)
+    if not isinstance(themes_data, list):
+        return themes
+    for theme in themes_data:
+        if not isinstance(theme, dict) or not theme.get('name'):
+            continue
+        # Check for different possible color keys
+        themes[theme['name']] = normalize_palette({
+            'background': theme.get('bgColor', theme.get('bg', theme.get('background'))),
+            'foreground': theme.get('textColor', theme.get('fg', theme.get('foreground'))),
+            'accent': theme.get('mainColor', theme.get('accent')),
+            'sub': theme.get('subColor', theme.get('sub')),
+        })
+    return themes
+
+
+def normalize_palette(palette):
+    """palette with every color in #rrggbb/rgba() form.
+    
+    Values that aren't colors fall back to the defaults for the base colors
+    and to None (derived by the stylesheet) for the optional ones.
+    """
+    return {key: normalize_color(value) or PALETTE_DEFAULTS.get(key) for key, value in palette.items()}
+
+
+ROOT_SELECTORS = (':root', 'html', 'body', '*')
+MAX_VAR_DEPTH = 16  # Longest var() chain followed before giving up on a value
+_VAR_RE = re.compile(r'var\(\s*--([\w-]+)\s*(?:,\s*((?:[^()]|\([^()]*\))*))?\)')
+# Colors cssutils drops from custom properties: #RGBA, #RRGGBBAA and space-separated rgb()/hsl()
+_COLOR_TOKEN_RE = re.compile(r'#(?:[0-9a-fA-F]{8}|[0-9a-fA-F]{4})\b|\b(?:rgba?|hsla?)\([^()]*\)', re.IGNORECASE)
+
+# Theme colors and the CSS variables they are read from, first match winning
+PALETTE_VARIABLES = {
+    'background': ('bg-color', 'bg', 'background'),
+    'foreground': ('text-color', 'fg-color', 'fg', 'foreground'),
+    'accent': ('main-color', 'accent-color', 'accent'),
+    'sub': ('sub-color', 'sub-alt-color', 'sub'),
+    'hover': ('hover-color', 'main-hover-color', 'accent-hover', 'hover'),
+    'border': ('border-color', 'sub-alt-color', 'border'),
+    'error': ('error-color', 'error'),
+}
+PALETTE_DEFAULTS = BASE_COLORS
+
+
+def root_variables(text):
+    """Custom properties declared on :root (or html/body/*), later declarations winning"""
+    import logging
+    import cssutils  # Imported here: only needed when a theme file has changed
+
+    parser = cssutils.CSSParser(log=logging.getLogger('themes.cssutils'),
+                                loglevel=logging.CRITICAL, raiseExceptions=False, validate=False)
+    sheet = parser.parseString(_COLOR_TOKEN_RE.sub(lambda match: normalize_color(match.group()) or match.group(),
+                                                   text))
+    variables = {}
+    for rule in sheet.cssRules:
+        if rule.type != rule.STYLE_RULE:
+            continue
+        if not any(selector.selectorText.strip() in ROOT_SELECTORS for selector in rule.selectorList):
+            continue
+        for prop in rule.style.getProperties(all=True):
+            if prop.name.startswith('--'):
+                variables[prop.name[2:]] = prop.value.strip()
+    return variables
+
+
+def resolve_variables(variables):
+    """Replace var(--name, fallback) references with their values; cycles resolve to None"""
+    resolved = {}
+
+    def resolve(name, seen):
+        if name in resolved:
+            return resolved[name]
+        if name in seen or name not in variables:
+            return None
+        seen = seen | {name}
+
+        def substitute(match):
+            value = resolve(match.group(1), seen)
+            return value if value is not None else (match.group(2) or '').strip()
+
+        value = variables[name]
+        for _ in range(MAX_VAR_DEPTH):
+            substituted = _VAR_RE.sub(substitute, value)
+            if substituted == value:
+                break
+            value = substituted
+        value = value.strip()
+        resolved[name] = value if value and 'var(' not in value else None
+        return resolved[name]
+
+    for name in variables:
+        resolve(name, frozenset())
+    return resolved
+
+
+def parse_theme_css(text):
+    """Palette of a theme stylesheet, read from its resolved :root variables.
+    
+    hover, border and error are None when the theme doesn't define them, so
+    the stylesheet can derive them from the base colors instead.
+    """
+    variables = resolve_variables(root_variables(text))
+    palette = {}
+    for key, names in PALETTE_VARIABLES.items():
+        palette[key] = next((variables[name] for name in names if normalize_color(variables.get(name))),
+                            None)
+    return normalize_palette(palette)
+
+
+def _compile_file(path, filename):
+    """Parse one theme file into {name: colors}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if filename == THEME_LIST_FILE:
+        return parse_theme_list(text)
+    return {theme_name_for(filename): parse_theme_css(text)}
+
+
+def _palette_line(filename, mtime, name, colors):
+    """One line of the palettes file"""
+    entry = {'file': filename, 'mtime': mtime, 'name': name, 'colors': colors}
+    return json.dumps(entry, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class ThemeCache:
+    """Index of the theme files, refreshed incrementally from file mtimes and sizes.
+    
+    Each file's record lists the themes it provides; 'themes' maps a name to
+    the byte offset of its compiled palette in the palettes file, or to None
+    until the file has been parsed. Palettes are read back one at a time, so
+    memory use doesn't grow with the number of themes.
+    """
+
+    def __init__(self, themes_dir=THEMES_DIR, cache_path=None, palettes_path=None):
+        self.themes_dir = themes_dir
+        self.cache_path = cache_path or data_path(THEME_CACHE_FILE)
+        self.palettes_path = palettes_path or os.path.join(
+            os.path.dirname(os.path.abspath(self.cache_path)), THEME_PALETTES_FILE)
+        self.files = {}  # {filename: {'mtime': ns, 'size': bytes, 'themes': {name: offset or None}}}
+        self.sources = {}  # {theme name: filename}
+        self.lines = 0  # Palette lines in the palettes file, superseded ones included
+        self.dirty = False
+
+    def _load_index(self):
+        index = read_json(self.cache_path, {})
+        if not isinstance(index, dict) or index.get('version') != CACHE_VERSION or \
+                index.get('themes_dir') != os.path.abspath(self.themes_dir):
+            self._reset_palettes()
+            return {}
+        files = index.get('files', {})
+        try:
+            palettes_size = os.path.getsize(self.palettes_path)
+        except OSError:
+            palettes_size = 0
+        if not palettes_size or palettes_size < index.get('palettes_size', 0):
+            # The palettes file is gone or cut short; parse the themes again
+            self._reset_palettes()
+            for record in files.values():
+                record['themes'] = dict.fromkeys(record['themes'])
+        else:
+            self.lines = index.get('palette_lines', 0)
+        return files
+
+    def _reset_palettes(self):
+        self.lines = 0
+        try:
+            os.remove(self.palettes_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing {self.palettes_path}: {e}")
+
+    def _theme_files(self):
+        if not os.path.isdir(self.themes_dir):
+            return []
+        return [entry for entry in os.scandir(self.themes_dir) if entry.is_file() and
+                (entry.name == THEME_LIST_FILE or
+                 (entry.name.endswith('.css') and entry.name != '_list.css'))]
+
+    def refresh(self):
+        """Bring the index up to date, re-parsing only changed files"""
+        cached = self._load_index()
+        self.files = {}
+        changed = False
+        for entry in self._theme_files():
+            stat = entry.stat()
+            record = cached.pop(entry.name, None)
+            if record and record.get('mtime') == stat.st_mtime_ns and record.get('size') == stat.st_size:
+                self.files[entry.name] = record
+                continue
+            record = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'themes': {}}
+            self.files[entry.name] = record
+            if entry.name == THEME_LIST_FILE:
+                # The list is the index of its own themes, so read it now
+                try:
+                    record['themes'] = self._store(entry.name, _compile_file(entry.path, entry.name))
+                except (OSError, ValueError) as e:
+                    print(f"Error loading theme {entry.name}: {e}")
+            else:
+                record['themes'] = {theme_name_for(entry.name): None}
+            changed = True
+
+        # Stylesheets override entries from _list.json
+        self.sources = {}
+        for filename in sorted(self.files, key=lambda name: name != THEME_LIST_FILE):
+            for name in self.files[filename]['themes']:
+                self.sources[name] = filename
+
+        live = sum(offset is not None for record in self.files.values() for offset in record['themes'].values())
+        if self.lines > 2 * live + STALE_PALETTE_SLACK:
+            self._compact()
+            changed = True
+
+        # Anything left in the old index was deleted
+        if changed or cached:
+            self.save()
+        return self.names()
+
+    def _store(self, filename, palettes):
+        """Append compiled palettes to the palettes file, returning {name: offset}"""
+        mtime = self.files[filename]['mtime']
+        offsets = {}
+        try:
+            with open(self.palettes_path, 'ab') as f:
+                for name, colors in palettes.items():
+                    offsets[name] = f.tell()
+                    f.write(_palette_line(filename, mtime, name, colors))
+                    self.lines += 1
+        except OSError as e:
+            print(f"Error saving theme palettes: {e}")
+            return dict.fromkeys(palettes)
+        self.dirty = True
+        return offsets
+
+    def _read(self, f, filename, name, offset):
+        """The palette stored at offset, or None if it isn't that theme's current palette"""
+        try:
+            f.seek(offset)
+            entry = json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('file') != filename or entry.get('name') != name or \
+                entry.get('mtime') != self.files[filename]['mtime']:
+            return None
+        return entry.get('colors')
+
+    def _compact(self):
+        """Rewrite the palettes file without superseded palettes"""
+        temp_path = self.palettes_path + '.tmp'
+        try:
+            with open(self.palettes_path, 'rb') as old, open(temp_path, 'wb') as new:
+                self.lines = 0
+                for filename, record in self.files.items():
+                    for name, offset in record['themes'].items():
+                        colors = self._read(old, filename, name, offset) if offset is not None else None
+                        if colors is None:
+                            record['themes'][name] = None
+                            continue
+                        record['themes'][name] = new.tell()
+                        new.write(_palette_line(filename, record['mtime'], name, colors))
+                        self.lines += 1
+            os.replace(temp_path, self.palettes_path)
+        except OSError as e:
+            print(f"Error compacting theme palettes: {e}")
+            # Offsets may already point into the new file; parse again instead
+            for record in self.files.values():
+                record['themes'] = dict.fromkeys(record['themes'])
+
+    def names(self):
+        return list(self.sources)
+
+    def colors(self, name):
+        """Colors of a theme, read from the palettes file or parsed from its theme file"""
+        filename = self.sources.get(name)
+        if filename is None:
+            return None
+        record = self.files[filename]
+        offset = record['themes'].get(name)
+        if offset is not None:
+            try:
+                with open(self.palettes_path, 'rb') as f:
+                    colors = self._read(f, filename, name, offset)
+            except OSError:
+                colors = None
+            if colors is not None:
+                return colors
+        try:
+            palettes = _compile_file(os.path.join(self.themes_dir, filename), filename)
+        except (OSError, ValueError) as e:
+            print(f"Error loading theme {filename}: {e}")
+            return None
+        record['themes'].update(self._store(filename, palettes))
+        return palettes.get(name)
+
+    def save_if_dirty(self):
+        if self.dirty:
+            self.save()
+
+    def save(self):
+        self.dirty = False
+        try:
+            write_json(self.cache_path, {
+                'version': CACHE_VERSION,
+                'themes_dir': os.path.abspath(self.themes_dir),
+                'files': self.files,
+                'palettes_size': os.path.getsize(self.palettes_path) if os.path.exists(self.palettes_path) else 0,
+                'palette_lines': self.lines,
+            })
+        except OSError as e:
+            print(f"Error saving theme cache: {e}")
+
+
+class ThemeRegistry:
+    """Theme names known up front; colors are loaded on first use and only the
+    most recently used ones are kept in memory"""
+
+    def __init__(self, cache=None, limit=PARSED_THEME_LIMIT):
+        self.cache = cache or ThemeCache()
+        self.limit = limit
+        self.parsed = OrderedDict()  # {name: colors}, least recently used first
+        self._names = list(DEFAULT_THEMES)
+        self._letters = None
+        for name in self.cache.refresh():
+            if name not in DEFAULT_THEMES:
+                self._names.append(name)
+
+    def names(self):
+        return sorted(self._names)
+
+    def letters(self):
+        """Sorted theme names grouped by first letter, in letter order"""
+        if self._letters is None:
+            groups = {}
+            for name in self.names():
+                groups.setdefault(name[0].upper(), []).append(name)
+            self._letters = {letter: groups[letter] for letter in sorted(groups)}
+        return self._letters
+
+    def __contains__(self, name):
+        return name in DEFAULT_THEMES or name in self.cache.sources
+
+    def get(self, name):
+        if name in self.parsed:
+            self.parsed.move_to_end(name)
+            return self.parsed[name]
+        # Theme files override the built-in theme of the same name
+        colors = self.cache.colors(name) if name in self.cache.sources else None
+        if colors is None:
+            colors = copy.deepcopy(DEFAULT_THEMES.get(name)) if name in DEFAULT_THEMES else None
+        if colors is None:
+            return None
+        self.parsed[name] = colors
+        if len(self.parsed) > self.limit:
+            self.parsed.popitem(last=False)
+        return colors
+
+    def save(self):
+        """Persist themes parsed since the index was last written"""
+        self.cache.save_if_dirty()
@@ -0,0 +1,595 @@
+"""Application-wide Qt stylesheet generated from the current theme.
+
+Widgets carry an object name (and sometimes a dynamic property) instead of
+their own setStyleSheet call; the rules for all of them live here, grouped by
+the part of the UI they style, and StyleEngine applies the composed sheet to
+the QApplication only when the theme actually changes. Colors that come from
+data rather than the theme (site tiles, chat avatars, lobbies) are picked from
+a fixed set of tints so they can be styled by a 'tint' property as well.
+"""
+import colorsys
+import hashlib
+import re
+
+_HEX_RE = re.compile(r'^#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$')
+_FUNCTION_RE = re.compile(r'^(rgba?|hsla?)\(([^()]*)\)$', re.IGNORECASE)
+_NUMBER_RE = re.compile(r'^([+-]?(?:\d+\.?\d*|\.\d+))(%|deg)?$')
+
+# Color keywords accepted in themes besides #hex, rgb() and hsl()
+NAMED_COLORS = {
+    'black': (0, 0, 0), 'silver': (192, 192, 192), 'gray': (128, 128, 128), 'grey': (128, 128, 128),
+    'white': (255, 255, 255), 'maroon': (128, 0, 0), 'red': (255, 0, 0), 'purple': (128, 0, 128),
+    'fuchsia': (255, 0, 255), 'green': (0, 128, 0), 'lime': (0, 255, 0), 'olive': (128, 128, 0),
+    'yellow': (255, 255, 0), 'navy': (0, 0, 128), 'blue': (0, 0, 255), 'teal': (0, 128, 128),
+    'aqua': (0, 255, 255), 'orange': (255, 165, 0),
+}
+
+
+def _number(text, scale):
+    """A CSS number, with percentages taken as a fraction of scale"""
+    match = _NUMBER_RE.match(text)
+    if not match:
+        return None
+    value = float(match.group(1))
+    return value * scale / 100 if match.group(2) == '%' else value
+
+
+def _parse_function(name, arguments):
+    # Both rgb(1, 2, 3) / rgba(1, 2, 3, .5) and rgb(1 2 3 / 50%) syntaxes
+    channels, _, alpha = arguments.replace(',', ' ').partition('/')
+    parts = channels.split() + alpha.split()
+    if len(parts) not in (3, 4):
+        return None
+    if name.startswith('rgb'):
+        values = [_number(part, 255) for part in parts[:3]]
+    else:
+        # Saturation and lightness are percentages, with or without the %
+        values = [_number(parts[0].lower(), 360), _number(parts[1].rstrip('%'), 1),
+                  _number(parts[2].rstrip('%'), 1)]
+        values[1:] = [value / 100 if value is not None else None for value in values[1:]]
+    values.append(_number(parts[3], 1) if len(parts) == 4 else 1.0)
+    if None in values:
+        return None
+    if name.startswith('hsl'):
+        hue, saturation, lightness = values[0] % 360 / 360, values[1], values[2]
+        saturation, lightness = min(max(saturation, 0.0), 1.0), min(max(lightness, 0.0), 1.0)
+        values[:3] = [channel * 255 for channel in colorsys.hls_to_rgb(hue, lightness, saturation)]
+    r, g, b = (round(min(max(value, 0.0), 255.0)) for value in values[:3])
+    return r, g, b, min(max(values[3], 0.0), 1.0)
+
+
+def parse_rgba(value):
+    """(r, g, b, alpha) of a CSS color, or None when it isn't one.
+    
+    Accepts #RGB, #RGBA, #RRGGBB and #RRGGBBAA, rgb()/rgba() and
+    hsl()/hsla() in comma or space syntax, and the basic color keywords.
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    match = _HEX_RE.match(value)
+    if match:
+        digits = match.group(1)
+        if len(digits) <= 4:
+            digits = ''.join(digit * 2 for digit in digits)
+        channels = [int(digits[i:i + 2], 16) for i in range(0, len(digits), 2)]
+        alpha = channels[3] / 255 if len(channels) == 4 else 1.0
+        return channels[0], channels[1], channels[2], alpha
+    match = _FUNCTION_RE.match(value)
+    if match:
+        return _parse_function(match.group(1).lower(), match.group(2))
+    rgb = NAMED_COLORS.get(value.lower())
+    return (*rgb, 1.0) if rgb else None
+
+
+def parse_color(value):
+    """(r, g, b) of a CSS color, or None for anything else"""
+    rgba = parse_rgba(value)
+    return rgba[:3] if rgba else None
+
+
+def normalize_color(value):
+    """A CSS color as #rrggbb (or rgba() when translucent) that both Qt and QSS
+    understand, or None when value isn't a color"""
+    rgba = parse_rgba(value)
+    if rgba is None:
+        return None
+    r, g, b, alpha = rgba
+    if alpha >= 1:
+        return f"#{r:02x}{g:02x}{b:02x}"
+    return f"rgba({r}, {g}, {b}, {round(alpha, 3):g})"
+
+
+def with_alpha(value, alpha):
+    """value as an rgba() color with the given opacity"""
+    rgb = parse_color(value)
+    if rgb is None:
+        return value
+    return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
+
+
+def mix(value, other, amount):
+    """Blend amount (0..1) of other into value"""
+    first, second = parse_color(value), parse_color(other)
+    if first is None or second is None:
+        return value
+    return '#' + ''.join(f"{round(a + (b - a) * amount):02x}" for a, b in zip(first, second))
+
+
+# Base colors used when a theme's own value isn't a color
+BASE_COLORS = {
+    'background': '#FFFFFF',
+    'foreground': '#000000',
+    'accent': '#0078D7',
+    'sub': '#808080',
+}
+
+# Colors of the chat and profile dialogs, which keep their own dark look.
+# A theme may override any of them by defining the same key.
+FIXED_COLORS = {
+    'brand': '#2B5278',
+    'brand_hover': '#3A6A9E',
+    'chat_background': '#17212B',
+    'chat_panel': '#0E1621',
+    'chat_input': '#253340',
+    'chat_text': '#FFFFFF',
+    'chat_muted': '#A0A0A0',
+    'online': '#4CAF50',
+    'notice': '#0F9D58',
+}
+
+TINTS = ('#4285F4', '#0F9D58', '#EA4335', '#FBBC05', '#5865F2', '#EB459E',
+         '#9C27B0', '#00ACC1', '#FF7043', '#7CB342', '#8D6E63', '#546E7A')
+
+
+def tint_for(key):
+    """Index into TINTS for a name; the same on every run, unlike hash()"""
+    return int(hashlib.md5(key.encode('utf-8')).hexdigest()[:8], 16) % len(TINTS)
+
+
+def theme_variables(theme):
+    """Base theme colors plus the shades derived from them.
+    
+    Themes compiled from CSS may also define hover, border and error colors;
+    those are used as-is instead of being derived. Every value is checked
+    before it goes into the stylesheet: anything that isn't a color falls
+    back to the default (or derived) color.
+    """
+    def color(key, default=None):
+        return normalize_color(theme.get(key)) or default
+
+    background = color('background', BASE_COLORS['background'])
+    foreground = color('foreground', BASE_COLORS['foreground'])
+    accent = color('accent', BASE_COLORS['accent'])
+    variables = {key: color(key, value) for key, value in FIXED_COLORS.items()}
+    variables.update({
+        'background': background,
+        'foreground': foreground,
+        'accent': accent,
+        'sub': color('sub', BASE_COLORS['sub']),
+        'accent_hover': color('hover') or mix(accent, '#000000', 0.2),
+        'accent_soft': with_alpha(accent, 0.1),
+        'accent_soft_hover': with_alpha(accent, 0.2),
+        'surface': with_alpha(foreground, 0.05),
+        'surface_hover': with_alpha(foreground, 0.1),
+        'border': color('border') or mix(background, foreground, 0.15),
+        'result_url': mix(accent, foreground, 0.35),
+        'error': color('error', '#DB4437'),
+        'scrollbar': with_alpha(foreground, 0.1),
+        'scrollbar_handle': with_alpha(foreground, 0.3),
+    })
+    return variables
+
+
+# Rules for each part of the UI, as format strings over theme_variables()
+RULES = {
+    'chrome': """
+QLineEdit#urlBar {{
+    border: 1px solid {border};
+    border-radius: 5px;
+    padding: 5px 10px;
+    font-size: 14px;
+}}
+QLineEdit#urlBar:focus {{
+    border: 2px solid {accent};
+}}
+QPushButton#iconButton {{
+    background-color: transparent;
+    border: none;
+    border-radius: 5px;
+}}
+QPushButton#iconButton:hover {{
+    background-color: {surface_hover};
+}}
+""",
+    'search': """
+QLabel#searchLogo {{
+    color: {accent};
+    margin-bottom: 30px;
+}}
+QLineEdit#searchBox {{
+    border: 1px solid {border};
+    border-radius: 30px;
+    padding: 10px 20px;
+    font-size: 18px;
+    background-color: {surface_hover};
+}}
+QLineEdit#searchBox:focus {{
+    border: 2px solid {accent};
+    background-color: {surface_hover};
+}}
+QScrollArea#resultsArea {{
+    border: none;
+    background-color: transparent;
+}}
+QScrollArea#resultsArea QScrollBar:vertical {{
+    border: none;
+    background: {scrollbar};
+    width: 10px;
+    margin: 0px;
+}}
+QScrollArea#resultsArea QScrollBar::handle:vertical {{
+    background: {scrollbar_handle};
+    min-height: 20px;
+    border-radius: 5px;
+}}
+QScrollArea#resultsArea QScrollBar::add-line:vertical,
+QScrollArea#resultsArea QScrollBar::sub-line:vertical {{
+    border: none;
+    background: none;
+}}
+
+QPushButton#siteTile {{
+    color: white;
+    border-radius: 50px;
+    font-size: 32px;
+    font-weight: bold;
+}}
+QPushButton#siteTile:hover {{
+    border: 3px solid {accent};
+}}
+QLabel#siteName {{
+    font-size: 14px;
+    margin-top: 8px;
+}}
+QFrame#sectionSeparator {{
+    margin-top: 30px;
+    margin-bottom: 30px;
+}}
+QLabel#sectionTitle, QLabel#resultsCount {{
+    color: {sub};
+    margin-bottom: 20px;
+}}
+QLabel#resultsHeader {{
+    font-size: 18px;
+    font-weight: bold;
+    margin-bottom: 15px;
+}}
+QLabel#pageHeader {{
+    font-size: 24px;
+    font-weight: bold;
+    margin-bottom: 20px;
+}}
+QLabel#emptyResults {{
+    font-size: 18px;
+    margin: 40px 0;
+}}
+QLabel#suggestionsLabel {{
+    font-size: 16px;
+    margin-top: 20px;
+}}
+QPushButton#suggestionButton {{
+    background-color: {accent_soft};
+    color: {accent};
+    border: 1px solid {accent};
+    border-radius: 15px;
+    padding: 5px 15px;
+    font-size: 14px;
+}}
+QPushButton#suggestionButton:hover {{
+    background-color: {accent_soft_hover};
+}}
+
+QFrame#resultCard {{
+    border: 1px solid {border};
+    border-radius: 8px;
+    background-color: {surface};
+    padding: 15px;
+    margin: 5px 0;
+}}
+QFrame#resultCard:hover {{
+    background-color: {surface_hover};
+    border-color: {accent};
+}}
+QFrame#resultCard[compact="true"] {{
+    padding: 10px;
+    margin: 5px;
+}}
+QFrame#resultCard[compact="true"]:hover {{
+    border-color: {border};
+}}
+QLabel#resultUrl {{
+    color: {result_url};
+}}
+QLabel#resultDescription {{
+    margin-top: 8px;
+}}
+QPushButton#visitButton {{
+    background-color: {accent};
+    color: white;
+    border: none;
+    border-radius: 4px;
+    padding: 5px 15px;
+    font-size: 14px;
+    max-width: 100px;
+    margin-top: 10px;
+}}
+QPushButton#visitButton:hover {{
+    background-color: {accent_hover};
+}}
+QWidget#hostingBadge {{
+    border-radius: 10px;
+    padding: 3px 8px;
+}}
+QWidget#hostingBadge QLabel {{
+    color: white;
+    font-weight: bold;
+}}
+""",
+    'hosting': """
+QPushButton#hostingButton {{
+    color: white;
+    border: none;
+    border-radius: 5px;
+    padding: 10px;
+    font-size: 14px;
+    font-weight: bold;
+}}
+QWidget#hostingBadge[hosting="server"], QPushButton#visitButton[hosting="server"],
+QPushButton#hostingButton[hosting="server"] {{
+    background-color: #5865F2;
+}}
+QPushButton#visitButton[hosting="server"]:hover, QPushButton#hostingButton[hosting="server"]:hover {{
+    background-color: #4752C4;
+}}
+QWidget#hostingBadge[hosting="cloud"], QPushButton#visitButton[hosting="cloud"],
+QPushButton#hostingButton[hosting="cloud"] {{
+    background-color: #EB459E;
+}}
+QPushButton#visitButton[hosting="cloud"]:hover, QPushButton#hostingButton[hosting="cloud"]:hover {{
+    background-color: #C13584;
+}}
+""",
+    'dialogs': """
+QLabel#dialogTitle {{
+    font-size: 18px;
+    font-weight: bold;
+    margin-bottom: 20px;
+}}
+QLabel#formSection {{
+    font-size: 18px;
+    font-weight: bold;
+    margin-top: 20px;
+}}
+QPushButton#primaryButton {{
+    background-color: {brand};
+    color: white;
+    border: none;
+    border-radius: 5px;
+    padding: 5px 15px;
+}}
+QPushButton#primaryButton:hover {{
+    background-color: {brand_hover};
+}}
+QLabel#profileAvatar {{
+    background-color: {brand};
+    color: white;
+    border-radius: 50px;
+    font-size: 36px;
+    font-weight: bold;
+}}
+QLabel#profileName {{
+    font-size: 24px;
+    font-weight: bold;
+}}
+QLabel#profileEmail {{
+    color: {sub};
+}}
+""",
+    'chat': """
+QDialog[role="chat"] {{
+    background-color: {chat_background};
+}}
+QDialog[role="chat"] QLabel {{
+    color: {chat_text};
+}}
+QDialog[role="chat"] QPushButton {{
+    border: none;
+    border-radius: 5px;
+    padding: 10px;
+    color: white;
+    font-size: 14px;
+    text-align: left;
+}}
+QDialog[role="chat"] QPushButton:hover {{
+    background-color: {brand};
+}}
+QPushButton#lobbyButton {{
+    color: white;
+    border-radius: 8px;
+    padding: 10px;
+    font-size: 16px;
+    font-weight: bold;
+    margin-bottom: 10px;
+}}
+QWidget#chatConnectionBar {{
+    background-color: {chat_panel};
+    border-radius: 5px;
+}}
+QWidget#chatUsers {{
+    background-color: {chat_panel};
+}}
+QLabel#chatStatusDot {{
+    color: {online};
+    font-size: 16px;
+}}
+QLabel#presenceDot {{
+    color: {online};
+    font-size: 12px;
+}}
+QLabel#chatStatusText {{
+    font-size: 12px;
+}}
+QLabel#chatUserCount {{
+    color: {chat_muted};
+    font-size: 12px;
+}}
+QLineEdit#chatField {{
+    background-color: {chat_input};
+    color: white;
+    border-radius: 5px;
+    padding: 5px 10px;
+    font-size: 14px;
+    border: none;
+}}
+QLineEdit#chatField[compact="true"] {{
+    max-width: 200px;
+}}
+QPushButton#chatButton {{
+    background-color: {brand};
+    color: white;
+    border-radius: 5px;
+    padding: 5px 15px;
+    font-size: 14px;
+    text-align: center;
+}}
+QPushButton#chatButton[compact="true"] {{
+    max-width: 50px;
+}}
+QPushButton#chatButton:hover {{
+    background-color: {brand_hover};
+}}
+QScrollArea#chatArea {{
+    border: none;
+    background-color: {chat_background};
+}}
+QScrollArea#chatArea QScrollBar:vertical {{
+    border: none;
+    background: {chat_background};
+    width: 10px;
+    margin: 0px;
+}}
+QScrollArea#chatArea QScrollBar::handle:vertical {{
+    background: {brand};
+    min-height: 20px;
+    border-radius: 5px;
+}}
+QScrollArea#chatArea QScrollBar::add-line:vertical,
+QScrollArea#chatArea QScrollBar::sub-line:vertical {{
+    border: none;
+    background: none;
+}}
+QLabel#chatBanner {{
+    background-color: {brand};
+    border-radius: 10px;
+    padding: 10px;
+    margin: 5px 50px;
+}}
+QLabel#chatBanner[tone="info"] {{
+    background-color: {notice};
+}}
+QLabel#chatUsersHeader {{
+    font-weight: bold;
+    margin-bottom: 10px;
+}}
+QLabel#chatSelf {{
+    font-weight: bold;
+}}
+QLabel#chatSystemText {{
+    color: {chat_muted};
+    font-style: italic;
+    font-size: 12px;
+}}
+QPushButton#chatAvatar {{
+    background-color: {brand};
+    color: white;
+    border-radius: 20px;
+    padding: 0px;
+    font-size: 16px;
+    font-weight: bold;
+    text-align: center;
+}}
+QLabel#chatUserName {{
+    color: {brand};
+    font-weight: bold;
+}}
+QLabel#chatTime {{
+    color: {chat_muted};
+    font-size: 10px;
+}}
+QPushButton#chatRoundButton {{
+    background-color: transparent;
+    border-radius: 20px;
+}}
+QPushButton#chatRoundButton:hover {{
+    background-color: {chat_input};
+}}
+QPushButton#chatSendButton {{
+    background-color: {brand};
+    border-radius: 20px;
+}}
+QPushButton#chatSendButton:hover {{
+    background-color: {brand_hover};
+}}
+QLineEdit#chatMessageInput {{
+    background-color: {chat_input};
+    color: white;
+    border-radius: 18px;
+    padding: 10px 15px;
+    font-size: 14px;
+    border: none;
+}}
+""",
+}
+
+
+def tint_rules():
+    """Rules for widgets whose color comes from their 'tint' property"""
+    rules = []
+    for index, color in enumerate(TINTS):
+        rules.append(
+            f'QPushButton#siteTile[tint="{index}"], QPushButton#chatAvatar[tint="{index}"], '
+            f'QPushButton#lobbyButton[tint="{index}"] {{ background-color: {color}; }}\n'
+            f'QPushButton#lobbyButton[tint="{index}"]:hover {{ background-color: {with_alpha(color, 0.8)}; }}\n'
+            f'QLabel#chatUserName[tint="{index}"] {{ color: {color}; }}')
+    return '\n'.join(rules)
+
+
+TINT_RULES = tint_rules()
+
+
+def build_stylesheet(theme):
+    """The one stylesheet set on the application for a theme"""
+    variables = theme_variables(theme)
+    return '\n\n'.join([rules.format(**variables) for rules in RULES.values()] + [TINT_RULES])
+
+
+class StyleEngine:
+    """Applies the application stylesheet, skipping the re-polish when nothing changed"""
+
+    def __init__(self):
+        self.theme_key = None
+        self.stylesheet = None
+
+    def apply(self, app, theme):
+        """Set the stylesheet for theme on app; returns False if it was already applied"""
+        key = tuple(sorted((name, str(value)) for name, value in theme.items()))
+        if key == self.theme_key:
+            return False
+        stylesheet = build_stylesheet(theme)
+        self.theme_key = key
+        if stylesheet == self.stylesheet:
+            return False
+        self.stylesheet = stylesheet
+        app.setStyleSheet(stylesheet)
+        return True
@@ -0,0 +1,2 @@
+"""Qt windows: the main window, web tabs, and the download, bookmark,
+settings and profile windows."""
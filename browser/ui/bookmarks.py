@@ -0,0 +1,357 @@
+"""Bookmark manager window: a lazily loaded tree of folders and bookmarks over
+BookmarkStore, with search and drag-and-drop.
+"""
+from PyQt6.QtCore import QUrl, Qt, QTimer, QAbstractItemModel, QModelIndex, QMimeData
+from PyQt6.QtWidgets import (QApplication, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
+                             QDialog, QMessageBox, QTreeView, QStyle, QInputDialog, QFileDialog)
+from browser.core.bookmark_store import BookmarkStore
+
+class BookmarkNode:
+    """A folder or bookmark row; a folder's children stay None until expanded"""
+    
+    def __init__(self, kind, record, parent=None):
+        self.kind = kind  # 'folder' or 'bookmark'
+        self.record = record
+        self.parent = parent
+        self.children = None if kind == 'folder' else []
+    
+    @property
+    def key(self):
+        return (self.kind, self.record['id'])
+
+class BookmarkTreeModel(QAbstractItemModel):
+    """Folders and bookmarks read from the store one folder at a time.
+    
+    With a filter set, the model shows a flat list of search hits instead of
+    the tree.
+    """
+    MIME_TYPE = 'application/x-browser-bookmarks'
+    HEADERS = ("Title", "Address")
+    
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.nodes = {}  # {(kind, id): BookmarkNode} for every loaded node
+        self.tree_root = BookmarkNode('folder', {'id': None, 'name': ''})
+        self.root = self.tree_root
+        self.filter_text = ''
+        self._load_children(self.tree_root)
+    
+    def _load_children(self, node):
+        folder_id = node.record['id']
+        node.children = [self._node('folder', record, node) for record in self.store.folders_in(folder_id)]
+        node.children += [self._node('bookmark', record, node) for record in self.store.bookmarks_in(folder_id)]
+    
+    def _node(self, kind, record, parent):
+        node = BookmarkNode(kind, record, parent)
+        self.nodes[node.key] = node
+        return node
+    
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+    
+    def index_of(self, node):
+        if node is self.root or node.parent is None:
+            return QModelIndex()
+        siblings = node.parent.children
+        if siblings is None or node not in siblings:
+            return QModelIndex()  # Already removed from the view
+        return self.createIndex(siblings.index(node), 0, node)
+    
+    def index(self, row, column, parent=QModelIndex()):
+        children = self.node(parent).children or []
+        if 0 <= row < len(children) and 0 <= column < len(self.HEADERS):
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.index_of(index.internalPointer().parent)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() > 0:
+            return 0
+        return len(self.node(parent).children or [])
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if node.kind != 'folder':
+            return False
+        if node.children is None:
+            return self.store.has_children(node.record['id'])
+        return bool(node.children)
+    
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return node.kind == 'folder' and node.children is None
+    
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        folder_id = node.record['id']
+        records = ([('folder', record) for record in self.store.folders_in(folder_id)] +
+                   [('bookmark', record) for record in self.store.bookmarks_in(folder_id)])
+        node.children = []
+        if not records:
+            return
+        self.beginInsertRows(parent, 0, len(records) - 1)
+        node.children = [self._node(kind, record, node) for kind, record in records]
+        self.endInsertRows()
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        record = node.record
+        if role == Qt.ItemDataRole.DisplayRole:
+            if node.kind == 'folder':
+                return record['name'] if index.column() == 0 else ''
+            return record['title'] if index.column() == 0 else record['url']
+        if role == Qt.ItemDataRole.ToolTipRole and node.kind == 'bookmark':
+            return f"{record['url']}\nTags: {record['tags']}" if record['tags'] else record['url']
+        if role == Qt.ItemDataRole.DecorationRole and index.column() == 0 and node.kind == 'folder':
+            return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+        return None
+    
+    # Filtering
+    
+    def set_filter(self, text):
+        """Swap between the folder tree and a flat list of search hits"""
+        text = text.strip()
+        if text == self.filter_text:
+            return
+        self.beginResetModel()
+        self.filter_text = text
+        if text:
+            self.root = BookmarkNode('folder', {'id': None, 'name': ''})
+            self.root.children = [BookmarkNode('bookmark', record, self.root)
+                                  for record in self.store.search(text)]
+        else:
+            self.root = self.tree_root
+        self.endResetModel()
+    
+    # Editing
+    
+    def add_bookmark(self, bookmark_id):
+        """Show a bookmark that was just added to the store"""
+        record = self.store.get(bookmark_id)
+        parent = self.nodes.get(('folder', record['folder_id'])) if record['folder_id'] else self.tree_root
+        if parent is not None and parent.children is not None:
+            self._append(parent, self._node('bookmark', record, parent))
+    
+    def add_folder(self, name, parent_node=None):
+        parent_node = parent_node or self.tree_root
+        folder_id = self.store.add_folder(name, parent_node.record['id'])
+        if parent_node.children is not None:
+            self._append(parent_node, self._node('folder', self.store.folder(folder_id), parent_node))
+    
+    def remove(self, node):
+        if node.kind == 'folder':
+            self.store.remove_folder(node.record['id'])
+        else:
+            self.store.remove(node.record['id'])
+        tree_node = self.nodes.pop(node.key, None)
+        if tree_node is not None and tree_node is not node:
+            # Deleted from the search results; drop its hidden tree row too
+            siblings = tree_node.parent.children
+            if siblings is not None and tree_node in siblings:
+                siblings.remove(tree_node)
+        self._detach(node)
+        # The store deleted everything inside a folder, so forget the loaded rows too
+        for removed in (node, tree_node):
+            if removed is not None:
+                self._forget(removed)
+    
+    def _forget(self, node):
+        for child in node.children or []:
+            self.nodes.pop(child.key, None)
+            self._forget(child)
+        node.parent = None
+    
+    def _append(self, parent, node):
+        """Add a node at the end of a parent shown in the current view"""
+        node.parent = parent
+        if self.root is not self.tree_root:
+            parent.children.append(node)
+            return
+        row = len(parent.children)
+        self.beginInsertRows(self.index_of(parent), row, row)
+        parent.children.append(node)
+        self.endInsertRows()
+    
+    def _detach(self, node):
+        parent = node.parent
+        if parent is None or parent.children is None or node not in parent.children:
+            return
+        row = parent.children.index(node)
+        self.beginRemoveRows(self.index_of(parent), row, row)
+        parent.children.pop(row)
+        self.endRemoveRows()
+    
+    # Drag and drop
+    
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= Qt.ItemFlag.ItemIsDragEnabled
+        # Search hits are a flat list, so there is nowhere to drop into
+        if not self.filter_text and self.node(index).kind == 'folder':
+            flags |= Qt.ItemFlag.ItemIsDropEnabled
+        return flags
+    
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+    
+    def mimeTypes(self):
+        return [self.MIME_TYPE, 'text/uri-list']
+    
+    def mimeData(self, indexes):
+        nodes = list({id(index.internalPointer()): index.internalPointer()
+                      for index in indexes if index.isValid()}.values())
+        mime = QMimeData()
+        mime.setData(self.MIME_TYPE, '\n'.join(f"{node.kind}:{node.record['id']}"
+                                               for node in nodes).encode())
+        mime.setUrls([QUrl(node.record['url']) for node in nodes if node.kind == 'bookmark'])
+        return mime
+    
+    def dropMimeData(self, data, action, row, column, parent):
+        if not data.hasFormat(self.MIME_TYPE) or self.filter_text:
+            return False
+        target = self.node(parent)
+        if target.kind == 'bookmark':
+            target = target.parent
+        folder_id = target.record['id']
+        
+        for line in bytes(data.data(self.MIME_TYPE)).decode().splitlines():
+            kind, _, item_id = line.partition(':')
+            node = self.nodes.get((kind, int(item_id)))
+            if node is None or node is target or node.parent is target:
+                continue
+            try:
+                if kind == 'folder':
+                    self.store.move_folder(node.record['id'], folder_id)
+                else:
+                    self.store.move(node.record['id'], folder_id)
+            except ValueError as e:
+                print(f"Cannot move bookmark folder: {e}")
+                continue
+            node.record[('parent_id' if kind == 'folder' else 'folder_id')] = folder_id
+            self._detach(node)
+            if target.children is not None:
+                self._append(target, node)
+        # The rows were moved here, so the view has nothing left to remove
+        return True
+
+class BookmarkManager(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Bookmarks")
+        self.setGeometry(300, 300, 500, 400)
+        
+        self.store = BookmarkStore()
+        self.store.migrate_legacy()
+        
+        layout = QVBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search bookmarks by title, address or tag...")
+        layout.addWidget(self.search_edit)
+        
+        self.model = BookmarkTreeModel(self.store, self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setDragDropMode(QTreeView.DragDropMode.InternalMove)
+        self.tree.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
+        self.tree.header().setStretchLastSection(True)
+        self.tree.setColumnWidth(0, 220)
+        layout.addWidget(self.tree)
+        
+        buttons = QHBoxLayout()
+        for label, handler in (("New Folder", self.new_folder),
+                               ("Delete", self.delete_selected),
+                               ("Import...", self.import_bookmarks),
+                               ("Export...", self.export_bookmarks)):
+            button = QPushButton(label)
+            button.clicked.connect(handler)
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+        
+        # Filter once typing pauses
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(lambda: self.model.set_filter(self.search_edit.text()))
+        self.search_edit.textChanged.connect(self.filter_timer.start)
+        
+        # Double click to open bookmark
+        self.tree.doubleClicked.connect(self.open_bookmark)
+    
+    def add_bookmark(self, title, url, folder_id=None):
+        bookmark_id = self.store.add(url, title, folder_id)
+        self.model.add_bookmark(bookmark_id)
+        return bookmark_id
+    
+    def selected_nodes(self):
+        return [self.model.node(index) for index in self.tree.selectionModel().selectedRows()]
+    
+    def open_bookmark(self, index):
+        node = self.model.node(index)
+        if node.kind != 'bookmark':
+            return
+        self.store.touch(node.record['id'])
+        self.parent().current_tab().setUrl(QUrl(node.record['url']))
+        self.close()
+    
+    def new_folder(self):
+        name, ok = QInputDialog.getText(self, "New Folder", "Folder name:")
+        if not ok or not name.strip():
+            return
+        # Create it inside the selected folder, if any
+        selected = [node for node in self.selected_nodes() if node.kind == 'folder']
+        self.model.add_folder(name.strip(), selected[0] if selected else None)
+    
+    def delete_selected(self):
+        nodes = self.selected_nodes()
+        selected = set(map(id, nodes))
+        for node in nodes:
+            # Rows inside a selected folder go with the folder
+            ancestor = node.parent
+            while ancestor is not None and id(ancestor) not in selected:
+                ancestor = ancestor.parent
+            if ancestor is None:
+                self.model.remove(node)
+    
+    def import_bookmarks(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Bookmarks", "", "JSON files (*.json)")
+        if not path:
+            return
+        try:
+            count = self.store.import_json(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Import Failed", f"Could not import bookmarks:\n{e}")
+            return
+        self.search_edit.clear()
+        old_model = self.model
+        self.model = BookmarkTreeModel(self.store, self)
+        self.tree.setModel(self.model)
+        old_model.deleteLater()
+        QMessageBox.information(self, "Bookmarks Imported", f"Imported {count} bookmarks.")
+    
+    def export_bookmarks(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Bookmarks", "bookmarks.json",
+                                              "JSON files (*.json)")
+        if not path:
+            return
+        try:
+            self.store.export_json(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", f"Could not export bookmarks:\n{e}")
@@ -0,0 +1,468 @@
+"""Settings and user profile dialogs, loaded when first opened.
+
+Each function takes the browser window whose settings it edits.
+"""
+import os
+import uuid
+import socket
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QTabWidget,
+                             QDialog, QLabel, QComboBox, QMessageBox, QFrame, QRadioButton,
+                             QCheckBox, QFormLayout)
+from browser.core.settings import save_settings
+from browser.p2p.core import EndpointConfig
+
+def show_settings(window):
+    """Show browser settings dialog"""
+    settings_dialog = QDialog(window)
+    settings_dialog.setWindowTitle("Browser Settings")
+    settings_dialog.setGeometry(300, 300, 600, 500)
+    
+    layout = QVBoxLayout()
+    
+    # Create tabs for different settings categories
+    settings_tabs = QTabWidget()
+    
+    # General settings tab
+    general_tab = QWidget()
+    general_layout = QVBoxLayout()
+    
+    # Homepage setting
+    homepage_group = QWidget()
+    homepage_layout = QHBoxLayout()
+    homepage_layout.setContentsMargins(0, 0, 0, 0)
+    
+    homepage_label = QLabel("Homepage:")
+    homepage_layout.addWidget(homepage_label)
+    
+    homepage_input = QLineEdit("mysearch://home")
+    homepage_layout.addWidget(homepage_input)
+    
+    homepage_group.setLayout(homepage_layout)
+    general_layout.addWidget(homepage_group)
+    
+    # Default search engine
+    search_group = QWidget()
+    search_layout = QHBoxLayout()
+    search_layout.setContentsMargins(0, 0, 0, 0)
+    
+    search_label = QLabel("Default Search Engine:")
+    search_layout.addWidget(search_label)
+    
+    search_combo = QComboBox()
+    search_combo.addItems(["Visual Engine", "Google", "Bing", "DuckDuckGo", "Yahoo"])
+    search_layout.addWidget(search_combo)
+    
+    search_group.setLayout(search_layout)
+    general_layout.addWidget(search_group)
+    
+    # Download location
+    download_group = QWidget()
+    download_layout = QHBoxLayout()
+    download_layout.setContentsMargins(0, 0, 0, 0)
+    
+    download_label = QLabel("Download Location:")
+    download_layout.addWidget(download_label)
+    
+    download_input = QLineEdit(os.path.expanduser("~/Downloads"))
+    download_layout.addWidget(download_input)
+    
+    download_btn = QPushButton("Browse...")
+    download_layout.addWidget(download_btn)
+    
+    download_group.setLayout(download_layout)
+    general_layout.addWidget(download_group)
+    
+    # Startup behavior
+    startup_group = QWidget()
+    startup_layout = QVBoxLayout()
+    startup_layout.setContentsMargins(0, 10, 0, 0)
+    
+    startup_label = QLabel("On Startup:")
+    startup_layout.addWidget(startup_label)
+    
+    startup_option1 = QRadioButton("Open the homepage")
+    startup_option1.setChecked(not window.settings['session']['restore_on_startup'])
+    startup_layout.addWidget(startup_option1)
+    
+    startup_option2 = QRadioButton("Open the new tab page")
+    startup_layout.addWidget(startup_option2)
+    
+    startup_option3 = QRadioButton("Continue where I left off")
+    startup_option3.setChecked(window.settings['session']['restore_on_startup'])
+    startup_layout.addWidget(startup_option3)
+    
+    startup_group.setLayout(startup_layout)
+    general_layout.addWidget(startup_group)
+    
+    general_layout.addStretch()
+    general_tab.setLayout(general_layout)
+    
+    # Privacy settings tab
+    privacy_tab = QWidget()
+    privacy_layout = QVBoxLayout()
+    
+    # Cookies settings
+    cookies_group = QWidget()
+    cookies_layout = QVBoxLayout()
+    cookies_layout.setContentsMargins(0, 0, 0, 0)
+    
+    cookies_label = QLabel("Cookies:")
+    cookies_layout.addWidget(cookies_label)
+    
+    cookies_option1 = QRadioButton("Allow all cookies")
+    cookies_option1.setChecked(True)
+    cookies_layout.addWidget(cookies_option1)
+    
+    cookies_option2 = QRadioButton("Block third-party cookies")
+    cookies_layout.addWidget(cookies_option2)
+    
+    cookies_option3 = QRadioButton("Block all cookies")
+    cookies_layout.addWidget(cookies_option3)
+    
+    cookies_group.setLayout(cookies_layout)
+    privacy_layout.addWidget(cookies_group)
+    
+    # History settings
+    history_group = QWidget()
+    history_layout = QVBoxLayout()
+    history_layout.setContentsMargins(0, 10, 0, 0)
+    
+    history_label = QLabel("Browsing History:")
+    history_layout.addWidget(history_label)
+    
+    history_option1 = QRadioButton("Keep history")
+    history_option1.setChecked(True)
+    history_layout.addWidget(history_option1)
+    
+    history_option2 = QRadioButton("Clear history when browser closes")
+    history_layout.addWidget(history_option2)
+    
+    clear_history_btn = QPushButton("Clear Browsing History...")
+    clear_history_btn.clicked.connect(window.clear_history)
+    history_layout.addWidget(clear_history_btn)
+    
+    history_group.setLayout(history_layout)
+    privacy_layout.addWidget(history_group)
+    
+    # Do Not Track
+    dnt_checkbox = QCheckBox("Send 'Do Not Track' request with browsing traffic")
+    privacy_layout.addWidget(dnt_checkbox)
+    
+    privacy_layout.addStretch()
+    privacy_tab.setLayout(privacy_layout)
+    
+    # Appearance settings tab
+    appearance_tab = QWidget()
+    appearance_layout = QVBoxLayout()
+    
+    # Theme settings
+    theme_group = QWidget()
+    theme_layout = QVBoxLayout()
+    theme_layout.setContentsMargins(0, 0, 0, 0)
+    
+    theme_label = QLabel("Theme:")
+    theme_layout.addWidget(theme_label)
+    
+    theme_combo = QComboBox()
+    theme_combo.addItems(window.theme_manager.theme_names())
+    theme_combo.setCurrentText("Light")  # Default theme
+    theme_combo.currentTextChanged.connect(window.theme_manager.apply_theme)
+    theme_layout.addWidget(theme_combo)
+    
+    preview_theme_btn = QPushButton("Preview Themes...")
+    preview_theme_btn.clicked.connect(window.show_theme_preview)
+    theme_layout.addWidget(preview_theme_btn)
+    
+    theme_group.setLayout(theme_layout)
+    appearance_layout.addWidget(theme_group)
+    
+    # Font settings
+    font_group = QWidget()
+    font_layout = QHBoxLayout()
+    font_layout.setContentsMargins(0, 10, 0, 0)
+    
+    font_label = QLabel("Default Font Size:")
+    font_layout.addWidget(font_label)
+    
+    font_size_combo = QComboBox()
+    font_size_combo.addItems(["Small (12px)", "Medium (16px)", "Large (20px)", "Very Large (24px)"])
+    font_size_combo.setCurrentIndex(1)  # Medium by default
+    font_layout.addWidget(font_size_combo)
+    
+    font_group.setLayout(font_layout)
+    appearance_layout.addWidget(font_group)
+    
+    appearance_layout.addStretch()
+    appearance_tab.setLayout(appearance_layout)
+    
+    # Advanced settings tab
+    advanced_tab = QWidget()
+    advanced_layout = QVBoxLayout()
+    
+    # JavaScript settings
+    js_group = QWidget()
+    js_layout = QVBoxLayout()
+    js_layout.setContentsMargins(0, 0, 0, 0)
+    
+    js_label = QLabel("JavaScript:")
+    js_layout.addWidget(js_label)
+    
+    js_option1 = QRadioButton("Allow all sites to run JavaScript (recommended)")
+    js_option1.setChecked(True)
+    js_layout.addWidget(js_option1)
+    
+    js_option2 = QRadioButton("Block JavaScript from running on sites")
+    js_layout.addWidget(js_option2)
+    
+    js_group.setLayout(js_layout)
+    advanced_layout.addWidget(js_group)
+    
+    # P2P settings
+    p2p_group = QWidget()
+    p2p_layout = QVBoxLayout()
+    p2p_layout.setContentsMargins(0, 10, 0, 0)
+    
+    p2p_label = QLabel("P2P Chat Settings:")
+    p2p_layout.addWidget(p2p_label)
+    
+    p2p_port_layout = QHBoxLayout()
+    p2p_port_label = QLabel("Default Port:")
+    p2p_port_layout.addWidget(p2p_port_label)
+    
+    p2p_port_input = QLineEdit(str(window.settings['p2p']['port']))
+    p2p_port_input.setToolTip("0 lets the system pick a free port")
+    p2p_port_layout.addWidget(p2p_port_input)
+    
+    p2p_port_widget = QWidget()
+    p2p_port_widget.setLayout(p2p_port_layout)
+    p2p_layout.addWidget(p2p_port_widget)
+    
+    p2p_reuse_port_checkbox = QCheckBox("Share the port with other browser instances (SO_REUSEPORT)")
+    p2p_reuse_port_checkbox.setChecked(window.settings['p2p']['reuse_port'])
+    p2p_reuse_port_checkbox.setEnabled(hasattr(socket, 'SO_REUSEPORT'))
+    p2p_layout.addWidget(p2p_reuse_port_checkbox)
+    
+    p2p_username_layout = QHBoxLayout()
+    p2p_username_label = QLabel("Default Username:")
+    p2p_username_layout.addWidget(p2p_username_label)
+    
+    p2p_username_input = QLineEdit()
+    if hasattr(window, 'p2p_manager'):
+        p2p_username_input.setText(window.p2p_manager.username)
+    else:
+        p2p_username_input.setText(f"User_{uuid.uuid4().hex[:8]}")
+    p2p_username_layout.addWidget(p2p_username_input)
+    
+    p2p_username_widget = QWidget()
+    p2p_username_widget.setLayout(p2p_username_layout)
+    p2p_layout.addWidget(p2p_username_widget)
+    
+    p2p_group.setLayout(p2p_layout)
+    advanced_layout.addWidget(p2p_group)
+    
+    # Memory saver
+    memory_saver_checkbox = QCheckBox("Memory saver: freeze and discard idle background tabs")
+    memory_saver_checkbox.setChecked(window.settings['tabs']['enabled'])
+    advanced_layout.addWidget(memory_saver_checkbox)
+    
+    # Developer tools
+    dev_checkbox = QCheckBox("Enable Developer Tools")
+    dev_checkbox.setChecked(True)
+    advanced_layout.addWidget(dev_checkbox)
+    
+    advanced_layout.addStretch()
+    advanced_tab.setLayout(advanced_layout)
+    
+    # Add all tabs to the settings tab widget
+    settings_tabs.addTab(general_tab, "General")
+    settings_tabs.addTab(privacy_tab, "Privacy")
+    settings_tabs.addTab(appearance_tab, "Appearance")
+    settings_tabs.addTab(advanced_tab, "Advanced")
+    
+    layout.addWidget(settings_tabs)
+    
+    # Add buttons at the bottom
+    button_layout = QHBoxLayout()
+    
+    reset_btn = QPushButton("Reset to Default")
+    button_layout.addWidget(reset_btn)
+    
+    button_layout.addStretch()
+    
+    cancel_btn = QPushButton("Cancel")
+    cancel_btn.clicked.connect(settings_dialog.reject)
+    button_layout.addWidget(cancel_btn)
+    
+    # Persist the settings that are applied, then close
+    def save_and_close():
+        port_text = p2p_port_input.text().strip()
+        if not port_text.isdigit() or int(port_text) > 65535:
+            QMessageBox.warning(settings_dialog, "Invalid Port",
+                              "The P2P port must be a number between 0 and 65535.")
+            return
+        
+        window.settings['p2p']['port'] = int(port_text)
+        window.settings['p2p']['reuse_port'] = p2p_reuse_port_checkbox.isChecked()
+        window.settings['tabs']['enabled'] = memory_saver_checkbox.isChecked()
+        window.settings['session']['restore_on_startup'] = startup_option3.isChecked()
+        try:
+            save_settings(window.settings)
+        except OSError as e:
+            QMessageBox.warning(settings_dialog, "Settings Error", f"Could not save settings: {e}")
+            return
+        
+        # A running listener keeps its port until networking restarts
+        if hasattr(window, 'p2p_manager'):
+            window.p2p_manager.core.config = EndpointConfig.from_dict(window.settings['p2p'])
+            if window.p2p_manager.is_listening:
+                window.status_bar.showMessage(
+                    "P2P port changes apply the next time chat networking starts", 5000)
+        settings_dialog.accept()
+    
+    save_btn = QPushButton("Save")
+    save_btn.clicked.connect(save_and_close)
+    button_layout.addWidget(save_btn)
+    
+    button_container = QWidget()
+    button_container.setLayout(button_layout)
+    layout.addWidget(button_container)
+    
+    settings_dialog.setLayout(layout)
+    settings_dialog.exec()
+
+def show_user_profile(window):
+    """Show user profile dialog"""
+    profile_dialog = QDialog(window)
+    profile_dialog.setWindowTitle("User Profile")
+    profile_dialog.setGeometry(300, 300, 500, 600)
+    
+    layout = QVBoxLayout()
+    
+    # Profile header with avatar
+    header_widget = QWidget()
+    header_layout = QHBoxLayout()
+    
+    # Avatar (placeholder)
+    avatar_label = QLabel()
+    avatar_label.setFixedSize(100, 100)
+    avatar_label.setObjectName("profileAvatar")
+    avatar_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    avatar_label.setText("U")  # Default first letter
+    header_layout.addWidget(avatar_label)
+    
+    # User info
+    user_info = QWidget()
+    user_layout = QVBoxLayout()
+    
+    username_label = QLabel("Username")
+    username_label.setObjectName("profileName")
+    user_layout.addWidget(username_label)
+    
+    email_label = QLabel("user@example.com")
+    email_label.setObjectName("profileEmail")
+    user_layout.addWidget(email_label)
+    
+    edit_profile_btn = QPushButton("Edit Profile")
+    edit_profile_btn.setObjectName("primaryButton")
+    user_layout.addWidget(edit_profile_btn)
+    
+    user_info.setLayout(user_layout)
+    header_layout.addWidget(user_info)
+    
+    header_widget.setLayout(header_layout)
+    layout.addWidget(header_widget)
+    
+    # Separator
+    separator = QFrame()
+    separator.setFrameShape(QFrame.Shape.HLine)
+    separator.setFrameShadow(QFrame.Shadow.Sunken)
+    layout.addWidget(separator)
+    
+    # Profile details form
+    form_widget = QWidget()
+    form_layout = QFormLayout()
+    form_layout.setVerticalSpacing(15)
+    
+    # Personal Information section
+    personal_label = QLabel("Personal Information")
+    personal_label.setObjectName("formSection")
+    form_layout.addRow(personal_label)
+    
+    # Full Name
+    name_input = QLineEdit("User Name")
+    form_layout.addRow("Full Name:", name_input)
+    
+    # Email
+    email_input = QLineEdit("user@example.com")
+    form_layout.addRow("Email:", email_input)
+    
+    # Date of Birth
+    dob_input = QLineEdit("01/01/1990")
+    form_layout.addRow("Date of Birth:", dob_input)
+    
+    # Location
+    location_input = QLineEdit("City, Country")
+    form_layout.addRow("Location:", location_input)
+    
+    # Account Information section
+    account_label = QLabel("Account Information")
+    account_label.setObjectName("formSection")
+    form_layout.addRow(account_label)
+    
+    # Username
+    username_input = QLineEdit("username")
+    form_layout.addRow("Username:", username_input)
+    
+    # Password
+    password_btn = QPushButton("Change Password")
+    form_layout.addRow("Password:", password_btn)
+    
+    # Account created
+    created_label = QLabel("January 1, 2023")
+    form_layout.addRow("Account Created:", created_label)
+    
+    # Preferences section
+    preferences_label = QLabel("Preferences")
+    preferences_label.setObjectName("formSection")
+    form_layout.addRow(preferences_label)
+    
+    # Default theme
+    theme_combo = QComboBox()
+    theme_combo.addItems(window.theme_manager.theme_names())
+    theme_combo.setCurrentText("Light")  # Default theme
+    form_layout.addRow("Default Theme:", theme_combo)
+    
+    # Language
+    language_combo = QComboBox()
+    language_combo.addItems(["English", "Spanish", "French", "German", "Chinese", "Japanese"])
+    form_layout.addRow("Language:", language_combo)
+    
+    # Notifications
+    notifications_check = QCheckBox("Enable browser notifications")
+    notifications_check.setChecked(True)
+    form_layout.addRow("Notifications:", notifications_check)
+    
+    form_widget.setLayout(form_layout)
+    layout.addWidget(form_widget)
+    
+    # Buttons at the bottom
+    button_layout = QHBoxLayout()
+    
+    button_layout.addStretch()
+    
+    cancel_btn = QPushButton("Cancel")
+    cancel_btn.clicked.connect(profile_dialog.reject)
+    button_layout.addWidget(cancel_btn)
+    
+    save_btn = QPushButton("Save Changes")
+    save_btn.setObjectName("primaryButton")
+    save_btn.clicked.connect(profile_dialog.accept)
+    button_layout.addWidget(save_btn)
+    
+    button_container = QWidget()
+    button_container.setLayout(button_layout)
+    layout.addWidget(button_container)
+    
+    profile_dialog.setLayout(layout)
+    profile_dialog.exec()
@@ -0,0 +1,498 @@
+"""Download manager window: the scheduler that runs downloads by priority, and
+the models behind its Active and History tabs.
+
+Nothing here is imported until the staged startup creates the download
+manager.
+"""
+import os
+import sqlite3
+import heapq
+from datetime import datetime
+from PyQt6.QtCore import (QUrl, Qt, QTimer, pyqtSignal, QObject, QAbstractListModel,
+                          QAbstractTableModel, QModelIndex)
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QTabWidget,
+                             QDialog, QLabel, QListView, QInputDialog, QTableView)
+from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtWebEngineCore import QWebEngineDownloadRequest, QWebEnginePage
+from browser.core.download_history import DownloadHistory
+from browser.core.postprocess import PostProcessor, expected_hash_from_url
+from browser.core.downloads import (DownloadJob, PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH,
+                                    aggregate_stats, describe_job, format_size, format_eta,
+                                    load_queue, save_queue)
+
+class DownloadScheduler(QObject):
+    """Runs at most max_concurrent downloads, starting queued ones by priority.
+    
+    Every request is accepted straight away (the engine rejects requests that
+    aren't), and those over the limit are paused until a slot frees up.
+    """
+    job_added = pyqtSignal(object)  # DownloadJob
+    job_changed = pyqtSignal(object)  # DownloadJob
+    progress_sampled = pyqtSignal()
+    # Emitted from a pool thread; queued over to the GUI thread
+    _processed = pyqtSignal(object, object)  # DownloadJob, PostProcessResult
+    
+    # Progress is polled at a fixed rate instead of on every received chunk
+    SAMPLE_INTERVAL_MS = 250
+    SAVE_DELAY_MS = 500
+    
+    def __init__(self, options=None, parent=None):
+        super().__init__(parent)
+        options = options or {}
+        self.max_concurrent = options.get('max_concurrent', 3)
+        self.jobs = {}  # {job id: DownloadJob}
+        self.queue = []  # heap of (-priority, sequence, job id)
+        self.sequence = 0
+        self.pending_restores = {}  # {url: saved record}
+        self.restore_page = None
+        
+        self.sample_timer = QTimer(self)
+        self.sample_timer.setInterval(self.SAMPLE_INTERVAL_MS)
+        self.sample_timer.timeout.connect(self.sample)
+        
+        self.postprocessor = PostProcessor(options.get('postprocess_workers', 2),
+                                           options.get('extract_archives', False),
+                                           options.get('sort_into_folders', False))
+        self._processed.connect(self._processing_done)
+        self.history = DownloadHistory()
+        
+        # Queue state changes come in bursts; write them out together
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.flush)
+    
+    def running_count(self):
+        return sum(1 for job in self.jobs.values() if job.state == DownloadJob.RUNNING)
+    
+    def add(self, download):
+        url = download.url().toString()
+        record = self.pending_restores.pop(url, {})
+        if record.get('directory'):
+            download.setDownloadDirectory(record['directory'])
+        if record.get('filename'):
+            download.setDownloadFileName(record['filename'])
+        download.accept()
+        
+        job = DownloadJob(download.id(), download, url, download.downloadFileName(),
+                          download.downloadDirectory(), record.get('priority', PRIORITY_NORMAL))
+        job.restored = bool(record)
+        job.expected_hash = record.get('expected_hash') or expected_hash_from_url(url)
+        job.history_id = record.get('history_id')
+        try:
+            if job.history_id is None:
+                job.history_id = self.history.record_start(
+                    url, job.directory, job.filename, download.mimeType())
+            else:
+                self.history.update(job.history_id, status=DownloadJob.RUNNING)
+        except sqlite3.Error as e:
+            print(f"Error recording download: {e}")
+        self.jobs[job.id] = job
+        
+        download.isFinishedChanged.connect(lambda: self._finished(job))
+        
+        if record.get('paused'):
+            download.pause()
+            job.state = DownloadJob.PAUSED
+        elif self.running_count() < self.max_concurrent:
+            job.state = DownloadJob.RUNNING
+        else:
+            download.pause()
+            self._enqueue(job)
+        
+        self.job_added.emit(job)
+        self._update_sampling()
+        self.save()
+        return job
+    
+    def _enqueue(self, job):
+        job.state = DownloadJob.QUEUED
+        self.sequence += 1
+        heapq.heappush(self.queue, (-job.priority, self.sequence, job.id))
+    
+    def _start_next(self):
+        """Resume queued jobs by priority while there are free slots"""
+        while self.queue and self.running_count() < self.max_concurrent:
+            neg_priority, _, job_id = heapq.heappop(self.queue)
+            job = self.jobs.get(job_id)
+            # Skip entries made stale by a priority change, pause or cancel
+            if not job or job.state != DownloadJob.QUEUED or -neg_priority != job.priority:
+                continue
+            job.state = DownloadJob.RUNNING
+            job.stats.reset_clock()
+            job.request.resume()
+            self.job_changed.emit(job)
+        self._update_sampling()
+    
+    def _update_sampling(self):
+        """Poll progress only while something is transferring"""
+        if self.running_count():
+            if not self.sample_timer.isActive():
+                self.sample_timer.start()
+        else:
+            self.sample_timer.stop()
+    
+    def sample(self):
+        """Read the byte counters of running jobs once per UI refresh"""
+        for job in self.jobs.values():
+            if job.state == DownloadJob.RUNNING:
+                job.stats.update(job.request.receivedBytes(), job.request.totalBytes())
+        self.progress_sampled.emit()
+    
+    def _finished(self, job):
+        state = job.request.state()
+        if state == QWebEngineDownloadRequest.DownloadState.DownloadCompleted:
+            job.state = DownloadJob.PROCESSING
+            path = os.path.join(job.request.downloadDirectory(), job.request.downloadFileName())
+            self.postprocessor.submit(path, job.expected_hash,
+                                      lambda result: self._processed.emit(job, result))
+        elif state == QWebEngineDownloadRequest.DownloadState.DownloadCancelled:
+            job.state = DownloadJob.CANCELLED
+        else:
+            job.state = DownloadJob.FAILED
+        job.stats.update(job.request.receivedBytes(), job.request.totalBytes())
+        if job.state != DownloadJob.PROCESSING:
+            self._record_finish(job)
+        self.job_changed.emit(job)
+        self._start_next()
+        self._update_sampling()
+        self.save()
+    
+    def _processing_done(self, job, result):
+        job.sha256 = result.sha256
+        job.verified = result.verified
+        job.directory, job.filename = os.path.split(result.path)
+        # Only a file that couldn't even be read counts as failed; a bad archive stays completed
+        job.state = DownloadJob.COMPLETED if result.sha256 else DownloadJob.FAILED
+        self._record_finish(job)
+        self.job_changed.emit(job)
+    
+    def _record_finish(self, job):
+        try:
+            self.history.record_finish(job.history_id, job.state, path=job.directory,
+                                       filename=job.filename, size=job.stats.received,
+                                       sha256=job.sha256)
+        except sqlite3.Error as e:
+            print(f"Error recording download: {e}")
+    
+    def set_expected_hash(self, job, expected_hash):
+        """Check a job against a published checksum, now or once it has finished"""
+        job.expected_hash = expected_hash.strip().lower() or None
+        if job.sha256 and job.expected_hash:
+            job.verified = job.sha256 == job.expected_hash
+        self.job_changed.emit(job)
+        self.save()
+    
+    def shutdown(self):
+        self.flush()
+        self.postprocessor.shutdown()
+        self.history.close()
+    
+    def pause(self, job):
+        if job.state not in (DownloadJob.RUNNING, DownloadJob.QUEUED):
+            return
+        if job.state == DownloadJob.RUNNING:
+            job.request.pause()
+        job.state = DownloadJob.PAUSED
+        self.job_changed.emit(job)
+        self._start_next()
+        self._update_sampling()
+        self.save()
+    
+    def resume(self, job):
+        if job.state != DownloadJob.PAUSED:
+            return
+        # Resuming joins the queue; it starts at once if a slot is free
+        self._enqueue(job)
+        self._start_next()
+        self.job_changed.emit(job)
+        self.save()
+    
+    def cancel(self, job):
+        if job.is_active:
+            job.request.cancel()
+    
+    def set_priority(self, job, priority):
+        job.priority = priority
+        if job.state == DownloadJob.QUEUED:
+            self._enqueue(job)
+        self.job_changed.emit(job)
+        self.save()
+    
+    def save(self):
+        self.save_timer.start()
+    
+    def flush(self):
+        """Persist unfinished downloads so they can be re-requested after a restart"""
+        self.save_timer.stop()
+        records = [job.to_record() for job in self.jobs.values() if job.is_active]
+        try:
+            save_queue(records)
+        except OSError as e:
+            print(f"Error saving download queue: {e}")
+    
+    def restore(self, profile):
+        """Re-request downloads left unfinished by the last session"""
+        records = load_queue()
+        if not records:
+            return
+        self.restore_page = QWebEnginePage(profile, self)
+        for record in records:
+            self.pending_restores[record['url']] = record
+            self.restore_page.download(QUrl(record['url']), record.get('filename', ''))
+
+class DownloadListModel(QAbstractListModel):
+    """Download rows whose text only changes when what it shows changes"""
+    JobIdRole = Qt.ItemDataRole.UserRole
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.job_ids = []
+        self.rows = {}  # {job id: row}
+        self.texts = {}  # {job id: displayed text}
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.job_ids)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        job_id = self.job_ids[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.texts[job_id]
+        if role == self.JobIdRole:
+            return job_id
+        return None
+    
+    def add_job(self, job):
+        row = len(self.job_ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.job_ids.append(job.id)
+        self.rows[job.id] = row
+        self.texts[job.id] = describe_job(job)
+        self.endInsertRows()
+    
+    def refresh(self, jobs):
+        """Recompute row texts and signal only the rows that differ"""
+        for job in jobs:
+            text = describe_job(job)
+            if self.texts.get(job.id) != text:
+                self.texts[job.id] = text
+                index = self.index(self.rows[job.id])
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+class DownloadHistoryModel(QAbstractTableModel):
+    """Download history, fetched from the database a page at a time"""
+    PAGE_SIZE = 200
+    HEADERS = ("File", "Status", "Size", "Date", "From")
+    
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.rows = []
+        self.total = 0
+        self.filter_text = ''
+    
+    def set_filter(self, text):
+        self.beginResetModel()
+        self.filter_text = text
+        self.rows = self.history.search(text, self.PAGE_SIZE)
+        self.total = self.history.count(text)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self.rows) < self.total
+    
+    def fetchMore(self, parent=QModelIndex()):
+        page = self.history.search(self.filter_text, self.PAGE_SIZE, len(self.rows))
+        if not page:
+            self.total = len(self.rows)
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+        self.rows.extend(page)
+        self.endInsertRows()
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return row['filename']
+            if column == 1:
+                return row['status']
+            if column == 2:
+                return format_size(row['size']) if row['size'] else ''
+            if column == 3:
+                return datetime.fromtimestamp(row['started']).strftime("%Y-%m-%d %H:%M")
+            return row['url']
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{os.path.join(row['path'] or '', row['filename'] or '')}\nsha256: {row['sha256'] or '-'}"
+        return None
+    
+    def row_at(self, index):
+        return self.rows[index.row()] if index.isValid() else None
+
+class DownloadManager(QDialog):
+    def __init__(self, parent=None, options=None):
+        super().__init__(parent)
+        self.setWindowTitle("Downloads")
+        self.setGeometry(300, 300, 500, 350)
+        
+        layout = QVBoxLayout()
+        pages = QTabWidget()
+        layout.addWidget(pages)
+        
+        active_page = QWidget()
+        active_layout = QVBoxLayout(active_page)
+        self.model = DownloadListModel(self)
+        self.download_list = QListView()
+        self.download_list.setModel(self.model)
+        self.download_list.setUniformItemSizes(True)
+        active_layout.addWidget(self.download_list)
+        
+        # Controls for the selected download
+        controls = QHBoxLayout()
+        for label, handler in (("Pause", self.pause_selected), ("Resume", self.resume_selected),
+                               ("Cancel", self.cancel_selected),
+                               ("Priority +", lambda: self.shift_priority(1)),
+                               ("Priority -", lambda: self.shift_priority(-1)),
+                               ("Checksum...", self.set_checksum_selected)):
+            button = QPushButton(label)
+            button.clicked.connect(handler)
+            controls.addWidget(button)
+        active_layout.addLayout(controls)
+        
+        self.summary_label = QLabel()
+        active_layout.addWidget(self.summary_label)
+        pages.addTab(active_page, "Active")
+        
+        self.scheduler = DownloadScheduler(options, self)
+        
+        # Searchable history of every download
+        history_page = QWidget()
+        history_layout = QVBoxLayout(history_page)
+        self.history_search = QLineEdit()
+        self.history_search.setPlaceholderText("Search downloads by file name or address...")
+        history_layout.addWidget(self.history_search)
+        self.history_model = DownloadHistoryModel(self.scheduler.history, self)
+        self.history_view = QTableView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.history_view.horizontalHeader().setStretchLastSection(True)
+        self.history_view.verticalHeader().hide()
+        self.history_view.doubleClicked.connect(self.open_history_folder)
+        history_layout.addWidget(self.history_view)
+        pages.addTab(history_page, "History")
+        self.history_page = history_page
+        self.pages = pages
+        pages.currentChanged.connect(self.page_changed)
+        
+        # Query once typing pauses rather than on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(200)
+        self.search_timer.timeout.connect(self.refresh_history)
+        self.history_search.textChanged.connect(self.search_timer.start)
+        
+        self.setLayout(layout)
+        
+        self.scheduler.job_added.connect(self.job_added)
+        self.scheduler.job_changed.connect(self.job_changed)
+        self.scheduler.progress_sampled.connect(self.refresh_progress)
+    
+    def add_download(self, download):
+        return self.scheduler.add(download)
+    
+    def job_added(self, job):
+        self.model.add_job(job)
+        self.update_summary()
+    
+    def job_changed(self, job):
+        self.model.refresh([job])
+        self.update_summary()
+        if not job.is_active and self.pages.currentWidget() is self.history_page:
+            self.refresh_history()
+    
+    def page_changed(self, index):
+        if self.pages.widget(index) is self.history_page:
+            self.refresh_history()
+    
+    def refresh_history(self):
+        try:
+            self.history_model.set_filter(self.history_search.text())
+        except sqlite3.Error as e:
+            print(f"Error searching download history: {e}")
+    
+    def open_history_folder(self, index):
+        row = self.history_model.row_at(index)
+        if row and row['path']:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(row['path']))
+    
+    def refresh_progress(self):
+        if not self.isVisible():
+            return
+        self.model.refresh(job for job in self.scheduler.jobs.values()
+                           if job.state == DownloadJob.RUNNING)
+        self.update_summary()
+    
+    def update_summary(self):
+        speed, eta = aggregate_stats(self.scheduler.jobs.values())
+        text = f"{self.scheduler.running_count()} active - {format_size(speed)}/s - ETA {format_eta(eta)}"
+        if self.summary_label.text() != text:
+            self.summary_label.setText(text)
+    
+    def showEvent(self, event):
+        # Rows were not refreshed while hidden
+        self.model.refresh(self.scheduler.jobs.values())
+        self.update_summary()
+        super().showEvent(event)
+    
+    def selected_job(self):
+        index = self.download_list.currentIndex()
+        if not index.isValid():
+            return None
+        return self.scheduler.jobs.get(self.model.data(index, DownloadListModel.JobIdRole))
+    
+    def pause_selected(self):
+        job = self.selected_job()
+        if job:
+            self.scheduler.pause(job)
+    
+    def resume_selected(self):
+        job = self.selected_job()
+        if job:
+            self.scheduler.resume(job)
+    
+    def cancel_selected(self):
+        job = self.selected_job()
+        if job:
+            self.scheduler.cancel(job)
+    
+    def set_checksum_selected(self):
+        job = self.selected_job()
+        if not job:
+            return
+        expected, ok = QInputDialog.getText(self, "Verify Download",
+                                            f"Expected SHA-256 of {job.filename}:",
+                                            text=job.expected_hash or '')
+        if ok:
+            self.scheduler.set_expected_hash(job, expected)
+    
+    def shift_priority(self, delta):
+        job = self.selected_job()
+        if job:
+            priority = min(max(job.priority + delta, PRIORITY_LOW), PRIORITY_HIGH)
+            self.scheduler.set_priority(job, priority)
@@ -0,0 +1,275 @@
+"""Web tabs: the page view, freezing and discarding idle tabs, and saving and
+restoring the session.
+"""
+import sqlite3
+import time
+import uuid
+from PyQt6.QtCore import QUrl, Qt, QTimer, pyqtSignal, QObject, QByteArray, QDataStream, QIODevice
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtWebEngineCore import QWebEngineDownloadRequest, QWebEnginePage
+from browser.core.storage import data_path
+
+class BrowserTab(QWebEngineView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Use a blank page instead of Google
+        self.setUrl(QUrl('about:blank'))
+        
+        # Enable developer tools
+        self.page().setDevToolsPage(self.page())
+        
+        # Set when a discarded page reloads, so the reload isn't logged as a visit
+        self.skip_next_history = False
+
+class TabLifecycleManager(QObject):
+    """Freezes, then discards, idle background tabs to release renderer memory.
+    
+    Policy keys: enabled, freeze_after and discard_after (seconds idle) and
+    max_live_tabs (background tabs kept un-discarded, oldest go first).
+    Discarded tabs keep their URL, title and history and reload when shown.
+    """
+    CHECK_INTERVAL_MS = 15000
+    
+    def __init__(self, tabs, policy, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs
+        self.policy = policy
+        self.last_active = {}  # {BrowserTab: time.monotonic() when last shown}
+        self.scroll_positions = {}  # {BrowserTab: QPointF saved at discard}
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.enforce_policy)
+        self.timer.start(self.CHECK_INTERVAL_MS)
+    
+    def track(self, tab):
+        self.last_active[tab] = time.monotonic()
+    
+    def untrack(self, tab):
+        self.last_active.pop(tab, None)
+        self.scroll_positions.pop(tab, None)
+    
+    def activate(self, tab):
+        """Bring a tab back to the Active state when it is shown"""
+        if tab not in self.last_active:
+            return
+        self.last_active[tab] = time.monotonic()
+        
+        page = tab.page()
+        state = page.lifecycleState()
+        if state == QWebEnginePage.LifecycleState.Active:
+            return
+        if state == QWebEnginePage.LifecycleState.Discarded:
+            # The page reloads from history; put the scroll position back once it has
+            tab.skip_next_history = True
+            position = self.scroll_positions.pop(tab, None)
+            if position is not None:
+                def restore_scroll(ok):
+                    tab.loadFinished.disconnect(restore_scroll)
+                    if ok:
+                        page.runJavaScript(f"window.scrollTo({position.x()}, {position.y()});")
+                tab.loadFinished.connect(restore_scroll)
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+    
+    def enforce_policy(self):
+        """Freeze or discard background tabs according to the policy"""
+        if not self.policy.get('enabled', True):
+            return
+        
+        now = time.monotonic()
+        current = self.tabs.currentWidget()
+        live = [tab for tab in sorted(self.last_active, key=self.last_active.get)
+                if tab is not current and
+                tab.page().lifecycleState() != QWebEnginePage.LifecycleState.Discarded]
+        excess = len(live) - self.policy.get('max_live_tabs', 10)
+        
+        for tab in live:
+            idle = now - self.last_active[tab]
+            if excess > 0 or idle >= self.policy.get('discard_after', 1800):
+                if self.discard(tab):
+                    excess -= 1
+            elif idle >= self.policy.get('freeze_after', 300):
+                self.freeze(tab)
+    
+    def _can_suspend(self, tab):
+        # Visible or audible pages must keep running
+        return not tab.isVisible() and not tab.page().recentlyAudible()
+    
+    def freeze(self, tab):
+        page = tab.page()
+        if page.lifecycleState() != QWebEnginePage.LifecycleState.Active or not self._can_suspend(tab):
+            return False
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+        return page.lifecycleState() == QWebEnginePage.LifecycleState.Frozen
+    
+    def discard(self, tab):
+        page = tab.page()
+        if not self._can_suspend(tab):
+            return False
+        self.scroll_positions[tab] = page.scrollPosition()
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+        return page.lifecycleState() == QWebEnginePage.LifecycleState.Discarded
+
+def serialize_history(page):
+    """Serialize a page's back/forward history with QDataStream"""
+    data = QByteArray()
+    stream = QDataStream(data, QIODevice.OpenModeFlag.WriteOnly)
+    stream << page.history()
+    return bytes(data)
+
+def restore_history(page, blob):
+    """Load history written by serialize_history into a page"""
+    stream = QDataStream(QByteArray(blob), QIODevice.OpenModeFlag.ReadOnly)
+    try:
+        stream >> page.history()
+    except TypeError:
+        # History streaming unavailable in this PyQt build
+        return False
+    return stream.status() == QDataStream.Status.Ok
+
+class LazyTab(QWidget):
+    """Placeholder for a restored tab; the real page is built when it is first shown"""
+    def __init__(self, entry, parent=None):
+        super().__init__(parent)
+        self.entry = entry
+        self.session_id = entry['id']
+        
+        layout = QVBoxLayout(self)
+        label = QLabel(f"Loading {entry['title'] or entry['url']}...")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(label)
+    
+    def url(self):
+        return QUrl(self.entry['url'])
+    
+    def title(self):
+        return self.entry['title']
+
+class SessionManager(QObject):
+    """Keeps the open tab list in session.db, writing only tabs that changed"""
+    SAVE_DELAY_MS = 1000
+    
+    def __init__(self, tabs, path=None, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs
+        self.conn = sqlite3.connect(path or data_path('session.db'))
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS session_tabs
+            (id TEXT PRIMARY KEY,
+             position INTEGER,
+             kind TEXT,
+             url TEXT,
+             title TEXT,
+             history BLOB,
+             is_current INTEGER DEFAULT 0)
+        ''')
+        self.conn.commit()
+        
+        self.dirty = set()  # Tabs whose row must be rewritten
+        self.removed = set()  # Session ids of closed tabs
+        
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.flush)
+    
+    def saved_tabs(self):
+        """Rows of the last session, in tab order"""
+        cursor = self.conn.execute('''
+            SELECT id, kind, url, title, history, is_current
+            FROM session_tabs
+            ORDER BY position
+        ''')
+        return [dict(zip(('id', 'kind', 'url', 'title', 'history', 'is_current'), row))
+                for row in cursor.fetchall()]
+    
+    def track(self, tab):
+        """Start persisting a tab"""
+        if not getattr(tab, 'session_id', None):
+            tab.session_id = uuid.uuid4().hex
+        if isinstance(tab, BrowserTab):
+            tab.urlChanged.connect(lambda: self.mark_dirty(tab))
+            tab.titleChanged.connect(lambda: self.mark_dirty(tab))
+        self.mark_dirty(tab)
+    
+    def forget(self, tab):
+        session_id = getattr(tab, 'session_id', None)
+        if session_id:
+            self.dirty.discard(tab)
+            self.removed.add(session_id)
+            self.schedule_save()
+    
+    def mark_dirty(self, tab):
+        self.dirty.add(tab)
+        self.schedule_save()
+    
+    def schedule_save(self):
+        """Coalesce bursts of changes into one write"""
+        self.save_timer.start()
+    
+    def _row(self, tab):
+        if isinstance(tab, BrowserTab):
+            try:
+                history = serialize_history(tab.page())
+            except TypeError:
+                history = None
+            return ('page', tab.url().toString(), tab.title(), history)
+        return ('search', 'mysearch://home', 'Search', None)
+    
+    def flush(self):
+        """Write pending changes to disk"""
+        self.save_timer.stop()
+        try:
+            with self.conn:
+                self.conn.executemany('DELETE FROM session_tabs WHERE id = ?',
+                                      [(session_id,) for session_id in self.removed])
+                for tab in self.dirty:
+                    # Placeholders still match their stored row
+                    if isinstance(tab, LazyTab):
+                        continue
+                    kind, url, title, history = self._row(tab)
+                    self.conn.execute('''
+                        INSERT INTO session_tabs (id, kind, url, title, history)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT(id) DO UPDATE SET
+                            kind = excluded.kind, url = excluded.url,
+                            title = excluded.title, history = excluded.history
+                    ''', (tab.session_id, kind, url, title, history))
+                
+                # Order and selection are cheap to rewrite in full
+                current = self.tabs.currentIndex()
+                self.conn.executemany(
+                    'UPDATE session_tabs SET position = ?, is_current = ? WHERE id = ?',
+                    [(index, int(index == current), self.tabs.widget(index).session_id)
+                     for index in range(self.tabs.count())
+                     if getattr(self.tabs.widget(index), 'session_id', None)])
+        except sqlite3.Error as e:
+            print(f"Error saving session: {e}")
+            return
+        self.dirty.clear()
+        self.removed.clear()
+    
+    def clear(self):
+        """Drop the saved session"""
+        with self.conn:
+            self.conn.execute('DELETE FROM session_tabs')
+    
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+class DownloadDispatcher(QObject):
+    """Routes a profile's download requests to the browser exactly once each"""
+    download_requested = pyqtSignal(QWebEngineDownloadRequest)
+    
+    def __init__(self, profile, parent=None):
+        super().__init__(parent)
+        self.seen_ids = set()
+        profile.downloadRequested.connect(self.dispatch)
+    
+    def dispatch(self, download):
+        # Ignore repeats of a request that has already been handled
+        if download.id() in self.seen_ids:
+            return
+        self.seen_ids.add(download.id())
+        self.download_requested.emit(download)
@@ -0,0 +1,657 @@
+"""The browser's main window.
+
+Only what its first frame needs is imported here. Downloads, bookmarks, the
+P2P stack and the larger dialogs are separate modules, imported by the
+staged startup or when first opened.
+"""
+import os
+import sqlite3
+from PyQt6.QtCore import QUrl, QSize, QTimer
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton,
+                             QLineEdit, QProgressBar, QTabWidget, QMenu, QToolBar, QStatusBar,
+                             QDialog, QMessageBox, QListWidget, QSystemTrayIcon, QSizePolicy)
+from PyQt6.QtGui import QIcon, QAction
+from PyQt6.QtWebEngineCore import QWebEngineProfile
+from browser.core.settings import load_settings
+from browser.core.startup import StartupReport, StartupTasks
+from browser.core.storage import data_path
+from browser.themes.manager import ThemeManager
+from browser.ui.tabs import (DownloadDispatcher, BrowserTab, TabLifecycleManager, restore_history,
+                             LazyTab, SessionManager)
+from browser.search.tab import SearchTab
+
+class Browser(QMainWindow):
+    FIRST_PAINT_TIMEOUT_MS = 1000  # Start deferred work anyway if no paint arrives
+    
+    def __init__(self, startup_report=None):
+        super().__init__()
+        self.startup_report = startup_report or StartupReport()
+        self.setWindowTitle('Advanced Python Web Browser')
+        self.setGeometry(100, 100, 1280, 800)
+        
+        # Load persisted settings
+        with self.startup_report.measure('settings'):
+            self.settings = load_settings()
+        
+        # Subsystems the first frame doesn't need are created after it has
+        # painted, most urgent first. Anything that needs one sooner runs its
+        # task on the spot through require().
+        self.download_manager = None
+        self.bookmark_manager = None
+        self.conn = None
+        self.tray_icon = None
+        self.startup = StartupTasks(self.startup_report)
+        self.startup.add('downloads', self.setup_downloads, 0)
+        self.startup.add('history', self.setup_history_db, 1)
+        self.startup.add('bookmarks', self.setup_bookmarks, 2)
+        self.startup.add('themes', self.setup_themes, 3)
+        self.startup.add('tray', self.setup_system_tray, 4)
+        self.startup.add('p2p', self.setup_p2p, 5)
+        self.startup_timer = QTimer(self)
+        self.startup_timer.setSingleShot(True)
+        self.startup_timer.setInterval(0)
+        self.startup_timer.timeout.connect(self.run_startup_task)
+        self.first_paint_done = False
+        self.deferred_started = False
+        
+        # Setup download handling, connected once for every tab
+        self.download_dispatcher = DownloadDispatcher(QWebEngineProfile.defaultProfile(), self)
+        self.download_dispatcher.download_requested.connect(self.handle_download)
+        self.theme_manager = ThemeManager()
+        
+        # Setup UI
+        with self.startup_report.measure('ui'):
+            self.setup_ui()
+        
+        # Apply default theme
+        with self.startup_report.measure('theme'):
+            self.theme_manager.apply_theme('Light')
+        
+        # Show the window
+        with self.startup_report.measure('show'):
+            self.show()
+        QTimer.singleShot(self.FIRST_PAINT_TIMEOUT_MS, self.begin_deferred_startup)
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            self.startup_report.mark('first paint')
+            self.begin_deferred_startup()
+    
+    def begin_deferred_startup(self):
+        """Start the deferred tasks once, on the first paint or after a timeout"""
+        if self.deferred_started:
+            return
+        self.deferred_started = True
+        self.startup_timer.start()
+    
+    def run_startup_task(self):
+        """Run one deferred task per event-loop turn so the window stays responsive"""
+        if self.startup.run_next():
+            self.startup_timer.start()
+        else:
+            self.startup_report.mark('ready')
+            print(self.startup_report.format())
+    
+    def require(self, task_name):
+        """Run a deferred startup task now if it is needed before its turn"""
+        self.startup.run(task_name)
+    
+    def setup_downloads(self):
+        from browser.ui.downloads import DownloadManager
+        self.download_manager = DownloadManager(self, self.settings['downloads'])
+        self.download_manager.scheduler.restore(QWebEngineProfile.defaultProfile())
+    
+    def setup_bookmarks(self):
+        from browser.ui.bookmarks import BookmarkManager
+        self.bookmark_manager = BookmarkManager(self)
+    
+    def setup_themes(self):
+        # Re-apply in case a theme file overrides the built-in theme in use
+        self.theme_manager.load()
+        self.theme_manager.apply_theme(self.theme_manager.current_theme)
+    
+    def setup_p2p(self):
+        from browser.p2p.core import P2PNetworkCore, EndpointConfig
+        from browser.p2p.qt import P2PNetworkManager
+        config = EndpointConfig.from_dict(self.settings['p2p'])
+        self.p2p_manager = P2PNetworkManager(self, core=P2PNetworkCore(config=config))
+    
+    def show_downloads(self):
+        self.require('downloads')
+        self.download_manager.show()
+    
+    def show_bookmarks(self):
+        self.require('bookmarks')
+        self.bookmark_manager.show()
+    
+    # Dialogs live in their own modules and are loaded when first opened
+    def show_theme_preview(self):
+        from browser.themes.preview import show_theme_preview
+        show_theme_preview(self)
+    
+    def show_hosting_options(self):
+        from browser.p2p.chat import show_hosting_options
+        show_hosting_options(self)
+    
+    def show_settings(self):
+        from browser.ui.dialogs import show_settings
+        show_settings(self)
+    
+    def show_user_profile(self):
+        from browser.ui.dialogs import show_user_profile
+        show_user_profile(self)
+    
+    def setup_ui(self):
+        # Create central widget and layout
+        self.central_widget = QWidget()
+        self.setCentralWidget(self.central_widget)
+        layout = QVBoxLayout(self.central_widget)
+        
+        # Create menu bar
+        self.create_menu_bar()
+        
+        # Create toolbar
+        self.create_toolbar()
+        
+        # Create tab widget
+        self.tabs = QTabWidget()
+        self.tabs.setTabsClosable(True)
+        self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.currentChanged.connect(self.tab_changed)
+        layout.addWidget(self.tabs)
+        
+        # Freeze and discard idle background tabs
+        self.tab_lifecycle = TabLifecycleManager(self.tabs, self.settings['tabs'], self)
+        
+        # Persist the open tabs
+        self.session = SessionManager(self.tabs, parent=self)
+        
+        # Restore the last session, or add initial search tab instead of browser tab
+        if not self.settings['session']['restore_on_startup']:
+            self.session.clear()
+            self.add_search_tab()
+        elif not self.restore_session():
+            self.add_search_tab()
+        
+        # Create status bar
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+    
+    def create_menu_bar(self):
+        menubar = self.menuBar()
+        
+        # File menu
+        file_menu = menubar.addMenu('File')
+        
+        new_tab_action = QAction('New Tab', self)
+        new_tab_action.setShortcut('Ctrl+T')
+        new_tab_action.triggered.connect(self.add_new_tab)
+        file_menu.addAction(new_tab_action)
+        
+        new_search_tab_action = QAction('New Search Tab', self)
+        new_search_tab_action.setShortcut('Ctrl+E')
+        new_search_tab_action.triggered.connect(self.add_search_tab)
+        file_menu.addAction(new_search_tab_action)
+        
+        close_tab_action = QAction('Close Tab', self)
+        close_tab_action.setShortcut('Ctrl+W')
+        close_tab_action.triggered.connect(lambda: self.close_tab(self.tabs.currentIndex()))
+        file_menu.addAction(close_tab_action)
+        
+        # Bookmarks menu
+        bookmarks_menu = menubar.addMenu('Bookmarks')
+        
+        add_bookmark_action = QAction('Add Bookmark', self)
+        add_bookmark_action.setShortcut('Ctrl+D')
+        add_bookmark_action.triggered.connect(self.add_current_bookmark)
+        bookmarks_menu.addAction(add_bookmark_action)
+        
+        show_bookmarks_action = QAction('Show Bookmarks', self)
+        show_bookmarks_action.setShortcut('Ctrl+B')
+        show_bookmarks_action.triggered.connect(self.show_bookmarks)
+        bookmarks_menu.addAction(show_bookmarks_action)
+        
+        # History menu
+        history_menu = menubar.addMenu('History')
+        
+        show_history_action = QAction('Show History', self)
+        show_history_action.setShortcut('Ctrl+H')
+        show_history_action.triggered.connect(self.show_history)
+        history_menu.addAction(show_history_action)
+        
+        clear_history_action = QAction('Clear History', self)
+        clear_history_action.triggered.connect(self.clear_history)
+        history_menu.addAction(clear_history_action)
+        
+        # Theme menu with a submenu per first letter. The submenus are added
+        # when the menu first opens and fill in when they first open, so a
+        # large theme library costs nothing until it is browsed.
+        theme_menu = menubar.addMenu('Theme')
+        self.theme_letter_menus = {}
+        theme_menu.aboutToShow.connect(lambda: self.populate_theme_menu(theme_menu))
+        
+        # Add theme preview dialog option
+        self.theme_menu_separator = theme_menu.addSeparator()
+        preview_action = QAction('Theme Preview', self)
+        preview_action.triggered.connect(self.show_theme_preview)
+        theme_menu.addAction(preview_action)
+    
+    def populate_theme_menu(self, theme_menu):
+        if self.theme_letter_menus:
+            return
+        for letter, theme_names in self.theme_manager.theme_letters().items():
+            letter_menu = QMenu(f'{letter}...', theme_menu)
+            letter_menu.aboutToShow.connect(
+                lambda menu=letter_menu, names=theme_names: self.populate_theme_letter_menu(menu, names))
+            # One connection per submenu rather than one lambda per theme
+            letter_menu.triggered.connect(
+                lambda action: self.theme_manager.apply_theme(action.data()))
+            theme_menu.insertMenu(self.theme_menu_separator, letter_menu)
+            self.theme_letter_menus[letter] = letter_menu
+    
+    def populate_theme_letter_menu(self, letter_menu, theme_names):
+        """Create a submenu's theme actions the first time it opens; they are kept after that"""
+        if not letter_menu.isEmpty():
+            return
+        for theme_name in theme_names:
+            theme_action = letter_menu.addAction(theme_name)
+            theme_action.setData(theme_name)
+    
+    def create_toolbar(self):
+        nav_toolbar = QToolBar()
+        self.addToolBar(nav_toolbar)
+        
+        # Navigation buttons
+        back_btn = QPushButton()
+        back_btn.setIcon(QIcon('svg/arrow-left.svg'))
+        back_btn.setToolTip("Back")
+        back_btn.clicked.connect(self.navigate_back)
+        nav_toolbar.addWidget(back_btn)
+        
+        forward_btn = QPushButton()
+        forward_btn.setIcon(QIcon('svg/arrow-right.svg'))
+        forward_btn.setToolTip("Forward")
+        forward_btn.clicked.connect(self.navigate_forward)
+        nav_toolbar.addWidget(forward_btn)
+        
+        reload_btn = QPushButton()
+        reload_btn.setIcon(QIcon('svg/rotate-cw.svg'))
+        reload_btn.setToolTip("Reload")
+        reload_btn.clicked.connect(self.reload_page)
+        nav_toolbar.addWidget(reload_btn)
+        
+        home_btn = QPushButton()
+        home_btn.setIcon(QIcon('svg/home.svg'))
+        home_btn.setToolTip("Home")
+        home_btn.clicked.connect(self.navigate_home)
+        nav_toolbar.addWidget(home_btn)
+        
+        # URL Bar
+        self.url_bar = QLineEdit()
+        self.url_bar.returnPressed.connect(self.navigate_to_url)
+        self.url_bar.setMinimumWidth(1200)  # Make the URL bar bigger
+        self.url_bar.setObjectName("urlBar")
+        nav_toolbar.addWidget(self.url_bar)
+        
+        # Send button for URL bar
+        send_btn = QPushButton()
+        send_btn.setIcon(QIcon('svg/send.svg'))
+        send_btn.setIconSize(QSize(24, 24))
+        send_btn.setFixedSize(40, 40)
+        send_btn.setObjectName("iconButton")
+        send_btn.clicked.connect(self.navigate_to_url)
+        nav_toolbar.addWidget(send_btn)
+        
+        # Discord button next to URL bar
+        discord_btn = QPushButton()
+        discord_btn.setIcon(QIcon('svg/Discord--Streamline-Iconoir.svg'))
+        discord_btn.setIconSize(QSize(24, 24))
+        discord_btn.setFixedSize(40, 40)
+        discord_btn.setObjectName("iconButton")
+        discord_btn.clicked.connect(self.show_hosting_options)
+        nav_toolbar.addWidget(discord_btn)
+        
+        # Add spacer
+        spacer = QWidget()
+        spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        nav_toolbar.addWidget(spacer)
+        
+        # Additional buttons
+        download_btn = QPushButton()
+        download_btn.setIcon(QIcon('svg/download.svg'))
+        download_btn.setToolTip("Downloads")
+        download_btn.clicked.connect(self.show_downloads)
+        nav_toolbar.addWidget(download_btn)
+        
+        bookmark_btn = QPushButton()
+        bookmark_btn.setIcon(QIcon('svg/paperclip.svg'))
+        bookmark_btn.setToolTip("Bookmarks")
+        bookmark_btn.clicked.connect(self.show_bookmarks)
+        nav_toolbar.addWidget(bookmark_btn)
+        
+        settings_btn = QPushButton()
+        settings_btn.setIcon(QIcon('svg/sliders.svg'))
+        settings_btn.setToolTip("Settings")
+        settings_btn.clicked.connect(self.show_settings)
+        nav_toolbar.addWidget(settings_btn)
+        
+        user_btn = QPushButton()
+        user_btn.setIcon(QIcon('svg/user.svg'))
+        user_btn.setToolTip("User Profile")
+        user_btn.clicked.connect(self.show_user_profile)
+        nav_toolbar.addWidget(user_btn)
+        
+        # Progress Bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumHeight(10)
+        self.progress_bar.hide()
+        nav_toolbar.addWidget(self.progress_bar)
+    
+    def setup_system_tray(self):
+        self.tray_icon = QSystemTrayIcon(self)
+        
+        # Try to load SVG icon, use fallback if file doesn't exist
+        icon_path = 'svg/globe.svg'
+        if os.path.exists(icon_path):
+            self.tray_icon.setIcon(QIcon(icon_path))
+        else:
+            # Create a simple fallback icon using a blank QIcon
+            self.tray_icon.setIcon(QIcon())
+        
+        tray_menu = QMenu()
+        show_action = QAction("Show", self)
+        quit_action = QAction("Exit", self)
+        
+        show_action.triggered.connect(self.show)
+        quit_action.triggered.connect(QApplication.quit)
+        
+        tray_menu.addAction(show_action)
+        tray_menu.addAction(quit_action)
+        
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.show()
+    
+    def setup_history_db(self):
+        self.conn = sqlite3.connect(data_path('browser_history.db'))
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS history
+            (id INTEGER PRIMARY KEY AUTOINCREMENT,
+             title TEXT,
+             url TEXT,
+             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP)
+        ''')
+        self.conn.commit()
+    
+    def add_new_tab(self):
+        tab = BrowserTab(self)
+        index = self.tabs.addTab(tab, "New Tab")
+        self.tabs.setCurrentIndex(index)
+        self.setup_browser_tab(tab)
+    
+    def setup_browser_tab(self, tab):
+        tab.titleChanged.connect(
+            lambda title: self.update_tab_title(self.tabs.indexOf(tab), title))
+        tab.urlChanged.connect(self.update_url)
+        tab.loadProgress.connect(self.update_progress)
+        tab.loadFinished.connect(lambda: self.tab_load_finished(tab))
+        self.tab_lifecycle.track(tab)
+        self.session.track(tab)
+    
+    def current_tab(self):
+        return self.tabs.currentWidget()
+    
+    def remove_tab(self, index):
+        """Remove a tab and free its page"""
+        widget = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        if isinstance(widget, BrowserTab):
+            self.tab_lifecycle.untrack(widget)
+        self.session.forget(widget)
+        widget.deleteLater()
+    
+    def restore_session(self):
+        """Re-open the saved tabs as placeholders; returns False if there were none"""
+        entries = self.session.saved_tabs()
+        if not entries:
+            return False
+        
+        current = 0
+        self.tabs.blockSignals(True)
+        for position, entry in enumerate(entries):
+            title = entry['title'] or 'New Tab'
+            self.tabs.addTab(LazyTab(entry, self), title[:15] + '...' if len(title) > 15 else title)
+            if entry['is_current']:
+                current = position
+        self.tabs.blockSignals(False)
+        
+        # Only the selected tab gets a real page now
+        self.tabs.setCurrentIndex(current)
+        self.tab_changed(current)
+        return True
+    
+    def materialize_tab(self, index):
+        """Replace a restored placeholder with the real tab"""
+        placeholder = self.tabs.widget(index)
+        entry = placeholder.entry
+        tab_text = self.tabs.tabText(index)
+        
+        if entry['kind'] == 'search':
+            tab = SearchTab(self)
+        else:
+            tab = BrowserTab(self)
+        tab.session_id = placeholder.session_id
+        
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, tab_text)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        if isinstance(tab, BrowserTab):
+            self.setup_browser_tab(tab)
+            # The restored page is not a new visit
+            tab.skip_next_history = True
+            if not (entry['history'] and restore_history(tab.page(), entry['history'])):
+                tab.setUrl(QUrl(entry['url']))
+        else:
+            self.session.track(tab)
+        return tab
+    
+    def close_tab(self, index):
+        if self.tabs.count() > 1:
+            self.remove_tab(index)
+        else:
+            # If it's the last tab, replace it with a search tab instead of Google
+            if isinstance(self.current_tab(), BrowserTab):
+                self.remove_tab(0)
+                self.add_search_tab()
+            else:
+                # If it's already a search tab, just refresh it
+                self.current_tab().show_all_websites()
+    
+    def update_tab_title(self, index, title):
+        if title:
+            self.tabs.setTabText(index, title[:15] + '...' if len(title) > 15 else title)
+        else:
+            self.tabs.setTabText(index, 'New Tab')
+    
+    def update_url(self, url):
+        self.url_bar.setText(url.toString())
+    
+    def update_progress(self, progress):
+        if progress < 100:
+            self.progress_bar.show()
+            self.progress_bar.setValue(progress)
+        else:
+            self.progress_bar.hide()
+    
+    def navigate_to_url(self):
+        url = self.url_bar.text()
+        
+        # Check if it's a search URL
+        if url.startswith("mysearch://"):
+            # If we're not already on a search tab, switch to one
+            if not isinstance(self.current_tab(), SearchTab):
+                self.add_search_tab()
+            return
+            
+        # For regular URLs
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+            
+        # If we're on a search tab, switch to a browser tab
+        if isinstance(self.current_tab(), SearchTab):
+            self.add_new_tab()
+            
+        # Now navigate to the URL
+        self.current_tab().setUrl(QUrl(url))
+    
+    def navigate_home(self):
+        # Check if current tab is a browser tab
+        if isinstance(self.current_tab(), BrowserTab):
+            # Close the current tab and open a search tab
+            current_index = self.tabs.currentIndex()
+            self.remove_tab(current_index)
+            self.add_search_tab()
+        else:
+            # Already on a search tab, just refresh it
+            self.current_tab().show_all_websites()
+    
+    def add_current_bookmark(self):
+        url = self.current_tab().url().toString()
+        title = self.current_tab().title()
+        self.require('bookmarks')
+        self.bookmark_manager.add_bookmark(title, url)
+        QMessageBox.information(self, "Bookmark Added", 
+                              f"Bookmark added:\n{title}")
+    
+    def handle_download(self, download):
+        # The scheduler accepts the request and queues it if needed
+        self.require('downloads')
+        job = self.download_manager.add_download(download)
+        if not job.restored:
+            self.download_manager.show()
+    
+    def tab_load_finished(self, tab):
+        if tab.skip_next_history:
+            tab.skip_next_history = False
+            return
+        self.add_to_history(tab.title(), tab.url().toString())
+    
+    def add_to_history(self, title, url):
+        self.require('history')
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            INSERT INTO history (title, url)
+            VALUES (?, ?)
+        ''', (title, url))
+        self.conn.commit()
+    
+    def show_history(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Browser History")
+        dialog.setGeometry(300, 300, 600, 400)
+        
+        layout = QVBoxLayout()
+        history_list = QListWidget()
+        
+        self.require('history')
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT title, url, timestamp
+            FROM history
+            ORDER BY timestamp DESC
+            LIMIT 100
+        ''')
+        
+        for title, url, timestamp in cursor.fetchall():
+            history_list.addItem(f"{title} - {url}\n{timestamp}")
+        
+        layout.addWidget(history_list)
+        dialog.setLayout(layout)
+        
+        # Double click to open URL from history
+        history_list.itemDoubleClicked.connect(
+            lambda item: self.current_tab().setUrl(
+                QUrl(item.text().split(' - ')[1].split('\n')[0])))
+        
+        dialog.exec()
+    
+    def clear_history(self):
+        reply = QMessageBox.question(
+            self, "Clear History",
+            "Are you sure you want to clear all browsing history?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            self.require('history')
+            cursor = self.conn.cursor()
+            cursor.execute('DELETE FROM history')
+            self.conn.commit()
+            QMessageBox.information(self, "History Cleared", 
+                                  "Your browsing history has been cleared.")
+    
+    def closeEvent(self, event):
+        self.session.close()
+        # Subsystems whose startup task never ran have nothing to close
+        if self.download_manager is not None:
+            self.download_manager.scheduler.shutdown()
+        if self.bookmark_manager is not None:
+            self.bookmark_manager.store.close()
+        self.theme_manager.save_cache()
+        if self.conn is not None:
+            self.conn.close()
+        event.accept()
+
+    def add_search_tab(self):
+        tab = SearchTab(self)
+        index = self.tabs.addTab(tab, "Search")
+        self.tabs.setCurrentIndex(index)
+        self.session.track(tab)
+    
+    def navigate_to_url_external(self, url):
+        # First check if we need to create a new tab
+        if not isinstance(self.current_tab(), BrowserTab):
+            self.add_new_tab()
+        
+        # Then navigate to the URL
+        self.current_tab().setUrl(QUrl(url))
+    
+    def navigate_back(self):
+        """Navigate back in the current tab's history"""
+        if isinstance(self.current_tab(), BrowserTab):
+            self.current_tab().back()
+    
+    def navigate_forward(self):
+        """Navigate forward in the current tab's history"""
+        if isinstance(self.current_tab(), BrowserTab):
+            self.current_tab().forward()
+    
+    def reload_page(self):
+        """Reload the current tab"""
+        if isinstance(self.current_tab(), BrowserTab):
+            self.current_tab().reload()
+        elif isinstance(self.current_tab(), SearchTab):
+            self.current_tab().show_all_websites()
+
+    def tab_changed(self, index):
+        """Handle tab change events"""
+        current = self.tabs.widget(index)
+        
+        # Restored tabs only get a real page once they are shown
+        if isinstance(current, LazyTab):
+            current = self.materialize_tab(index)
+        
+        # Update URL bar based on tab type
+        if isinstance(current, BrowserTab):
+            self.tab_lifecycle.activate(current)
+            self.url_bar.setText(current.url().toString())
+        elif isinstance(current, SearchTab):
+            self.url_bar.setText("mysearch://home")
+        
+        # Remember which tab is selected
+        self.session.schedule_save()
@@ -0,0 +1,5 @@
+"""Launcher kept so `python lobby_relay.py` still starts the lobby relay"""
+from browser.p2p.relay import main
+
+if __name__ == '__main__':
+    raise SystemExit(main())